@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+anytime.py
+Résultats "anytime" du GA: chaque nouveau meilleur plan est livré dès qu'il est trouvé.
+- solve_iter(inst, **ga_kwargs): générateur qui produit un Improvement (individu, génération,
+  temps écoulé) à chaque amélioration; le GA tourne dans un thread
+- arrêter l'itération (break, close()) arrête proprement le GA à la fin de la génération en cours:
+  inutile de consommer tout time_limit_sec quand la qualité suffit
+- la valeur de retour du GA (best ou (best, metrics)) est la valeur de StopIteration
+
+Sans thread: genetic_algorithm(on_improve=callback), le callback renvoyant True pour arrêter.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterator
+import queue
+import threading
+
+from cvrp_data import CVRPInstance
+from ga import Individual, genetic_algorithm
+
+
+@dataclass
+class Improvement:
+    individual: Individual   # copie du nouveau meilleur (indépendante de la population)
+    gen: int                 # génération de l'amélioration (0 = population initiale)
+    elapsed_sec: float       # secondes depuis le début du run
+
+
+_DONE = object()
+
+
+def solve_iter(inst: CVRPInstance, **ga_kwargs: Any) -> Iterator[Improvement]:
+    """
+    Lance genetic_algorithm(inst, **ga_kwargs) dans un thread et produit ses améliorations.
+    Un stop_check fourni dans ga_kwargs reste respecté (combiné avec l'arrêt du générateur).
+    """
+    if "on_improve" in ga_kwargs:
+        raise ValueError("solve_iter fournit lui-même on_improve")
+    events: "queue.Queue[Any]" = queue.Queue()
+    stop = threading.Event()
+    user_stop = ga_kwargs.pop("stop_check", None)
+    outcome: dict = {}
+
+    def stop_check() -> bool:
+        return stop.is_set() or (user_stop is not None and bool(user_stop()))
+
+    def on_improve(ind: Individual, gen: int, elapsed: float) -> bool:
+        events.put(Improvement(ind, gen, elapsed))
+        return stop.is_set()
+
+    def run() -> None:
+        try:
+            outcome["result"] = genetic_algorithm(inst, stop_check=stop_check, on_improve=on_improve, **ga_kwargs)
+        except BaseException as e:  # relancée côté consommateur
+            outcome["error"] = e
+        finally:
+            events.put(_DONE)
+
+    worker = threading.Thread(target=run, name="ga-anytime", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = events.get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+aos.py
+Sélection adaptative d'opérateurs (bandit) pour le GA:
+- chaque opérateur (crossover ou mutation) est un bras; la récompense d'une utilisation est
+  l'amélioration de l'enfant par rapport au meilleur parent, rapportée au temps CPU consommé
+  (opérateur + évaluation de l'enfant): on favorise ce qui rapporte le plus par seconde de calcul
+- "ucb": UCB1 sur le taux normalisé (gain cumulé / temps CPU cumulé, avec oubli exponentiel)
+- "pm": probability matching (moyenne exponentielle du taux, probabilité plancher p_min)
+
+Utilisé par ga.genetic_algorithm(adaptive_operators="ucb" | "pm").
+"""
+
+from __future__ import annotations
+from typing import Dict, Sequence
+import math
+import random
+
+AOS_METHODS = ("ucb", "pm")
+
+
+class OperatorSelector:
+    """
+    Bandit multi-bras sur une liste de noms d'opérateurs.
+    - select(rng) -> nom choisi
+    - update(nom, gain, cpu_sec) après évaluation de l'enfant
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        method: str = "ucb",
+        ucb_c: float = 0.5,
+        decay: float = 0.995,
+        pm_alpha: float = 0.1,
+        p_min: float = 0.05,
+    ):
+        if method not in AOS_METHODS:
+            raise ValueError(f"Méthode AOS inconnue: '{method}'. Autorisées: {', '.join(AOS_METHODS)}")
+        self.names = list(names)
+        self.method = method
+        self.ucb_c = ucb_c
+        self.decay = decay
+        self.pm_alpha = pm_alpha
+        self.p_min = min(p_min, 1.0 / max(1, len(self.names)))
+        k = len(self.names)
+        self.uses = {n: 0 for n in self.names}
+        self.successes = {n: 0 for n in self.names}
+        self.gain_total = {n: 0.0 for n in self.names}
+        self.cpu_total = {n: 0.0 for n in self.names}
+        # statistiques avec oubli (UCB) / qualité estimée (PM)
+        self._gain = {n: 0.0 for n in self.names}
+        self._cpu = {n: 0.0 for n in self.names}
+        self._n = {n: 0.0 for n in self.names}
+        self._q = {n: 0.0 for n in self.names}
+        self._probs = {n: 1.0 / k for n in self.names}
+
+    def _rate(self, name: str) -> float:
+        cpu = self._cpu[name]
+        return self._gain[name] / cpu if cpu > 0.0 else 0.0
+
+    def probabilities(self) -> Dict[str, float]:
+        if self.method == "pm":
+            total = sum(self._q.values())
+            k = len(self.names)
+            if total <= 0.0:
+                self._probs = {n: 1.0 / k for n in self.names}
+            else:
+                self._probs = {n: self.p_min + (1.0 - k * self.p_min) * self._q[n] / total for n in self.names}
+        return dict(self._probs)
+
+    def select(self, rng: random.Random) -> str:
+        if self.method == "ucb":
+            for n in self.names:
+                if self._n[n] <= 0.0:
+                    return n
+            rates = {n: self._rate(n) for n in self.names}
+            best_rate = max(rates.values())
+            scale = best_rate if best_rate > 0.0 else 1.0
+            total_n = sum(self._n.values())
+            return max(
+                self.names,
+                key=lambda n: rates[n] / scale + self.ucb_c * math.sqrt(2.0 * math.log(total_n) / self._n[n]),
+            )
+        probs = self.probabilities()
+        u = rng.random()
+        acc = 0.0
+        for n in self.names:
+            acc += probs[n]
+            if u < acc:
+                return n
+        return self.names[-1]
+
+    def update(self, name: str, gain: float, cpu_sec: float) -> None:
+        gain = max(0.0, float(gain))
+        cpu_sec = max(1e-9, float(cpu_sec))
+        self.uses[name] += 1
+        if gain > 0.0:
+            self.successes[name] += 1
+        self.gain_total[name] += gain
+        self.cpu_total[name] += cpu_sec
+        if self.method == "ucb":
+            for n in self.names:
+                self._gain[n] *= self.decay
+                self._cpu[n] *= self.decay
+                self._n[n] *= self.decay
+            self._gain[name] += gain
+            self._cpu[name] += cpu_sec
+            self._n[name] += 1.0
+        else:
+            self._q[name] += self.pm_alpha * (gain / cpu_sec - self._q[name])
+
+    def getstate(self) -> Dict[str, object]:
+        """État complet (sérialisable JSON) pour les checkpoints."""
+        return {k: (dict(v) if isinstance(v, dict) else v) for k, v in vars(self).items()}
+
+    def setstate(self, state: Dict[str, object]) -> None:
+        for k, v in state.items():
+            setattr(self, k, dict(v) if isinstance(v, dict) else v)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Statistiques par opérateur (pour les métriques du GA)."""
+        probs = self.probabilities() if self.method == "pm" else None
+        out: Dict[str, Dict[str, float]] = {}
+        for n in self.names:
+            cpu = self.cpu_total[n]
+            out[n] = {
+                "uses": self.uses[n],
+                "successes": self.successes[n],
+                "gain": self.gain_total[n],
+                "cpu_sec": cpu,
+                "gain_per_cpu_sec": self.gain_total[n] / cpu if cpu > 0.0 else 0.0,
+            }
+            if probs is not None:
+                out[n]["prob"] = probs[n]
+        return out
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+async_solver.py
+Front-end asyncio du GA, pour l'intégrer dans un service asynchrone:
+- le GA tourne dans un executor (thread par défaut): la boucle d'événements n'est jamais bloquée
+- annulation coopérative par CancelToken (Event thread-safe), vérifiée à chaque génération
+  via stop_check (pas de fichier sentinelle); annuler la tâche asyncio qui attend annule aussi le run
+- progression awaitable: chaque nouveau meilleur arrive dans une asyncio.Queue
+  (async for imp in handle.progress()), le dernier est disponible dans handle.best
+
+    handle = start_solve(inst, time_limit_sec=60, verbose=False)
+    async for imp in handle.progress():
+        if imp.individual.cost <= objectif:
+            handle.cancel()
+    best = await handle
+
+Le GA étant majoritairement du Python pur, plusieurs runs dans des threads se partagent le GIL:
+pour du parallélisme CPU, utiliser workers=... ou le modèle en îles dans chaque run.
+"""
+
+from __future__ import annotations
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable
+import asyncio
+import functools
+import threading
+
+from anytime import Improvement
+from cvrp_data import CVRPInstance
+from ga import Individual, genetic_algorithm
+
+
+class CancelToken:
+    """Jeton d'annulation partageable entre la boucle asyncio et le thread du GA."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+_DONE = object()
+
+
+class SolveHandle:
+    """
+    Run du GA en cours. Awaitable (résultat de genetic_algorithm), annulable,
+    avec la suite des améliorations via progress().
+    """
+
+    def __init__(
+        self,
+        inst: CVRPInstance,
+        token: CancelToken | None = None,
+        executor: Executor | None = None,
+        **ga_kwargs: Any,
+    ):
+        if "on_improve" in ga_kwargs:
+            raise ValueError("start_solve fournit lui-même on_improve")
+        self.token = token if token is not None else CancelToken()
+        self.best: Improvement | None = None
+        self._loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        user_stop: Callable[[], bool] | None = ga_kwargs.pop("stop_check", None)
+
+        def stop_check() -> bool:
+            return self.token.cancelled or (user_stop is not None and bool(user_stop()))
+
+        def on_improve(ind: Individual, gen: int, elapsed: float) -> bool:
+            self._loop.call_soon_threadsafe(self._push, Improvement(ind, gen, elapsed))
+            return self.token.cancelled
+
+        run = functools.partial(genetic_algorithm, inst, stop_check=stop_check, on_improve=on_improve, **ga_kwargs)
+        self._future = self._loop.run_in_executor(executor, run)
+        self._future.add_done_callback(lambda _: self._queue.put_nowait(_DONE))
+
+    def _push(self, imp: Improvement) -> None:
+        self.best = imp
+        self._queue.put_nowait(imp)
+
+    def cancel(self) -> None:
+        """Demande l'arrêt: le GA s'arrête à la fin de la génération en cours et renvoie son meilleur."""
+        self.token.cancel()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    async def progress(self) -> AsyncIterator[Improvement]:
+        """Améliorations dans l'ordre, jusqu'à la fin du run (un seul consommateur)."""
+        while True:
+            item = await self._queue.get()
+            if item is _DONE:
+                self._queue.put_nowait(_DONE)  # un second appel se termine immédiatement
+                return
+            yield item
+
+    async def result(self):
+        """Résultat de genetic_algorithm; annuler la tâche qui attend annule aussi le run."""
+        try:
+            return await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            self.token.cancel()
+            raise
+
+    def __await__(self):
+        return self.result().__await__()
+
+
+def start_solve(
+    inst: CVRPInstance,
+    token: CancelToken | None = None,
+    executor: Executor | None = None,
+    **ga_kwargs: Any,
+) -> SolveHandle:
+    """Lance le GA en arrière-plan (à appeler depuis la boucle asyncio) et retourne son SolveHandle."""
+    return SolveHandle(inst, token=token, executor=executor, **ga_kwargs)
+
+
+async def solve_async(
+    inst: CVRPInstance,
+    token: CancelToken | None = None,
+    executor: Executor | None = None,
+    on_progress: Callable[[Improvement], Any] | None = None,
+    **ga_kwargs: Any,
+):
+    """
+    Raccourci: lance le GA, appelle on_progress (fonction ou coroutine) à chaque amélioration
+    et retourne le résultat de genetic_algorithm.
+    """
+    handle = start_solve(inst, token=token, executor=executor, **ga_kwargs)
+    if on_progress is not None:
+        async for imp in handle.progress():
+            ret = on_progress(imp)
+            if asyncio.iscoroutine(ret):
+                await ret
+    return await handle
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+checkpoint.py
+Points de reprise binaires pour les longs runs du GA:
+- écriture atomique: fichier temporaire + fsync + os.replace (jamais de checkpoint à moitié écrit)
+- format compact (struct + array, little-endian):
+  en-tête (magic, version, génération, compteurs de stagnation, temps écoulé, état adaptatif),
+  état du rng Python, population (coût, perm, routes), meilleur individu, clients hors limite
+  de temps, table anti-doublons, puis un bloc JSON pour les petits états annexes (VND, AOS)
+
+Utilisé par ga.genetic_algorithm(checkpoint_path=..., checkpoint_interval=..., resume_from=...).
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, List, Tuple
+import json
+import math
+import os
+import struct
+
+from ga import Individual
+
+_MAGIC = b"CVRPGAck"
+_VERSION = 1
+# gen, last_improve_gen, dimension, nb individus, index du best dans pop (-1 sinon),
+# temps écoulé, pm_eff_last, two_opt_prob_eff_last (NaN = None)
+_HEAD = struct.Struct("<8sIIiIIiddd")
+
+
+def _pack_ints(values, code: str = "i") -> bytes:
+    a = array(code, values)
+    return struct.pack("<I", len(a)) + a.tobytes()
+
+
+def _unpack_ints(buf: bytes, off: int, code: str = "i") -> Tuple[List[int], int]:
+    (n,) = struct.unpack_from("<I", buf, off)
+    off += 4
+    a = array(code)
+    size = a.itemsize * n
+    a.frombytes(buf[off:off + size])
+    return a.tolist(), off + size
+
+
+def _pack_individual(ind: Individual) -> bytes:
+    return b"".join((
+        struct.pack("<q", int(ind.cost)),
+        _pack_ints(ind.perm),
+        _pack_ints([len(r) for r in ind.iter_routes()]),
+        _pack_ints([c for r in ind.iter_routes() for c in r]),
+    ))
+
+
+def _unpack_individual(buf: bytes, off: int) -> Tuple[Individual, int]:
+    (cost,) = struct.unpack_from("<q", buf, off)
+    off += 8
+    perm, off = _unpack_ints(buf, off)
+    lens, off = _unpack_ints(buf, off)
+    flat, off = _unpack_ints(buf, off)
+    routes = []
+    k = 0
+    for ln in lens:
+        routes.append(flat[k:k + ln])
+        k += ln
+    return Individual(perm, routes, cost), off
+
+
+def _pack_blob(data: bytes) -> bytes:
+    return struct.pack("<I", len(data)) + data
+
+
+def _unpack_blob(buf: bytes, off: int) -> Tuple[bytes, int]:
+    (n,) = struct.unpack_from("<I", buf, off)
+    off += 4
+    return buf[off:off + n], off + n
+
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """
+    Écrit state de façon atomique. Clés attendues:
+    gen, last_improve_gen, dimension, pop, best, elapsed_sec, pm_eff_last, two_opt_prob_eff_last,
+    rng_state (random.Random.getstate()), time_violations, seen_state, extra (dict JSON).
+    """
+    pop: List[Individual] = state["pop"]
+    best: Individual = state["best"]
+    best_in_pop = next((i for i, ind in enumerate(pop) if ind is best), -1)
+    nan = float("nan")
+    pm_last = state.get("pm_eff_last")
+    opt_last = state.get("two_opt_prob_eff_last")
+    parts = [_HEAD.pack(
+        _MAGIC, _VERSION, int(state["gen"]), int(state["last_improve_gen"]),
+        int(state["dimension"]), len(pop), best_in_pop, float(state["elapsed_sec"]),
+        nan if pm_last is None else float(pm_last),
+        nan if opt_last is None else float(opt_last),
+    )]
+
+    version, internal, gauss = state["rng_state"]
+    parts.append(struct.pack("<I", version))
+    parts.append(_pack_ints(internal, "I"))
+    parts.append(struct.pack("<?d", gauss is not None, 0.0 if gauss is None else gauss))
+
+    for ind in pop:
+        parts.append(_pack_individual(ind))
+    if best_in_pop < 0:
+        parts.append(_pack_individual(best))
+    parts.append(_pack_ints(sorted(state.get("time_violations", ()))))
+
+    seen = state.get("seen_state")
+    parts.append(struct.pack("<?", seen is not None))
+    if seen is not None:
+        gen, max_age, probes, keys, gens = seen
+        parts.append(struct.pack("<qqq", gen, max_age, probes))
+        parts.append(_pack_blob(keys))
+        parts.append(_pack_blob(gens))
+    parts.append(_pack_blob(json.dumps(state.get("extra", {})).encode("utf-8")))
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(parts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Relit un checkpoint écrit par save_checkpoint (mêmes clés)."""
+    with open(path, "rb") as f:
+        buf = f.read()
+    magic, version, gen, last_improve, dim, n_pop, best_in_pop, elapsed, pm_last, opt_last = \
+        _HEAD.unpack_from(buf, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"{path}: pas un checkpoint GA")
+    if version != _VERSION:
+        raise ValueError(f"{path}: version de checkpoint non supportée ({version})")
+    off = _HEAD.size
+
+    (rng_version,) = struct.unpack_from("<I", buf, off)
+    off += 4
+    internal, off = _unpack_ints(buf, off, "I")
+    has_gauss, gauss = struct.unpack_from("<?d", buf, off)
+    off += struct.calcsize("<?d")
+
+    pop: List[Individual] = []
+    for _ in range(n_pop):
+        ind, off = _unpack_individual(buf, off)
+        pop.append(ind)
+    if best_in_pop >= 0:
+        best = pop[best_in_pop]
+    else:
+        best, off = _unpack_individual(buf, off)
+    viols, off = _unpack_ints(buf, off)
+
+    (has_seen,) = struct.unpack_from("<?", buf, off)
+    off += 1
+    seen = None
+    if has_seen:
+        s_gen, s_age, s_probes = struct.unpack_from("<qqq", buf, off)
+        off += 24
+        keys, off = _unpack_blob(buf, off)
+        gens, off = _unpack_blob(buf, off)
+        seen = (s_gen, s_age, s_probes, keys, gens)
+    extra_raw, off = _unpack_blob(buf, off)
+
+    return {
+        "gen": gen,
+        "last_improve_gen": last_improve,
+        "dimension": dim,
+        "pop": pop,
+        "best": best,
+        "elapsed_sec": elapsed,
+        "pm_eff_last": None if math.isnan(pm_last) else pm_last,
+        "two_opt_prob_eff_last": None if math.isnan(opt_last) else opt_last,
+        "rng_state": (rng_version, tuple(internal), gauss if has_gauss else None),
+        "time_violations": viols,
+        "seen_state": seen,
+        "extra": json.loads(extra_raw.decode("utf-8")),
+    }
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+constructive.py
+Heuristiques constructives rapides pour la population initiale du GA (giant tours):
+- Clarke-Wright (savings, version parallèle): s(i,j) = d(0,i) + d(0,j) - lambda * d(i,j),
+  calculé en bloc (numpy) sur les k plus proches voisins de chaque client, tri par argsort,
+  fusions d'extrémités de routes sous contrainte de capacité
+- sweep: clients triés par angle polaire autour du dépôt (le split fait ensuite le découpage optimal)
+- variantes randomisées: lambda tiré dans [0.6, 1.4] + bruit multiplicatif sur les savings,
+  angle de départ/sens/bruit angulaire tirés pour le sweep
+- courbes remplissant l'espace (Hilbert ou Morton/Z-order): clients triés par leur indice sur la
+  courbe (coordonnées quantifiées sur une grille 2^16 x 2^16), O(n log n), pour les très grosses
+  instances; variantes: rotation, réflexion, petite perturbation des coordonnées, point de départ
+Les routes Clarke-Wright sont concaténées par angle de leur barycentre (blocs voisins adjacents).
+numpy est optionnel: fallback Python (plus lent au-delà de quelques centaines de clients).
+
+Utilisé par ga.make_initial_population(init_mode="savings_plus_random" | "sweep_plus_random" |
+"savings_randomized" | "sweep_randomized" | "hilbert_randomized" | "morton_randomized").
+"""
+
+from __future__ import annotations
+from typing import List, Tuple
+import math
+import random
+
+from cvrp_data import CVRPInstance
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except Exception:
+    _NUMPY_AVAILABLE = False
+
+SAVINGS_NEIGHBORS = 50   # paires candidates: k plus proches voisins de chaque client
+_LAMBDA_RANGE = (0.6, 1.4)
+_SAVINGS_NOISE = 0.1     # bruit multiplicatif +-10% (variante randomisée)
+_SWEEP_JITTER = 0.05     # bruit angulaire en radians (variante randomisée)
+SFC_CURVES = ("hilbert", "morton")
+_SFC_ORDER = 16          # grille 2^16 x 2^16
+_SFC_JITTER = 0.005      # perturbation des coordonnées, en fraction de l'étendue (variante randomisée)
+
+
+def _dist_np(inst: CVRPInstance):
+    if not hasattr(inst, "_dist_np"):
+        inst._dist_np = np.asarray(inst.dist, dtype=np.int64)  # type: ignore[attr-defined]
+    return inst._dist_np  # type: ignore[attr-defined]
+
+
+def _savings_pairs(inst: CVRPInstance, rng: random.Random, randomized: bool) -> List[Tuple[int, int]]:
+    """Paires (i, j) candidates triées par savings décroissant (savings > 0 uniquement)."""
+    depot = inst.depot_index
+    n = inst.dimension
+    if n - 1 < 2:
+        return []
+    k = max(1, min(SAVINGS_NEIGHBORS, n - 2))
+    if _NUMPY_AVAILABLE:
+        D = _dist_np(inst)
+        cust = np.array([c for c in range(n) if c != depot], dtype=np.int64)
+        sub = D[np.ix_(cust, cust)].astype(np.float64)
+        np.fill_diagonal(sub, np.inf)
+        if k < len(cust) - 1:
+            nb = np.argpartition(sub, k - 1, axis=1)[:, :k]
+        else:
+            nb = np.argsort(sub, axis=1)[:, :k]
+        ii = np.repeat(np.arange(len(cust)), nb.shape[1])
+        jj = nb.ravel()
+        keep = ii < jj
+        # une paire n'apparaît qu'une fois même si elle n'est voisine que dans un sens
+        lo = np.where(keep, ii, jj)
+        hi = np.where(keep, jj, ii)
+        code = np.unique(lo * len(cust) + hi)
+        a = cust[code // len(cust)]
+        b = cust[code % len(cust)]
+        lam = 1.0
+        if randomized:
+            gen = np.random.default_rng(rng.getrandbits(32))
+            lam = gen.uniform(*_LAMBDA_RANGE)
+        s = D[depot, a] + D[depot, b] - lam * D[a, b]
+        if randomized:
+            s = s * gen.uniform(1.0 - _SAVINGS_NOISE, 1.0 + _SAVINGS_NOISE, size=s.shape[0])
+        pos = s > 0
+        a, b, s = a[pos], b[pos], s[pos]
+        order = np.argsort(-s, kind="stable")
+        return list(zip(a[order].tolist(), b[order].tolist()))
+
+    d = inst.dist
+    lam = rng.uniform(*_LAMBDA_RANGE) if randomized else 1.0
+    cust = [c for c in range(n) if c != depot]
+    pairs = set()
+    for i in cust:
+        for j in sorted((c for c in cust if c != i), key=lambda c: d[i][c])[:k]:
+            pairs.add((min(i, j), max(i, j)))
+    scored = []
+    for i, j in sorted(pairs):
+        s = d[depot][i] + d[depot][j] - lam * d[i][j]
+        if randomized:
+            s *= rng.uniform(1.0 - _SAVINGS_NOISE, 1.0 + _SAVINGS_NOISE)
+        if s > 0:
+            scored.append((-s, i, j))
+    scored.sort()
+    return [(i, j) for _, i, j in scored]
+
+
+def _order_routes_by_angle(routes: List[List[int]], inst: CVRPInstance, offset: float = 0.0) -> List[int]:
+    """Concatène les routes triées par angle polaire de leur barycentre (à partir de offset)."""
+    dx, dy = inst.coords[inst.depot_index]
+
+    def angle(r: List[int]) -> float:
+        cx = sum(inst.coords[c][0] for c in r) / len(r)
+        cy = sum(inst.coords[c][1] for c in r) / len(r)
+        return (math.atan2(cy - dy, cx - dx) - offset) % (2.0 * math.pi)
+
+    return [c for r in sorted(routes, key=angle) for c in r]
+
+
+def savings_perm(inst: CVRPInstance, rng: random.Random, randomized: bool = False) -> List[int]:
+    """Giant tour issu de Clarke-Wright parallèle (randomisé si randomized)."""
+    depot = inst.depot_index
+    n = inst.dimension
+    cap = inst.capacity
+    dem = inst.demands
+    routes: dict = {c: [c] for c in range(n) if c != depot}
+    route_of = list(range(n))
+    load = {c: dem[c] for c in routes}
+
+    for i, j in _savings_pairs(inst, rng, randomized):
+        ri = route_of[i]
+        rj = route_of[j]
+        if ri == rj or load[ri] + load[rj] > cap:
+            continue
+        a = routes[ri]
+        b = routes[rj]
+        if a[0] != i and a[-1] != i:
+            continue
+        if b[0] != j and b[-1] != j:
+            continue
+        # orientation: ... i] + [j ...
+        if a[-1] != i:
+            a.reverse()
+        if b[0] != j:
+            b.reverse()
+        # on absorbe la plus petite route dans la plus grande
+        if len(a) >= len(b):
+            a.extend(b)
+            keep, drop = ri, rj
+        else:
+            b[:0] = a
+            keep, drop = rj, ri
+        for c in routes[drop]:
+            route_of[c] = keep
+        load[keep] += load.pop(drop)
+        del routes[drop]
+
+    offset = rng.uniform(0.0, 2.0 * math.pi) if randomized else 0.0
+    return _order_routes_by_angle(list(routes.values()), inst, offset)
+
+
+def sweep_perm(inst: CVRPInstance, rng: random.Random, randomized: bool = False) -> List[int]:
+    """Clients triés par angle polaire autour du dépôt (départ/sens/bruit tirés si randomized)."""
+    depot = inst.depot_index
+    dx, dy = inst.coords[depot]
+    offset = rng.uniform(0.0, 2.0 * math.pi) if randomized else 0.0
+    direction = -1.0 if randomized and rng.random() < 0.5 else 1.0
+    two_pi = 2.0 * math.pi
+    if _NUMPY_AVAILABLE:
+        xy = np.asarray(inst.coords, dtype=np.float64)
+        cust = np.array([c for c in range(inst.dimension) if c != depot], dtype=np.int64)
+        ang = direction * np.arctan2(xy[cust, 1] - dy, xy[cust, 0] - dx)
+        if randomized:
+            gen = np.random.default_rng(rng.getrandbits(32))
+            ang = ang + gen.uniform(-_SWEEP_JITTER, _SWEEP_JITTER, size=ang.shape[0])
+        ang = np.mod(ang - offset, two_pi)
+        # rayon en critère secondaire: clients alignés du plus proche au plus loin
+        rad = np.hypot(xy[cust, 0] - dx, xy[cust, 1] - dy)
+        return cust[np.lexsort((rad, ang))].tolist()
+
+    keys = []
+    for c in range(inst.dimension):
+        if c == depot:
+            continue
+        x, y = inst.coords[c]
+        a = direction * math.atan2(y - dy, x - dx)
+        if randomized:
+            a += rng.uniform(-_SWEEP_JITTER, _SWEEP_JITTER)
+        keys.append(((a - offset) % two_pi, math.hypot(x - dx, y - dy), c))
+    keys.sort()
+    return [c for _, _, c in keys]
+
+
+def _hilbert_index(x, y, order: int = _SFC_ORDER):
+    """Indice de Hilbert de (x, y) entiers dans [0, 2^order) (scalaires ou tableaux numpy int64)."""
+    n = 1 << order
+    d = x * 0
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d = d + s * s * ((3 * rx) ^ ry)
+        # rotation du quadrant
+        if _NUMPY_AVAILABLE and isinstance(x, np.ndarray):
+            flip = ~ry & rx
+            x = np.where(flip, n - 1 - x, x)
+            y = np.where(flip, n - 1 - y, y)
+            x, y = np.where(ry, x, y), np.where(ry, y, x)
+        elif not ry:
+            if rx:
+                x, y = n - 1 - x, n - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def _morton_index(x, y, order: int = _SFC_ORDER):
+    """Indice de Morton (bits de x et y entrelacés) de (x, y) entiers dans [0, 2^order)."""
+    d = x * 0
+    for b in range(order):
+        d = d | (((x >> b) & 1) << (2 * b)) | (((y >> b) & 1) << (2 * b + 1))
+    return d
+
+
+def sfc_perm(inst: CVRPInstance, rng: random.Random, curve: str = "hilbert", randomized: bool = False) -> List[int]:
+    """
+    Clients triés le long d'une courbe de Hilbert ou de Morton.
+    randomized: rotation aléatoire des coordonnées, réflexion, perturbation et point de départ tirés.
+    """
+    if curve not in SFC_CURVES:
+        raise ValueError(f"Courbe inconnue: '{curve}'. Autorisées: {', '.join(SFC_CURVES)}")
+    index = _hilbert_index if curve == "hilbert" else _morton_index
+    depot = inst.depot_index
+    cells = (1 << _SFC_ORDER) - 1
+    theta = rng.uniform(0.0, 2.0 * math.pi) if randomized else 0.0
+    mirror = randomized and rng.random() < 0.5
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+
+    if _NUMPY_AVAILABLE:
+        xy = np.asarray(inst.coords, dtype=np.float64)
+        cust = np.array([c for c in range(inst.dimension) if c != depot], dtype=np.int64)
+        if len(cust) == 0:
+            return []
+        px = xy[cust, 0]
+        py = xy[cust, 1]
+        if randomized:
+            px, py = cos_t * px - sin_t * py, sin_t * px + cos_t * py
+            if mirror:
+                px = -px
+            gen = np.random.default_rng(rng.getrandbits(32))
+            ext = max(np.ptp(px), np.ptp(py), 1e-9)
+            px = px + gen.uniform(-_SFC_JITTER, _SFC_JITTER, size=px.shape[0]) * ext
+            py = py + gen.uniform(-_SFC_JITTER, _SFC_JITTER, size=py.shape[0]) * ext
+        # même échelle sur les deux axes: la courbe respecte les distances
+        ext = max(np.ptp(px), np.ptp(py), 1e-9)
+        qx = ((px - px.min()) / ext * cells).astype(np.int64)
+        qy = ((py - py.min()) / ext * cells).astype(np.int64)
+        order = cust[np.argsort(index(qx, qy), kind="stable")]
+        if randomized:
+            order = np.roll(order, -rng.randrange(len(order)))
+        return order.tolist()
+
+    cust = [c for c in range(inst.dimension) if c != depot]
+    if not cust:
+        return []
+    pts = []
+    for c in cust:
+        x, y = inst.coords[c]
+        if randomized:
+            x, y = cos_t * x - sin_t * y, sin_t * x + cos_t * y
+            if mirror:
+                x = -x
+        pts.append([x, y])
+    if randomized:
+        ext = max(max(p[0] for p in pts) - min(p[0] for p in pts), max(p[1] for p in pts) - min(p[1] for p in pts), 1e-9)
+        for p in pts:
+            p[0] += rng.uniform(-_SFC_JITTER, _SFC_JITTER) * ext
+            p[1] += rng.uniform(-_SFC_JITTER, _SFC_JITTER) * ext
+    min_x = min(p[0] for p in pts)
+    min_y = min(p[1] for p in pts)
+    ext = max(max(p[0] for p in pts) - min_x, max(p[1] for p in pts) - min_y, 1e-9)
+    keys = [
+        index(int((p[0] - min_x) / ext * cells), int((p[1] - min_y) / ext * cells))
+        for p in pts
+    ]
+    order = [c for _, c in sorted(zip(keys, cust))]
+    if randomized:
+        k = rng.randrange(len(order))
+        order = order[k:] + order[:k]
+    return order
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+convergence.py
+Trace de convergence du GA (courbe "anytime" meilleur coût / temps):
+- une ligne (elapsed_sec, gen, best, avg, pm_eff, two_opt_prob_eff) à chaque amélioration du meilleur
+  et à chaque point de log (log_interval), même sans verbose
+- colonnes dans des array préalloués (capacité doublée si besoin), pas de dict par ligne
+- export CSV ou JSONL (une ligne JSON par point), relecture de ces deux formats
+- indicateurs pour comparer des configurations: aire sous la courbe (AUC, en coût ou en gap %)
+  et temps pour atteindre une cible (time-to-target)
+
+Utilisé par ga.genetic_algorithm(record_trace=True | trace_path="run.csv") et test.py.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterator, List, Tuple
+import csv
+import json
+import math
+
+COLUMNS = ("elapsed_sec", "gen", "best", "avg", "pm_eff", "two_opt_prob_eff")
+_CODES = ("d", "q", "q", "d", "d", "d")
+
+
+class ConvergenceTrace:
+    """Série temporelle compacte; les valeurs inconnues (pm_eff avant la 1re génération) valent NaN."""
+
+    __slots__ = ("_cols", "_n")
+
+    def __init__(self, capacity: int = 1024):
+        cap = max(16, int(capacity))
+        self._cols = tuple(array(code, [0]) * cap for code in _CODES)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def record(
+        self,
+        elapsed_sec: float,
+        gen: int,
+        best: int,
+        avg: float,
+        pm_eff: float | None,
+        two_opt_prob_eff: float | None,
+    ) -> None:
+        n = self._n
+        if n == len(self._cols[0]):
+            for col in self._cols:
+                col.extend(col)  # doublement de capacité (le contenu recopié est écrasé ensuite)
+        nan = math.nan
+        row = (
+            float(elapsed_sec), int(gen), int(best), float(avg),
+            nan if pm_eff is None else float(pm_eff),
+            nan if two_opt_prob_eff is None else float(two_opt_prob_eff),
+        )
+        for col, v in zip(self._cols, row):
+            col[n] = v
+        self._n = n + 1
+
+    def column(self, name: str) -> List[float]:
+        return self._cols[COLUMNS.index(name)][:self._n].tolist()
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        cols = self._cols
+        for i in range(self._n):
+            yield tuple(col[i] for col in cols)
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(COLUMNS)
+            for row in self.rows():
+                w.writerow(["" if isinstance(v, float) and math.isnan(v) else v for v in row])
+
+    def to_jsonl(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for row in self.rows():
+                rec = {k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in zip(COLUMNS, row)}
+                f.write(json.dumps(rec) + "\n")
+
+    def save(self, path: str) -> None:
+        """JSONL si l'extension est .jsonl/.json, CSV sinon."""
+        if path.lower().endswith((".jsonl", ".json")):
+            self.to_jsonl(path)
+        else:
+            self.to_csv(path)
+
+    @classmethod
+    def load(cls, path: str) -> "ConvergenceTrace":
+        tr = cls()
+        if path.lower().endswith((".jsonl", ".json")):
+            with open(path, "r", encoding="utf-8") as f:
+                recs: List[Dict[str, Any]] = [json.loads(line) for line in f if line.strip()]
+        else:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                recs = [{k: (v if v != "" else None) for k, v in r.items()} for r in csv.DictReader(f)]
+        for r in recs:
+            tr.record(
+                float(r["elapsed_sec"]), int(r["gen"]), int(r["best"]), float(r["avg"]),
+                None if r["pm_eff"] is None else float(r["pm_eff"]),
+                None if r["two_opt_prob_eff"] is None else float(r["two_opt_prob_eff"]),
+            )
+        return tr
+
+    def _value(self, best: int, target: float | None) -> float:
+        return 100.0 * (best - target) / target if target else float(best)
+
+    def auc(self, t_end: float | None = None, target: float | None = None) -> float:
+        """
+        Aire sous la courbe en escalier du meilleur coût (ou du gap % si target) entre le premier
+        point et t_end (défaut: dernier point). Divisée par la durée, c'est la valeur moyenne
+        sur le run (plus petit = converge plus vite et plus bas).
+        """
+        n = self._n
+        if n == 0:
+            return math.nan
+        t = self._cols[0]
+        b = self._cols[2]
+        end = t[n - 1] if t_end is None else float(t_end)
+        area = 0.0
+        for i in range(n):
+            if t[i] >= end:
+                break
+            nxt = t[i + 1] if i + 1 < n else end
+            area += self._value(b[i], target) * (min(nxt, end) - t[i])
+        return area
+
+    def time_to_target(self, target: float) -> float | None:
+        """Premier temps écoulé où le meilleur coût est <= target (None si jamais atteint)."""
+        t = self._cols[0]
+        b = self._cols[2]
+        for i in range(self._n):
+            if b[i] <= target:
+                return t[i]
+        return None
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+distributed.py
+Îles GA réparties sur plusieurs machines via un petit protocole TCP (coordinateur / workers):
+- les workers se connectent au coordinateur (HELLO) et reçoivent leur numéro d'île, l'instance
+  en binaire (struct, big-endian) et les paramètres du GA (SETUP)
+- chaque worker lance genetic_algorithm; ses migrants (MIGRANTS) passent par le coordinateur
+  qui les relaie aux îles voisines selon la topologie (mêmes topologies que islands.py)
+- à l'échéance globale (ou fichier sentinelle / Ctrl+C côté coordinateur) le coordinateur envoie STOP;
+  chaque worker renvoie son meilleur individu (RESULT)
+- un worker perdu (connexion fermée, machine arrêtée, trame interrompue au-delà de io_timeout_sec)
+  est simplement retiré: le run continue
+- protocole sans authentification: le coordinateur écoute sur 127.0.0.1 par défaut; écouter sur
+  toutes les interfaces (0.0.0.0) demande allow_all_interfaces=True (réseau de confiance uniquement)
+
+Trame: en-tête "!BI" (type de message, taille du contenu) puis le contenu.
+
+Coordinateur: run_coordinator(inst, ...) -> meilleur Individual (utilisé par main(solver="distributed"))
+Worker: python distributed.py --host 192.168.1.10 --port 5555
+Test local: lancer le coordinateur puis plusieurs workers sur 127.0.0.1.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple
+import argparse
+import json
+import os
+import queue
+import random
+import selectors
+import socket
+import struct
+import threading
+import time
+
+from cvrp_data import CVRPInstance
+from ga import Individual, genetic_algorithm
+from islands import TOPOLOGIES, make_migration_hook, migration_targets
+
+# Types de messages
+MSG_HELLO = 1
+MSG_SETUP = 2
+MSG_MIGRANTS = 3
+MSG_RESULT = 4
+MSG_STOP = 5
+
+_HEADER = struct.Struct("!BI")
+DEFAULT_PORT = 5555
+_ALL_INTERFACES = ("", "0.0.0.0", "::")
+
+
+# ======== Encodage binaire ========
+
+def _pack_ints(values: List[int], fmt: str = "i") -> bytes:
+    return struct.pack(f"!I{len(values)}{fmt}", len(values), *values)
+
+
+def _unpack_ints(buf: bytes, off: int, fmt: str = "i") -> Tuple[List[int], int]:
+    (n,) = struct.unpack_from("!I", buf, off)
+    off += 4
+    values = list(struct.unpack_from(f"!{n}{fmt}", buf, off))
+    return values, off + n * struct.calcsize(fmt)
+
+
+def encode_instance(inst: CVRPInstance) -> bytes:
+    """Instance -> octets: nom, dimension, capacité, dépôt, coordonnées, demandes, matrice de distances."""
+    name = inst.name.encode("utf-8")
+    n = inst.dimension
+    parts = [
+        struct.pack("!H", len(name)), name,
+        struct.pack("!Iqi", n, inst.capacity, inst.depot_index),
+        struct.pack(f"!{2 * n}d", *[v for xy in inst.coords for v in xy]),
+        struct.pack(f"!{n}q", *inst.demands),
+        struct.pack(f"!{n * n}i", *[d for row in inst.dist for d in row]),
+    ]
+    return b"".join(parts)
+
+
+def decode_instance(buf: bytes) -> CVRPInstance:
+    (ln,) = struct.unpack_from("!H", buf, 0)
+    off = 2
+    name = buf[off:off + ln].decode("utf-8")
+    off += ln
+    n, capacity, depot = struct.unpack_from("!Iqi", buf, off)
+    off += struct.calcsize("!Iqi")
+    flat_xy = struct.unpack_from(f"!{2 * n}d", buf, off)
+    off += 16 * n
+    demands = list(struct.unpack_from(f"!{n}q", buf, off))
+    off += 8 * n
+    flat = struct.unpack_from(f"!{n * n}i", buf, off)
+    coords = [(flat_xy[2 * i], flat_xy[2 * i + 1]) for i in range(n)]
+    dist = [list(flat[i * n:(i + 1) * n]) for i in range(n)]
+    return CVRPInstance(name, n, capacity, depot, coords, demands, dist)
+
+
+def encode_individuals(items: List[tuple]) -> bytes:
+    """[(perm, routes, cost)] -> octets."""
+    parts = [struct.pack("!I", len(items))]
+    for perm, routes, cost in items:
+        parts.append(struct.pack("!q", int(cost)))
+        parts.append(_pack_ints(list(perm)))
+        parts.append(_pack_ints([len(r) for r in routes]))
+        parts.append(_pack_ints([c for r in routes for c in r]))
+    return b"".join(parts)
+
+
+def decode_individuals(buf: bytes, off: int = 0) -> Tuple[List[tuple], int]:
+    (count,) = struct.unpack_from("!I", buf, off)
+    off += 4
+    items = []
+    for _ in range(count):
+        (cost,) = struct.unpack_from("!q", buf, off)
+        off += 8
+        perm, off = _unpack_ints(buf, off)
+        lens, off = _unpack_ints(buf, off)
+        flat, off = _unpack_ints(buf, off)
+        routes = []
+        k = 0
+        for ln in lens:
+            routes.append(flat[k:k + ln])
+            k += ln
+        items.append((perm, routes, cost))
+    return items, off
+
+
+def _pack_json(obj: Dict[str, Any]) -> bytes:
+    raw = json.dumps(obj).encode("utf-8")
+    return struct.pack("!I", len(raw)) + raw
+
+
+def _unpack_json(buf: bytes, off: int) -> Tuple[Dict[str, Any], int]:
+    (ln,) = struct.unpack_from("!I", buf, off)
+    off += 4
+    return json.loads(buf[off:off + ln].decode("utf-8")), off + ln
+
+
+# ======== Trames ========
+
+def send_msg(sock: socket.socket, kind: int, payload: bytes = b"") -> None:
+    sock.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n > 0:
+        chunk = sock.recv(min(n, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connexion fermée")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_msg(sock: socket.socket) -> Tuple[int, bytes]:
+    kind, ln = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return kind, _recv_exact(sock, ln)
+
+
+# ======== Worker ========
+
+def run_worker(host: str = "127.0.0.1", port: int = DEFAULT_PORT, verbose: bool = True) -> None:
+    """
+    Se connecte au coordinateur, reçoit l'instance et les paramètres, lance une île GA
+    et renvoie son meilleur individu. Un thread lit les migrants entrants et le STOP.
+    """
+    sock = socket.create_connection((host, port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    send_msg(sock, MSG_HELLO, socket.gethostname().encode("utf-8"))
+    kind, payload = recv_msg(sock)
+    if kind != MSG_SETUP:
+        raise ConnectionError(f"message inattendu du coordinateur: {kind}")
+    cfg, off = _unpack_json(payload, 0)
+    inst = decode_instance(payload[off:])
+    idx = cfg["island"]
+    if verbose:
+        print(f"[Worker] Île {idx} | instance {inst.name} (N={inst.dimension}) reçue de {host}:{port}", flush=True)
+
+    inbox: "queue.Queue[tuple]" = queue.Queue()
+    stop = threading.Event()
+
+    def reader() -> None:
+        try:
+            while True:
+                k, data = recv_msg(sock)
+                if k == MSG_MIGRANTS:
+                    for item in decode_individuals(data)[0]:
+                        inbox.put(item)
+                elif k == MSG_STOP:
+                    break
+        except OSError:
+            pass  # coordinateur perdu: on s'arrête avec le meilleur courant
+        stop.set()
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    def send(batch: List[tuple]) -> None:
+        try:
+            send_msg(sock, MSG_MIGRANTS, encode_individuals(batch))
+        except OSError:
+            stop.set()
+
+    def receive() -> List[tuple]:
+        out = []
+        while True:
+            try:
+                out.append(inbox.get_nowait())
+            except queue.Empty:
+                return out
+
+    ga_kwargs = dict(cfg["ga_kwargs"])
+    ga_kwargs["verbose"] = verbose
+    ga_kwargs.setdefault("log_interval", 100)
+    best, metrics = genetic_algorithm(
+        inst,
+        seed=cfg["seed"],
+        time_limit_sec=cfg["time_limit_sec"],
+        stop_check=stop.is_set,
+        migration_hook=make_migration_hook(send, receive, cfg["migration_interval"], cfg["migrants"]),
+        return_metrics=True,
+        **ga_kwargs,
+    )
+    metrics = {k: v for k, v in metrics.items() if isinstance(v, (int, float, str, type(None)))}
+    try:
+        send_msg(sock, MSG_RESULT, _pack_json(metrics) + encode_individuals([(best.perm, best.routes, best.cost)]))
+    except OSError:
+        pass
+    sock.close()
+    if verbose:
+        print(f"[Worker] Île {idx} terminée: best={best.cost} ({metrics.get('stopped_by')})", flush=True)
+
+
+# ======== Coordinateur ========
+
+def run_coordinator(
+    inst: CVRPInstance,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    workers: int = 2,
+    register_timeout_sec: float = 30.0,
+    io_timeout_sec: float = 10.0,
+    allow_all_interfaces: bool = False,
+    migration_interval: int = 50,
+    migrants: int = 2,
+    topology: str = "ring",
+    seed: int | None = 1,
+    time_limit_sec: float = 170.0,
+    stop_on_file: str | None = None,
+    result_grace_sec: float = 30.0,
+    verbose: bool = True,
+    return_metrics: bool = False,
+    **ga_kwargs,
+):
+    """
+    Attend jusqu'à `workers` inscriptions (au plus register_timeout_sec, au moins une),
+    distribue l'instance, relaie les migrants puis rassemble les résultats.
+    ga_kwargs: paramètres de genetic_algorithm envoyés aux workers (doivent être sérialisables JSON).
+    host: adresse d'écoute; une adresse joignable par d'autres machines (IP de la carte réseau) est
+    donnée explicitement, toutes les interfaces ("0.0.0.0") exigent allow_all_interfaces=True.
+    io_timeout_sec: délai max d'une lecture/écriture de trame; un worker bloqué au milieu d'une
+    trame (sans fermer sa connexion) est retiré au lieu de bloquer le coordinateur.
+    Retourne le meilleur Individual du cluster (ou (best, metrics) si return_metrics=True).
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Topologie inconnue: '{topology}'. Autorisées: {', '.join(TOPOLOGIES)}")
+    if host in _ALL_INTERFACES and not allow_all_interfaces:
+        raise ValueError(
+            f"Écoute sur toutes les interfaces ('{host}') refusée: protocole sans authentification. "
+            "Donner l'IP de la carte réseau ou allow_all_interfaces=True (réseau de confiance)"
+        )
+    rng = random.Random(seed)
+    start_time = time.time()
+
+    srv = socket.create_server((host, port))
+    srv.settimeout(0.5)
+    if verbose:
+        print(f"[Coord] En écoute sur {host}:{srv.getsockname()[1]} | attente de {workers} worker(s)...", flush=True)
+    conns: List[socket.socket] = []
+    names: List[str] = []
+    try:
+        while len(conns) < workers and (time.time() - start_time < register_timeout_sec or not conns):
+            try:
+                c, addr = srv.accept()
+            except socket.timeout:
+                continue
+            c.settimeout(io_timeout_sec)
+            try:
+                kind, payload = recv_msg(c)
+            except OSError:
+                c.close()
+                continue
+            if kind != MSG_HELLO:
+                c.close()
+                continue
+            c.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conns.append(c)
+            names.append(f"{payload.decode('utf-8', 'replace')}@{addr[0]}")
+            if verbose:
+                print(f"[Coord] Worker {len(conns) - 1} inscrit: {names[-1]}", flush=True)
+    except KeyboardInterrupt:
+        if not conns:
+            srv.close()
+            raise
+    finally:
+        srv.close()
+
+    n = len(conns)
+    # L'échéance globale part de la fin des inscriptions
+    deadline = time.time() + time_limit_sec if time_limit_sec else 0.0
+    inst_blob = encode_instance(inst)
+    alive = set()
+    for i, c in enumerate(conns):
+        cfg = {
+            "island": i,
+            "seed": None if seed is None else seed + i,
+            "time_limit_sec": max(0.1, deadline - time.time()) if deadline else 0.0,
+            "migration_interval": migration_interval,
+            "migrants": migrants,
+            "ga_kwargs": ga_kwargs,
+        }
+        try:
+            send_msg(c, MSG_SETUP, _pack_json(cfg) + inst_blob)
+            alive.add(i)
+        except OSError:
+            c.close()
+    if verbose:
+        print(f"[Coord] {len(alive)} île(s) lancée(s) | topologie={topology} | migration toutes les {migration_interval} gen", flush=True)
+
+    sel = selectors.DefaultSelector()
+    for i in alive:
+        sel.register(conns[i], selectors.EVENT_READ, i)
+
+    results: Dict[int, Tuple[Individual, Dict[str, Any]]] = {}
+    lost: List[int] = []
+    relayed = 0
+    stop_sent = False
+    stop_time = 0.0
+    stopped_by = None
+
+    def drop(i: int) -> None:
+        if i in alive:
+            alive.discard(i)
+            sel.unregister(conns[i])
+            conns[i].close()
+
+    def send_stop() -> None:
+        for j in list(alive):
+            try:
+                send_msg(conns[j], MSG_STOP)
+            except OSError:
+                drop(j)
+                lost.append(j)
+
+    while alive:
+        now = time.time()
+        if not stop_sent and (
+            (deadline and now >= deadline)
+            or (stop_on_file and os.path.exists(stop_on_file))
+        ):
+            stopped_by = stopped_by or ("time" if deadline and now >= deadline else "file")
+            send_stop()
+            stop_sent, stop_time = True, now
+        if stop_sent and now - stop_time > result_grace_sec:
+            for j in list(alive):
+                drop(j)
+                lost.append(j)
+            break
+        try:
+            events = sel.select(timeout=0.5)
+        except KeyboardInterrupt:
+            stopped_by = "keyboard"
+            if not stop_sent:
+                send_stop()
+                stop_sent, stop_time = True, time.time()
+            continue
+        for key, _ in events:
+            i = key.data
+            if i not in alive:
+                continue  # retiré plus tôt dans ce tour (envoi de migrants en échec)
+            try:
+                # select garantit le début de la trame, pas sa fin: un worker bloqué en cours
+                # de trame lève socket.timeout (OSError) après io_timeout_sec et il est retiré
+                kind, payload = recv_msg(conns[i])
+            except (OSError, struct.error):
+                drop(i)
+                lost.append(i)
+                if verbose:
+                    print(f"[Coord] Worker {i} perdu ({names[i]}). Le run continue avec {len(alive)} île(s).", flush=True)
+                continue
+            if kind == MSG_MIGRANTS:
+                live = sorted(alive)
+                if len(live) > 1:
+                    pos = live.index(i)
+                    for t in migration_targets(topology, pos, len(live), rng):
+                        j = live[t]
+                        try:
+                            send_msg(conns[j], MSG_MIGRANTS, payload)
+                            relayed += 1
+                        except OSError:
+                            drop(j)
+                            lost.append(j)
+            elif kind == MSG_RESULT:
+                m, off = _unpack_json(payload, 0)
+                (perm, routes, cost), = decode_individuals(payload, off)[0]
+                results[i] = (Individual(perm, routes, cost), m)
+                drop(i)
+                if verbose:
+                    print(f"[Coord] Résultat île {i}: best={cost} | gen={m.get('generations_done')}", flush=True)
+                if not stop_sent and stopped_by is None and m.get("stopped_by") in ("file", "keyboard"):
+                    stopped_by = m.get("stopped_by")
+                    send_stop()
+                    stop_sent, stop_time = True, time.time()
+    sel.close()
+
+    if not results:
+        raise RuntimeError("Aucun worker n'a retourné de solution.")
+    best_idx = min(results, key=lambda i: results[i][0].cost)
+    best = results[best_idx][0]
+    if verbose:
+        print(
+            f"[Coord] Terminé après {time.time() - start_time:.1f}s. Meilleur coût: {best.cost} (île {best_idx})"
+            f" | workers perdus: {len(set(lost))}",
+            flush=True,
+        )
+
+    if not return_metrics:
+        return best
+
+    ms = [m for _, m in results.values()]
+    metrics: Dict[str, object] = {
+        "elapsed_sec": time.time() - start_time,
+        "generations_done": sum(int(m.get("generations_done") or 0) for m in ms),
+        "stopped_by": stopped_by or ms[0].get("stopped_by"),
+        "best_cost": best.cost,
+        "avg_cost_last": sum(float(m.get("avg_cost_last") or 0.0) for m in ms) / len(ms),
+        "routes_best": len(best.routes),
+        "pm_eff_last": None,
+        "two_opt_prob_eff_last": None,
+        "islands": n,
+        "island_best_costs": {i: results[i][0].cost for i in sorted(results)},
+        "best_island": best_idx,
+        "workers_lost": sorted(set(lost)),
+        "migrant_batches_relayed": relayed,
+    }
+    return best, metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CVRP - worker d'îles GA distribuées")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="adresse du coordinateur")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+    run_worker(args.host, args.port, verbose=not args.quiet)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+diversity.py
+Fitness biaisée façon HGS (Vidal) pour la sélection des survivants du GA:
+- distance "broken pairs" entre deux solutions: proportion de clients dont le successeur
+  (dans sa route, dépôt compris) n'est ni le successeur ni le prédécesseur dans l'autre solution
+- tableaux successeur/prédécesseur calculés une fois par individu (mis en cache sur l'individu)
+- contribution à la diversité = distance moyenne aux n_close plus proches voisins
+- fitness biaisée = rang(coût) + (1 - n_elite / P) * rang(diversité), à minimiser
+- survivants: on retire un à un le pire (clones d'abord) en recalculant la fitness (Numba),
+  ou en une passe (fallback Python)
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Sequence, Tuple
+
+from cvrp_data import CVRPInstance
+
+
+# ======== Option accélérée via Numba (auto si dispo) ========
+_NUMBA_AVAILABLE = False
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _broken_pairs_matrix_numba(S, Pr, depot):
+        """D[a, b] = nb de paires cassées entre les solutions a et b (S/Pr: P x N)."""
+        p, n = S.shape
+        D = np.zeros((p, p), dtype=np.int32)
+        for a in range(p):
+            for b in range(a + 1, p):
+                d = 0
+                for j in range(n):
+                    if j == depot:
+                        continue
+                    sa = S[a, j]
+                    if sa != S[b, j] and sa != Pr[b, j]:
+                        d += 1
+                    if Pr[a, j] == depot and Pr[b, j] != depot and S[b, j] != depot:
+                        d += 1
+                D[a, b] = d
+                D[b, a] = d
+        return D
+
+    @njit(cache=True)
+    def _biased_fitness_numba(D, order, costs, alive, n_elite, n_close):
+        """
+        Fitness biaisée des individus vivants (inf pour les autres) + flag clone.
+        order[i]: indices triés par distance croissante à i (précalculé une fois).
+        """
+        p = costs.shape[0]
+        idx = np.nonzero(alive)[0]
+        m = idx.shape[0]
+        div = np.zeros(m)
+        clone = np.zeros(m, dtype=np.bool_)
+        c = min(n_close, m - 1)
+        for ii in range(m):
+            i = idx[ii]
+            k = 0
+            tot = 0.0
+            for t in range(p):
+                j = order[i, t]
+                if j == i or not alive[j]:
+                    continue
+                if D[i, j] == 0 and (costs[j] < costs[i] or (costs[j] == costs[i] and j < i)):
+                    clone[ii] = True
+                if k < c:
+                    tot += D[i, j]
+                    k += 1
+                elif D[i, j] > 0:
+                    break
+            if k > 0:
+                div[ii] = tot / k
+        fit = np.full(p, np.inf)
+        is_clone = np.zeros(p, dtype=np.bool_)
+        if m == 0:
+            return fit, is_clone
+        order_cost = np.argsort(costs[idx], kind="mergesort")
+        order_div = np.argsort(-div, kind="mergesort")
+        rank_cost = np.empty(m)
+        rank_div = np.empty(m)
+        denom = max(1, m - 1)
+        for r in range(m):
+            rank_cost[order_cost[r]] = r / denom
+            rank_div[order_div[r]] = r / denom
+        w = 1.0 - min(n_elite, m) / m
+        for ii in range(m):
+            fit[idx[ii]] = rank_cost[ii] + w * rank_div[ii]
+            is_clone[idx[ii]] = clone[ii]
+        return fit, is_clone
+
+    @njit(cache=True)
+    def _select_survivors_numba(D, costs, n_keep, n_elite, n_close):
+        """Retire un à un le pire individu (clones d'abord) jusqu'à n_keep survivants."""
+        p = costs.shape[0]
+        order = np.empty((p, p), dtype=np.int64)
+        for i in range(p):
+            order[i, :] = np.argsort(D[i], kind="mergesort")
+        alive = np.ones(p, dtype=np.bool_)
+        n_alive = p
+        while n_alive > n_keep:
+            fit, is_clone = _biased_fitness_numba(D, order, costs, alive, n_elite, n_close)
+            worst = -1
+            for i in range(p):
+                if not alive[i]:
+                    continue
+                if worst < 0 or (is_clone[i] and not is_clone[worst]) or (
+                    is_clone[i] == is_clone[worst] and fit[i] > fit[worst]
+                ):
+                    worst = i
+            alive[worst] = False
+            n_alive -= 1
+        return alive
+
+    _NUMBA_AVAILABLE = True
+except Exception:
+    _NUMBA_AVAILABLE = False
+
+
+def successor_arrays(routes: Iterable[Sequence[int]], inst: CVRPInstance) -> Tuple[List[int], List[int]]:
+    """succ[c] / pred[c] de chaque client (dépôt pour les extrémités de route); le dépôt pointe sur lui-même."""
+    depot = inst.depot_index
+    succ = [depot] * inst.dimension
+    pred = [depot] * inst.dimension
+    for r in routes:
+        prev = depot
+        for c in r:
+            pred[c] = prev
+            if prev != depot:
+                succ[prev] = c
+            prev = c
+    return succ, pred
+
+
+def _cached_arrays(ind, inst: CVRPInstance):
+    """Tableaux (succ, pred) de ind, recalculés seulement si ses routes ont été réassignées."""
+    cache = ind._succ_cache
+    if cache is None or cache[0] is not ind.route_ends:
+        succ, pred = successor_arrays(ind.iter_routes(), inst)
+        if _NUMBA_AVAILABLE:
+            succ = np.asarray(succ, dtype=np.int32)
+            pred = np.asarray(pred, dtype=np.int32)
+        cache = (ind.route_ends, succ, pred)
+        ind._succ_cache = cache
+    return cache[1], cache[2]
+
+
+def broken_pairs_distance(ind_a, ind_b, inst: CVRPInstance) -> float:
+    """Distance broken-pairs normalisée par le nb de clients (0 = mêmes arêtes, ~1 = aucune en commun)."""
+    sa, pa = _cached_arrays(ind_a, inst)
+    sb, pb = _cached_arrays(ind_b, inst)
+    depot = inst.depot_index
+    d = 0
+    for j in range(inst.dimension):
+        if j == depot:
+            continue
+        if sa[j] != sb[j] and sa[j] != pb[j]:
+            d += 1
+        if pa[j] == depot and pb[j] != depot and sb[j] != depot:
+            d += 1
+    return d / max(1, inst.dimension - 1)
+
+
+def _distance_matrix_python(pool, inst: CVRPInstance) -> List[List[int]]:
+    p = len(pool)
+    D = [[0] * p for _ in range(p)]
+    n1 = max(1, inst.dimension - 1)
+    for a in range(p):
+        for b in range(a + 1, p):
+            d = int(round(broken_pairs_distance(pool[a], pool[b], inst) * n1))
+            D[a][b] = d
+            D[b][a] = d
+    return D
+
+
+def _select_survivors_python(D, costs: List[int], n_keep: int, n_elite: int, n_close: int) -> List[bool]:
+    """Fallback: fitness biaisée calculée une fois, retrait des pires (clones d'abord) en une passe."""
+    p = len(costs)
+    div = []
+    clone = []
+    for i in range(p):
+        others = sorted(D[i][j] for j in range(p) if j != i)
+        c = min(n_close, len(others))
+        div.append(sum(others[:c]) / c if c else 0.0)
+        clone.append(any(
+            D[i][j] == 0 and (costs[j] < costs[i] or (costs[j] == costs[i] and j < i))
+            for j in range(p) if j != i
+        ))
+    denom = max(1, p - 1)
+    rank_cost = [0.0] * p
+    rank_div = [0.0] * p
+    for r, i in enumerate(sorted(range(p), key=lambda i: costs[i])):
+        rank_cost[i] = r / denom
+    for r, i in enumerate(sorted(range(p), key=lambda i: -div[i])):
+        rank_div[i] = r / denom
+    w = 1.0 - min(n_elite, p) / p
+    order = sorted(range(p), key=lambda i: (clone[i], rank_cost[i] + w * rank_div[i]), reverse=True)
+    alive = [True] * p
+    for i in order[:max(0, p - n_keep)]:
+        alive[i] = False
+    return alive
+
+
+def select_survivors(pool: list, n_keep: int, inst: CVRPInstance, n_elite: int = 4, n_close: int = 5):
+    """
+    Garde n_keep individus du pool selon la fitness biaisée (coût + contribution à la diversité).
+    Retourne (survivants triés par coût, distance broken-pairs moyenne aux n_close voisins).
+    """
+    if len(pool) <= n_keep:
+        return sorted(pool, key=lambda ind: ind.cost), 0.0
+    arrays = [_cached_arrays(ind, inst) for ind in pool]
+    if _NUMBA_AVAILABLE:
+        S = np.stack([a[0] for a in arrays])
+        Pr = np.stack([a[1] for a in arrays])
+        D = _broken_pairs_matrix_numba(S, Pr, inst.depot_index)
+        costs = np.array([ind.cost for ind in pool], dtype=np.int64)
+        alive = _select_survivors_numba(D, costs, n_keep, n_elite, n_close)
+        D = D.tolist()
+    else:
+        D = _distance_matrix_python(pool, inst)
+        alive = _select_survivors_python(D, [ind.cost for ind in pool], n_keep, n_elite, n_close)
+    keep = [i for i in range(len(pool)) if alive[i]]
+    n1 = max(1, inst.dimension - 1)
+    avg = 0.0
+    for i in keep:
+        near = sorted(D[i][j] for j in keep if j != i)[:max(1, n_close)]
+        avg += sum(near) / max(1, len(near)) / n1
+    return sorted((pool[i] for i in keep), key=lambda ind: ind.cost), avg / max(1, len(keep))
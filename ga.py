@@ -5,7 +5,29 @@ Algorithme génétique pour le CVRP avec contraintes de temps:
 - Représentation: permutation globale des clients (giant tour)
 - Split DP pour obtenir des tournées faisables (capacité + temps)
 - 2-opt intra-route optionnel (probabiliste pour gagner du temps)
-- Sélection par tournoi, crossover OX, mutation swap/inversion
+- Held-Karp exact (mémoïsé) optionnel pour les routes courtes
+- VND configurable optionnel (2opt, oropt, relocate, swap, 2optstar) à la place du 2-opt seul
+- Écriture lamarckienne optionnelle: la permutation reprend l'ordre des routes éduquées
+- 2-opt/Or-opt optionnel sur la giant tour avant split (population initiale et immigrants)
+- Moteur de population "array" optionnel (population.py): tournoi et mutations par lots numpy
+- Évaluation parallèle optionnelle des enfants dans un pool de processus (parallel.py)
+- Points d'accroche pour le modèle en îles (islands.py): arrêt externe et migration
+- Doublons détectés par empreintes 64 bits (hashing.py) dans une table bornée à éviction générationnelle
+- Cache LRU optionnel des évaluations (permutations déjà vues: pas de nouveau split/2-opt)
+- Mode steady-state optionnel: un enfant à la fois, remplacement du pire ou du plus proche
+- Sélection des survivants optionnelle par fitness biaisée HGS (coût + distance broken-pairs)
+- Choix adaptatif des crossovers/mutations optionnel (bandit UCB ou probability matching, aos.py)
+- Checkpoints binaires atomiques périodiques et reprise exacte (checkpoint.py, resume_from)
+- Résultats "anytime": callback on_improve à chaque nouveau meilleur (itérateur dans anytime.py)
+- Démarrage à chaud depuis des solutions existantes (.sol ou listes de routes), clients ajoutés/retirés tolérés
+- Initialisations constructives Clarke-Wright (savings), sweep et courbes de Hilbert/Morton (constructive.py)
+- Chronométrage par phase optionnel (profile_phases, profiling.py), sans coût quand il est désactivé
+- Trace de convergence (temps, génération, best, avg, pm, 2-opt) exportable en CSV/JSONL (convergence.py)
+- Individus compacts (__slots__): routes stockées à plat (array), matérialisées en listes à la demande
+- Sous-population infaisable optionnelle (HGS): split à capacité/durée pénalisées, pénalités adaptatives
+  vers une part cible d'enfants faisables, réparation probabiliste (penalties.py)
+- Sélection par tournoi, crossover OX (O(n), masque d'appartenance), PMX ou RBX (par routes),
+  mutation swap/inversion
 - Limite de temps pour garantir < ~3 minutes par défaut
 
 Améliorations:
@@ -27,23 +49,95 @@ Contraintes de temps (nouveau):
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Tuple, Set, Dict
+from array import array
+from typing import Any, Callable, List, Tuple, Set, Dict, Sequence
+from time import perf_counter
+import bisect
+import math
 import random
 import time
 import os
 
 from cvrp_data import CVRPInstance
 from split import split_giant_tour
-from localsearch import two_opt_route
-from solution import solution_total_cost, calculate_route_duration
+from hashing import EvalCache, GenerationalHashSet, perm_hash, solution_hash
+from diversity import select_survivors
+from aos import AOS_METHODS, OperatorSelector
+from constructive import savings_perm, sfc_perm, sweep_perm
+from profiling import PhaseTimers
+from convergence import ConvergenceTrace
+from penalties import PenaltyManager, evaluate_perm_penalized
+from localsearch import (
+    HELD_KARP_MAX_SIZE,
+    educate_routes,
+    vnd_routes,
+    parse_vnd_operators,
+    giant_tour_local_search,
+)
+from solution import solution_total_cost, calculate_route_duration, read_simple_sol_routes
 
 
-@dataclass
 class Individual:
-    perm: List[int]            # permutation des clients (hors dépôt)
-    routes: List[List[int]]    # routes faisables (à partir de perm via split)
-    cost: int                  # coût total des routes
+    """
+    Individu du GA:
+    - perm: permutation des clients hors dépôt (liste, modifiée par les opérateurs)
+    - cost: coût total des routes
+    - routes: routes faisables (split de perm, éventuellement éduquées). Stockées à plat: array 'i'
+      des clients + array des fins de routes; le tableau des clients n'est pas conservé quand il
+      coïncide avec perm (pas d'éducation, ou lamarckien). La liste de listes n'est construite
+      qu'au premier accès à .routes (sortie, checkpoint, ...) puis gardée.
+    - excess: None si les routes sont faisables, sinon (distance, surcharge, dépassement en heures);
+      cost est alors le coût pénalisé (sous-population infaisable, infeasible_search=True)
+    Modifier perm en place suppose de réassigner routes ensuite (comme le font shake et immigrants).
+    """
+
+    __slots__ = ("perm", "cost", "excess", "_tour", "_ends", "_routes", "_succ_cache")
+
+    def __init__(self, perm: List[int], routes: Sequence[Sequence[int]], cost: int):
+        self.perm = perm
+        self.cost = cost
+        self.excess = None
+        self._succ_cache = None
+        self.routes = routes
+
+    @property
+    def routes(self) -> List[List[int]]:
+        routes = self._routes
+        if routes is None:
+            routes = [list(r) for r in self.iter_routes()]
+            self._routes = routes
+        return routes
+
+    @routes.setter
+    def routes(self, routes: Sequence[Sequence[int]]) -> None:
+        flat: List[int] = []
+        ends = array("i")
+        for r in routes:
+            flat.extend(r)
+            ends.append(len(flat))
+        self._tour = None if flat == self.perm else array("i", flat)
+        self._ends = ends
+        self._routes = None
+
+    @property
+    def route_ends(self) -> array:
+        """Fins de routes dans le tour à plat (nouvel objet à chaque réassignation des routes)."""
+        return self._ends
+
+    def iter_routes(self):
+        """Routes sous forme de tranches du tour à plat, sans construire la liste de listes."""
+        tour = self.perm if self._tour is None else self._tour
+        start = 0
+        for end in self._ends:
+            yield tour[start:end]
+            start = end
+
+    def signature(self) -> int:
+        """Empreinte 64 bits des routes (identique à solution_hash(self.routes))."""
+        return solution_hash(self.iter_routes())
+
+    def __repr__(self) -> str:
+        return f"Individual(cost={self.cost}, n={len(self.perm)}, routes={len(self._ends)})"
 
 
 def nearest_neighbor_perm(inst: CVRPInstance, rng: random.Random) -> List[int]:
@@ -66,33 +160,261 @@ def nearest_neighbor_perm(inst: CVRPInstance, rng: random.Random) -> List[int]:
     return perm
 
 
-def order_crossover(p1: List[int], p2: List[int], rng: random.Random) -> Tuple[List[int], List[int]]:
+def seed_perm_from_routes(routes: Sequence[Sequence[int]], inst: CVRPInstance) -> List[int]:
     """
-    OX (Order Crossover) standard.
-    Prend deux parents permutation et renvoie deux enfants.
+    Giant tour depuis une solution existante (routes concaténées), réparée pour l'instance courante:
+    - indices hors instance, dépôt et doublons ignorés (clients retirés)
+    - clients absents insérés à la position la moins chère (clients ajoutés), dépôt aux extrémités des routes
+    Le split refera le découpage en tournées faisables.
+    """
+    depot = inst.depot_index
+    n = inst.dimension
+    d = inst.dist
+    placed = [False] * n
+    placed[depot] = True
+    seqs: List[List[int]] = []
+    for r in routes:
+        seq = []
+        for c in r:
+            if 0 <= c < n and not placed[c]:
+                placed[c] = True
+                seq.append(c)
+        if seq:
+            seqs.append(seq)
+    for c in range(n):
+        if placed[c]:
+            continue
+        best_delta = d[depot][c] + d[c][depot]
+        best_pos = None
+        for ri, seq in enumerate(seqs):
+            prev = depot
+            for pos in range(len(seq) + 1):
+                nxt = seq[pos] if pos < len(seq) else depot
+                delta = d[prev][c] + d[c][nxt] - d[prev][nxt]
+                if delta < best_delta:
+                    best_delta = delta
+                    best_pos = (ri, pos)
+                prev = nxt
+        if best_pos is None:
+            seqs.append([c])
+        else:
+            seqs[best_pos[0]].insert(best_pos[1], c)
+        placed[c] = True
+    return [c for seq in seqs for c in seq]
+
+
+def _ox_fill(seg_parent, donor, i, j, child, mask):
+    """
+    Noyau OX en O(n): child[i:j] = seg_parent[i:j], puis les gènes du donneur absents du
+    segment (masque d'appartenance indexé par client) remplissent 0..i-1 puis j..n-1.
+    Fonctionne sur listes comme sur tableaux numpy; mask est remis à zéro en sortie.
+    """
+    n = len(seg_parent)
+    for k in range(i, j):
+        child[k] = seg_parent[k]
+        mask[seg_parent[k]] = 1
+    pos = 0
+    for k in range(n):
+        x = donor[k]
+        if mask[x]:
+            continue
+        if pos == i:
+            pos = j
+        child[pos] = x
+        pos += 1
+    for k in range(i, j):
+        mask[seg_parent[k]] = 0
+
+
+def _pmx_fill(seg_parent, donor, i, j, child, seg_pos):
+    """
+    Noyau PMX en O(n): child[i:j] = seg_parent[i:j]; hors segment on prend le gène du donneur,
+    en suivant la correspondance segment -> donneur tant qu'il est déjà dans le segment.
+    seg_pos (indexé par client, -1 par défaut) est remis à -1 en sortie.
+    """
+    n = len(seg_parent)
+    for k in range(i, j):
+        child[k] = seg_parent[k]
+        seg_pos[seg_parent[k]] = k
+    for k in range(n):
+        if i <= k < j:
+            continue
+        x = donor[k]
+        while seg_pos[x] >= 0:
+            x = donor[seg_pos[x]]
+        child[k] = x
+    for k in range(i, j):
+        seg_pos[seg_parent[k]] = -1
+
+
+# ======== Option accélérée via Numba (auto si dispo) ========
+_NUMBA_AVAILABLE = False
+try:
+    import numpy as np
+    from numba import njit
+
+    _ox_fill_jit = njit(cache=True)(_ox_fill)
+    _pmx_fill_jit = njit(cache=True)(_pmx_fill)
+    _NUMBA_AVAILABLE = True
+except Exception:
+    _NUMBA_AVAILABLE = False
+
+
+def _two_point_children(
+    p1: List[int],
+    p2: List[int],
+    rng: random.Random,
+    kernel: str,
+    both: bool = True,
+) -> List[List[int]]:
+    """
+    Tire [i, j) et applique le noyau OX/PMX (compilé si Numba dispo): enfant (p1, p2),
+    plus l'enfant (p2, p1) si both. Même tirage rng dans les deux cas.
     """
     n = len(p1)
     if n < 2:
-        return p1[:], p2[:]
+        return [p1[:], p2[:]] if both else [p1[:]]
     i, j = sorted(rng.sample(range(n), 2))
-    seg1 = p1[i:j]
-    seg2 = p2[i:j]
-
-    def build_child(seg, donor):
-        child = [None] * n
-        child[i:j] = seg
-        fill_vals = [x for x in donor if x not in seg]
-        k = 0
-        for idx in list(range(0, i)) + list(range(j, n)):
-            child[idx] = fill_vals[k]
-            k += 1
-        return child
-
-    c1 = build_child(seg1, p2)
-    c2 = build_child(seg2, p1)
+    size = max(max(p1), max(p2)) + 1
+    pairs = [(p1, p2), (p2, p1)] if both else [(p1, p2)]
+    if _NUMBA_AVAILABLE:
+        if kernel == "ox":
+            fill, buf = _ox_fill_jit, np.zeros(size, dtype=np.int8)
+        else:
+            fill, buf = _pmx_fill_jit, np.full(size, -1, dtype=np.int64)
+        out = []
+        for a, b in pairs:
+            c = np.empty(n, dtype=np.int64)
+            fill(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64), i, j, c, buf)
+            out.append(c.tolist())
+        return out
+
+    if kernel == "ox":
+        fill_py, buf_l = _ox_fill, bytearray(size)
+    else:
+        fill_py, buf_l = _pmx_fill, [-1] * size
+    out_l = []
+    for a, b in pairs:
+        c = [0] * n
+        fill_py(a, b, i, j, c, buf_l)
+        out_l.append(c)
+    return out_l
+
+
+def _two_point_crossover(
+    p1: List[int],
+    p2: List[int],
+    rng: random.Random,
+    kernel: str,
+) -> Tuple[List[int], List[int]]:
+    """Tire [i, j) et applique le noyau OX/PMX dans les deux sens."""
+    c1, c2 = _two_point_children(p1, p2, rng, kernel)
     return c1, c2
 
 
+def order_crossover(p1: List[int], p2: List[int], rng: random.Random) -> Tuple[List[int], List[int]]:
+    """
+    OX (Order Crossover) standard.
+    Prend deux parents permutation et renvoie deux enfants.
+    Linéaire: appartenance au segment testée via un masque (et non `x in seg`).
+    """
+    return _two_point_crossover(p1, p2, rng, "ox")
+
+
+def pmx_crossover(p1: List[int], p2: List[int], rng: random.Random) -> Tuple[List[int], List[int]]:
+    """
+    PMX (Partially Mapped Crossover): conserve les positions absolues du segment du premier parent.
+    """
+    return _two_point_crossover(p1, p2, rng, "pmx")
+
+
+def _route_block(ind: Individual, inst: CVRPInstance, rng: random.Random) -> List[int]:
+    """
+    Choisit un bloc de routes géographiquement cohérent: routes triées par angle polaire
+    de leur barycentre autour du dépôt, puis fenêtre circulaire de 1 à len/2 routes.
+    Retourne les clients de ce bloc, dans l'ordre des routes.
+    """
+    routes = [r for r in ind.iter_routes() if r]
+    if not routes:
+        return []
+    dx, dy = inst.coords[inst.depot_index]
+
+    def angle(r: List[int]) -> float:
+        cx = sum(inst.coords[c][0] for c in r) / len(r)
+        cy = sum(inst.coords[c][1] for c in r) / len(r)
+        return math.atan2(cy - dy, cx - dx)
+
+    routes.sort(key=angle)
+    k = rng.randint(1, max(1, len(routes) // 2))
+    start = rng.randrange(len(routes))
+    block: List[int] = []
+    for t in range(k):
+        block.extend(routes[(start + t) % len(routes)])
+    return block
+
+
+def route_based_crossover(
+    p1: Individual,
+    p2: Individual,
+    rng: random.Random,
+    inst: CVRPInstance,
+) -> Tuple[List[int], List[int]]:
+    """
+    RBX (crossover par routes): l'enfant hérite tel quel d'un bloc de routes voisines d'un parent
+    (en tête de giant tour), le reste des clients suit l'ordre de la permutation de l'autre parent.
+    """
+    return _rbx_child(p1, p2, rng, inst), _rbx_child(p2, p1, rng, inst)
+
+
+def _rbx_child(
+    routes_parent: Individual,
+    order_parent: Individual,
+    rng: random.Random,
+    inst: CVRPInstance,
+) -> List[int]:
+    """Un enfant RBX: bloc de routes de routes_parent, puis les autres clients dans l'ordre de order_parent."""
+    block = _route_block(routes_parent, inst, rng)
+    taken = bytearray(inst.dimension)
+    for c in block:
+        taken[c] = 1
+    return block + [c for c in order_parent.perm if not taken[c]]
+
+
+CROSSOVERS = ("ox", "pmx", "rbx")
+
+
+def crossover_individuals(
+    p1: Individual,
+    p2: Individual,
+    rng: random.Random,
+    inst: CVRPInstance,
+    method: str = "ox",
+) -> Tuple[List[int], List[int]]:
+    """Applique le crossover choisi (ox, pmx, rbx) et renvoie deux permutations enfants."""
+    if method == "ox":
+        return order_crossover(p1.perm, p2.perm, rng)
+    if method == "pmx":
+        return pmx_crossover(p1.perm, p2.perm, rng)
+    if method == "rbx":
+        return route_based_crossover(p1, p2, rng, inst)
+    raise ValueError(f"Crossover inconnu: '{method}'. Autorisés: {', '.join(CROSSOVERS)}")
+
+
+def crossover_child(
+    p1: Individual,
+    p2: Individual,
+    rng: random.Random,
+    inst: CVRPInstance,
+    method: str = "ox",
+) -> List[int]:
+    """Comme crossover_individuals, mais ne construit que le premier enfant (steady-state)."""
+    if method in ("ox", "pmx"):
+        return _two_point_children(p1.perm, p2.perm, rng, method, both=False)[0]
+    if method == "rbx":
+        return _rbx_child(p1, p2, rng, inst)
+    raise ValueError(f"Crossover inconnu: '{method}'. Autorisés: {', '.join(CROSSOVERS)}")
+
+
 def mutate_swap(perm: List[int], rng: random.Random) -> None:
     n = len(perm)
     if n < 2:
@@ -132,6 +454,14 @@ def mutate_scramble(perm: List[int], rng: random.Random) -> None:
     perm[i:j] = segment
 
 
+MUTATIONS = {
+    "insertion": mutate_insertion,
+    "scramble": mutate_scramble,
+    "swap": mutate_swap,
+    "inversion": mutate_inversion,
+}
+
+
 def heavy_mutate(perm: List[int], rng: random.Random, steps: int | None = None) -> None:
     """
     Applique plusieurs mutations aléatoires pour une grosse secousse.
@@ -152,26 +482,88 @@ def evaluate_perm(
     avg_speed_units_per_hour: float = 1.0,
     unload_time_minutes: float = 0.0,
     time_violations: List[int] | None = None,
+    exact_route_max: int = 0,
+    vnd_operators: Sequence[str] = (),
+    vnd_max_moves: int = 0,
+    vnd_time_budget_sec: float = 0.0,
+    vnd_stats: Dict[str, int] | None = None,
+    write_back: bool = False,
+    eval_cache: EvalCache | None = None,
+    timers: PhaseTimers | None = None,
 ) -> Tuple[List[List[int]], int]:
     """
     Split la permutation en routes faisables, applique 2-opt (optionnel/probabiliste), calcule le coût.
     - two_opt_prob: probabilité d'appliquer 2-opt sur les routes de cet individu.
     - time_violations: liste pour accumuler les violations de temps
+    - exact_route_max: si > 0, les routes de <= exact_route_max clients sont
+      réordonnées de façon optimale (Held-Karp mémoïsé), systématiquement; borné à
+      HELD_KARP_MAX_SIZE, les routes plus longues passent par le 2-opt (si tiré).
+    - vnd_operators: si non vide, la VND (avec cette liste d'opérateurs) remplace le 2-opt
+      (même probabilité two_opt_prob), avec budget vnd_max_moves / vnd_time_budget_sec.
+    - vnd_stats: dict pour cumuler les mouvements appliqués par opérateur VND
+    - write_back: si True (lamarckien), perm est réécrite in-place par concaténation des
+      routes éduquées; les descendants héritent directement de l'ordre amélioré.
+    - eval_cache: si fourni, une permutation déjà évaluée n'est pas ré-évaluée (le tirage 2-opt
+      est consommé dans tous les cas; une entrée non éduquée ne sert pas si le tirage demande le 2-opt)
+    - timers: si fourni, cumule les phases cache / split / vnd / 2opt
     """
+    # Tirage fait avant le split (qui ne consomme pas rng): même séquence aléatoire, cache ou non
+    do_2opt = use_2opt and rng.random() < max(0.0, min(1.0, two_opt_prob))
+    educated = do_2opt  # drapeau du cache: 2-opt/VND appliqué (Held-Karp seul ne compte pas)
+    key = 0
+    if eval_cache is not None:
+        t0 = perf_counter() if timers is not None else 0.0
+        key = perm_hash(perm)
+        hit = eval_cache.get(key, need_educated=do_2opt)
+        if timers is not None:
+            timers.add("cache", t0)
+        if hit is not None:
+            perm_out, routes, cost = hit
+            if write_back and perm_out is not None:
+                perm[:] = perm_out
+            return routes, cost
+
+    t0 = perf_counter() if timers is not None else 0.0
     routes, viols = split_giant_tour(
         perm, inst,
         time_limit_hours=time_limit_hours,
         avg_speed_units_per_hour=avg_speed_units_per_hour,
         unload_time_minutes=unload_time_minutes,
     )
+    if timers is not None:
+        timers.add("split", t0)
+        t0 = perf_counter()
     
     if time_violations is not None and viols:
         time_violations.extend(viols)
     
-    if use_2opt and rng.random() < max(0.0, min(1.0, two_opt_prob)):
-        # 2-opt intra-route seulement pour routes non triviales
-        routes = [two_opt_route(r, inst) if len(r) >= 4 else r for r in routes]
+    if do_2opt and vnd_operators:
+        routes, counters = vnd_routes(
+            routes, inst, vnd_operators,
+            max_moves=vnd_max_moves,
+            time_budget_sec=vnd_time_budget_sec,
+            time_limit_hours=time_limit_hours,
+            avg_speed_units_per_hour=avg_speed_units_per_hour,
+            unload_time_minutes=unload_time_minutes,
+        )
+        if vnd_stats is not None:
+            for name, cnt in counters.items():
+                vnd_stats[name] = vnd_stats.get(name, 0) + cnt
+        do_2opt = False  # routes déjà éduquées par la VND
+        if timers is not None:
+            timers.add("vnd", t0)
+            t0 = perf_counter()
+    if do_2opt or exact_route_max > 0:
+        routes = educate_routes(routes, inst, do_2opt, exact_route_max)
+        if timers is not None:
+            timers.add("2opt", t0)
+    if write_back:
+        perm[:] = [c for r in routes for c in r]
     cost = solution_total_cost(routes, inst)
+    if eval_cache is not None:
+        eval_cache.put(key, perm if write_back else None, routes, cost, educated)
+        if write_back:
+            eval_cache.put(perm_hash(perm), perm, routes, cost, educated)
     return routes, cost
 
 
@@ -180,12 +572,94 @@ def tournament_select(pop: List[Individual], k: int, rng: random.Random) -> Indi
     return min(cand, key=lambda ind: ind.cost)
 
 
-def _route_signature(routes: List[List[int]]) -> Tuple[Tuple[int, ...], ...]:
+def _breed_pair(
+    pop: List[Individual],
+    tournament_k: int,
+    pc: float,
+    pm: float,
+    crossover: str,
+    rng: random.Random,
+    inst: CVRPInstance,
+    cx_sel: OperatorSelector | None = None,
+    mut_sel: OperatorSelector | None = None,
+    trace: List[Any] | None = None,
+) -> Tuple[List[int], List[int]]:
     """
-    Signature hashable d'une solution basée sur la structure des routes.
-    (ordre des clients par route; ignorer dépôt inutile ici)
+    Deux tournois, crossover (proba pc) puis mutation de chaque enfant (proba pm).
+    Avec cx_sel/mut_sel (sélection adaptative), les opérateurs sont choisis par le bandit et
+    trace reçoit [crossover | None, mutation enfant 1 | None, mutation enfant 2 | None, coût du meilleur parent].
     """
-    return tuple(tuple(r) for r in routes)
+    p1 = tournament_select(pop, tournament_k, rng)
+    p2 = tournament_select(pop, tournament_k, rng)
+
+    cx_used = None
+    if rng.random() < pc:
+        if cx_sel is not None:
+            cx_used = cx_sel.select(rng)
+            c1_perm, c2_perm = crossover_individuals(p1, p2, rng, inst, cx_used)
+        else:
+            c1_perm, c2_perm = crossover_individuals(p1, p2, rng, inst, crossover)
+    else:
+        c1_perm, c2_perm = p1.perm[:], p2.perm[:]
+
+    muts_used = [_mutate_child(c_perm, pm, rng, mut_sel) for c_perm in (c1_perm, c2_perm)]
+    if trace is not None:
+        trace[:] = [cx_used, muts_used[0], muts_used[1], min(p1.cost, p2.cost)]
+    return c1_perm, c2_perm
+
+
+def _mutate_child(
+    c_perm: List[int],
+    pm: float,
+    rng: random.Random,
+    mut_sel: OperatorSelector | None = None,
+) -> str | None:
+    """Mutation de l'enfant avec la proba pm (bandit ou cascade fixe); retourne le nom choisi par le bandit."""
+    mut_used = None
+    if rng.random() < pm:
+        if mut_sel is not None:
+            mut_used = mut_sel.select(rng)
+            MUTATIONS[mut_used](c_perm, rng)
+        elif rng.random() < 0.25:
+            mutate_insertion(c_perm, rng)
+        elif rng.random() < 0.5:
+            mutate_scramble(c_perm, rng)
+        elif rng.random() < 0.75:
+            mutate_swap(c_perm, rng)
+        else:
+            mutate_inversion(c_perm, rng)
+    return mut_used
+
+
+def _breed_one(
+    pop: List[Individual],
+    tournament_k: int,
+    pc: float,
+    pm: float,
+    crossover: str,
+    rng: random.Random,
+    inst: CVRPInstance,
+    cx_sel: OperatorSelector | None = None,
+    mut_sel: OperatorSelector | None = None,
+    trace: List[Any] | None = None,
+) -> List[int]:
+    """
+    Comme _breed_pair pour un seul enfant (steady-state): deux tournois, crossover (proba pc)
+    qui ne construit que cet enfant, puis mutation (proba pm). trace: [crossover, mutation, None, coût].
+    """
+    p1 = tournament_select(pop, tournament_k, rng)
+    p2 = tournament_select(pop, tournament_k, rng)
+    cx_used = None
+    if rng.random() < pc:
+        if cx_sel is not None:
+            cx_used = cx_sel.select(rng)
+        c_perm = crossover_child(p1, p2, rng, inst, cx_used or crossover)
+    else:
+        c_perm = p1.perm[:]
+    mut_used = _mutate_child(c_perm, pm, rng, mut_sel)
+    if trace is not None:
+        trace[:] = [cx_used, mut_used, None, min(p1.cost, p2.cost)]
+    return c_perm
 
 
 def _new_random_individual(
@@ -193,23 +667,41 @@ def _new_random_individual(
     rng: random.Random,
     use_2opt: bool,
     two_opt_prob: float,
-    time_limit_hours: float = 0.0,
-    avg_speed_units_per_hour: float = 1.0,
-    unload_time_minutes: float = 0.0,
+    tour_ls_k: int = 0,
+    **eval_kwargs: Any,
 ) -> Individual:
+    """
+    Individu aléatoire évalué. eval_kwargs est transmis tel quel à evaluate_perm
+    (contraintes de temps, exact_route_max, ...).
+    - tour_ls_k: si > 0, la permutation aléatoire est d'abord améliorée par
+      giant_tour_local_search (tour_ls_k voisins) avant le split.
+    """
     depot = inst.depot_index
     base = [i for i in range(inst.dimension) if i != depot]
     rng.shuffle(base)
     perm = base[:]
-    routes, cost = evaluate_perm(
-        perm, inst, rng, use_2opt, two_opt_prob,
-        time_limit_hours=time_limit_hours,
-        avg_speed_units_per_hour=avg_speed_units_per_hour,
-        unload_time_minutes=unload_time_minutes,
-    )
+    if tour_ls_k > 0:
+        timers = eval_kwargs.get("timers")
+        t0 = perf_counter() if timers is not None else 0.0
+        perm = giant_tour_local_search(perm, inst, neighbors_k=tour_ls_k)
+        if timers is not None:
+            timers.add("tour_ls", t0)
+    routes, cost = evaluate_perm(perm, inst, rng, use_2opt, two_opt_prob, **eval_kwargs)
     return Individual(perm=perm, routes=routes, cost=cost)
 
 
+INIT_MODES = (
+    "nn_plus_random",
+    "all_random",
+    "savings_plus_random",
+    "sweep_plus_random",
+    "savings_randomized",
+    "sweep_randomized",
+    "hilbert_randomized",
+    "morton_randomized",
+)
+
+
 def make_initial_population(
     inst: CVRPInstance,
     pop_size: int,
@@ -218,15 +710,24 @@ def make_initial_population(
     verbose: bool = False,
     init_two_opt_prob: float = 0.6,
     init_mode: str = "nn_plus_random",
-    time_limit_hours: float = 0.0,
-    avg_speed_units_per_hour: float = 1.0,
-    unload_time_minutes: float = 0.0,
+    tour_ls_k: int = 0,
+    seed_perms: Sequence[List[int]] | None = None,
+    **eval_kwargs: Any,
 ) -> List[Individual]:
     """
     Construit la population initiale.
+    - seed_perms: giant tours de solutions existantes (démarrage à chaud), évalués en premier
+      avec éducation systématique; le reste de la population suit init_mode
     - nn_plus_random: 1 individu nearest-neighbor puis le reste aléatoire
     - all_random: toute la population est générée par permutations aléatoires
+    - savings_plus_random / sweep_plus_random: 1 individu Clarke-Wright / sweep puis le reste aléatoire
+    - savings_randomized / sweep_randomized: 1 individu Clarke-Wright / sweep puis des variantes randomisées
+    - hilbert_randomized / morton_randomized: idem le long d'une courbe de Hilbert / Morton (très grosses instances)
+    - tour_ls_k: si > 0, chaque permutation aléatoire passe par giant_tour_local_search avant split
+    eval_kwargs est transmis à evaluate_perm (contraintes de temps, exact_route_max, ...).
     """
+    if init_mode not in INIT_MODES:
+        raise ValueError(f"init_mode inconnu: '{init_mode}'. Autorisés: {', '.join(INIT_MODES)}")
     pop: List[Individual] = []
 
     if verbose:
@@ -235,43 +736,92 @@ def make_initial_population(
     depot = inst.depot_index
     base = [i for i in range(inst.dimension) if i != depot]
     report_every = max(1, pop_size // 10)
+    timers: PhaseTimers | None = eval_kwargs.get("timers")
+    t0 = 0.0
 
-    if init_mode == "all_random":
-        for idx in range(pop_size):
+    for sp in (seed_perms or ())[:pop_size]:
+        p = list(sp)
+        routes, cost = evaluate_perm(
+            p, inst, rng, use_2opt,
+            two_opt_prob=1.0 if use_2opt else 0.0,
+            **eval_kwargs,
+        )
+        pop.append(Individual(perm=p, routes=routes, cost=cost))
+    if verbose and pop:
+        print(f"[Init] {len(pop)} solution(s) de départ, meilleure: {min(ind.cost for ind in pop)}", flush=True)
+
+    if len(pop) >= pop_size:
+        pass  # population complète avec les seules solutions de départ
+    elif init_mode == "all_random":
+        for idx in range(len(pop), pop_size):
             rng.shuffle(base)
             p = base[:]
+            if tour_ls_k > 0:
+                t0 = perf_counter() if timers is not None else 0.0
+                p = giant_tour_local_search(p, inst, neighbors_k=tour_ls_k)
+                if timers is not None:
+                    timers.add("tour_ls", t0)
             routes, cost = evaluate_perm(
                 p, inst, rng, use_2opt,
                 two_opt_prob=init_two_opt_prob if use_2opt else 0.0,
-                time_limit_hours=time_limit_hours,
-                avg_speed_units_per_hour=avg_speed_units_per_hour,
-                unload_time_minutes=unload_time_minutes,
+                **eval_kwargs,
+            )
+            pop.append(Individual(perm=p, routes=routes, cost=cost))
+            if verbose and ((idx + 1) % report_every == 0 or idx == pop_size - 1):
+                print(f"[Init] ... {idx + 1}/{pop_size} individus évalués", flush=True)
+    elif init_mode.endswith("_randomized"):
+        build = {
+            "savings_randomized": savings_perm,
+            "sweep_randomized": sweep_perm,
+            "hilbert_randomized": lambda inst, rng, randomized: sfc_perm(inst, rng, "hilbert", randomized),
+            "morton_randomized": lambda inst, rng, randomized: sfc_perm(inst, rng, "morton", randomized),
+        }[init_mode]
+        first = len(pop)
+        for idx in range(first, pop_size):
+            # la première construction est déterministe (et entièrement éduquée), les suivantes randomisées
+            t0 = perf_counter() if timers is not None else 0.0
+            p = build(inst, rng, randomized=idx > first)
+            if timers is not None:
+                timers.add("construct", t0)
+            routes, cost = evaluate_perm(
+                p, inst, rng, use_2opt,
+                two_opt_prob=(1.0 if idx == first else init_two_opt_prob) if use_2opt else 0.0,
+                **eval_kwargs,
             )
             pop.append(Individual(perm=p, routes=routes, cost=cost))
             if verbose and ((idx + 1) % report_every == 0 or idx == pop_size - 1):
                 print(f"[Init] ... {idx + 1}/{pop_size} individus évalués", flush=True)
     else:
-        # 1) un individu greedy nearest-neighbor
-        nn = nearest_neighbor_perm(inst, rng)
+        # 1) un individu constructif: nearest-neighbor, Clarke-Wright ou sweep
+        t0 = perf_counter() if timers is not None else 0.0
+        if init_mode == "savings_plus_random":
+            nn = savings_perm(inst, rng)
+        elif init_mode == "sweep_plus_random":
+            nn = sweep_perm(inst, rng)
+        else:
+            nn = nearest_neighbor_perm(inst, rng)
+        if timers is not None:
+            timers.add("construct", t0)
         routes, cost = evaluate_perm(
-            nn[:], inst, rng, use_2opt,
+            nn, inst, rng, use_2opt,
             two_opt_prob=1.0 if use_2opt else 0.0,
-            time_limit_hours=time_limit_hours,
-            avg_speed_units_per_hour=avg_speed_units_per_hour,
-            unload_time_minutes=unload_time_minutes,
+            **eval_kwargs,
         )
-        pop.append(Individual(perm=nn[:], routes=routes, cost=cost))
+        pop.append(Individual(perm=nn, routes=routes, cost=cost))
 
         # 2) le reste aléatoire
-        for idx in range(pop_size - 1):
+        for idx in range(len(pop) - 1, pop_size - 1):
             rng.shuffle(base)
             p = base[:]
+            if tour_ls_k > 0:
+                t0 = perf_counter() if timers is not None else 0.0
+                p = giant_tour_local_search(p, inst, neighbors_k=tour_ls_k)
+                if timers is not None:
+                    timers.add("tour_ls", t0)
             routes, cost = evaluate_perm(
                 p, inst, rng, use_2opt,
                 two_opt_prob=init_two_opt_prob if use_2opt else 0.0,
-                time_limit_hours=time_limit_hours,
-                avg_speed_units_per_hour=avg_speed_units_per_hour,
-                unload_time_minutes=unload_time_minutes,
+                **eval_kwargs,
             )
             pop.append(Individual(perm=p, routes=routes, cost=cost))
 
@@ -280,7 +830,7 @@ def make_initial_population(
 
     if verbose:
         best_init = min(pop, key=lambda ind: ind.cost)
-        print(f"[Init] OK. Meilleur coût initial: {best_init.cost} | #routes={len(best_init.routes)}", flush=True)
+        print(f"[Init] OK. Meilleur coût initial: {best_init.cost} | #routes={len(best_init.route_ends)}", flush=True)
 
     return pop
 
@@ -319,14 +869,104 @@ def genetic_algorithm(
     time_limit_hours: float = 0.0,           # limite de temps par tournée en heures
     avg_speed_units_per_hour: float = 1.0,  # vitesse moyenne
     unload_time_minutes: float = 0.0,        # temps de déchargement par client
+    exact_route_max: int = 0,                # Held-Karp exact pour routes <= N clients (0 = off)
+    # VND (remplace le 2-opt seul si des opérateurs sont donnés, ex: "2opt,oropt,relocate,swap")
+    vnd_operators: str | Sequence[str] | None = None,
+    vnd_max_moves: int = 0,                  # budget de mouvements par évaluation (0 = illimité)
+    vnd_time_budget_sec: float = 0.0,        # budget de temps par évaluation (0 = illimité)
+    lamarckian: bool = False,                # réécrit perm depuis les routes éduquées
+    tour_ls_k: int = 0,                      # 2-opt/Or-opt giant tour (k voisins) init + immigrants (0 = off)
+    crossover: str = "ox",                   # "ox", "pmx" ou "rbx" (par routes)
+    population_engine: str = "list",         # "list" (Individuals) ou "array" (numpy, par lots)
+    workers: int = 1,                        # processus pour évaluer les enfants (<= 1 = série)
+    # Modèle en îles: arrêt externe + migrants reçus (appelé à chaque génération avec (gen, pop triée))
+    stop_check: Callable[[], bool] | None = None,
+    migration_hook: Callable[[int, List[Individual]], List[Individual]] | None = None,
+    # Détection de doublons: table d'empreintes de taille fixe, entrées oubliées après max_age générations
+    dedupe_capacity: int = 1 << 16,
+    dedupe_max_age: int = 100,
+    eval_cache_size: int = 0,                # cache LRU des évaluations (nb d'entrées, 0 = off)
+    mode: str = "generational",              # "generational" ou "steady_state"
+    steady_replace: str = "worst",           # steady_state: remplace "worst" ou "similar" (le plus proche)
+    survivor_selection: str = "replace",     # "replace" (enfants remplacent) ou "biased" (fitness HGS)
+    biased_n_elite: int = 4,                 # fitness biaisée: nb d'élites (poids de la diversité)
+    biased_n_close: int = 5,                 # fitness biaisée: nb de voisins pour la diversité
+    adaptive_operators: str | None = None,   # None (cascade fixe), "ucb" ou "pm": bandit sur les opérateurs
+    # Checkpoints: écrits toutes les checkpoint_interval générations (et à l'arrêt) dans checkpoint_path
+    checkpoint_path: str | None = None,
+    checkpoint_interval: int = 50,
+    resume_from: str | None = None,          # reprend un run depuis ce checkpoint (mêmes paramètres)
+    # Appelé avec (copie du meilleur, génération, secondes écoulées) à chaque amélioration; True = arrêt
+    on_improve: Callable[[Individual, int, float], bool | None] | None = None,
+    # Démarrage à chaud: chemins .sol et/ou listes de routes (indices internes); seed_id_map = id .sol -> index
+    seed_solutions: str | Sequence[str | Sequence[Sequence[int]]] | None = None,
+    seed_id_map: Dict[int, int] | None = None,
+    profile_phases: bool = False,            # temps/appels par phase dans les métriques (et les logs)
+    # Trace de convergence: point à chaque amélioration et à chaque log_interval (metrics["convergence"])
+    record_trace: bool = False,
+    trace_path: str | None = None,           # export en fin de run (.jsonl -> JSONL, sinon CSV)
+    # Sous-population infaisable (HGS): enfants splittés avec capacité/durée pénalisées
+    infeasible_search: bool = False,
+    target_feasible: float = 0.2,            # part visée d'enfants faisables (pénalités adaptatives)
+    repair_prob: float = 0.5,                # proba de réparer un enfant infaisable (split strict)
+    infeasible_pop_size: int | None = None,  # taille de la sous-population infaisable (défaut pop_size)
+    overload_limit: float = 1.5,             # charge/durée max d'une tournée, en multiple de la limite
 ):
     """
     Boucle principale du GA avec gestion des contraintes de temps.
     Retourne le meilleur individu trouvé.
     """
+    if crossover not in CROSSOVERS:
+        raise ValueError(f"Crossover inconnu: '{crossover}'. Autorisés: {', '.join(CROSSOVERS)}")
+    if population_engine not in ("list", "array"):
+        raise ValueError(f"population_engine inconnu: '{population_engine}'. Autorisés: list, array")
+    if mode not in ("generational", "steady_state"):
+        raise ValueError(f"mode inconnu: '{mode}'. Autorisés: generational, steady_state")
+    if steady_replace not in ("worst", "similar"):
+        raise ValueError(f"steady_replace inconnu: '{steady_replace}'. Autorisés: worst, similar")
+    if survivor_selection not in ("replace", "biased"):
+        raise ValueError(f"survivor_selection inconnu: '{survivor_selection}'. Autorisés: replace, biased")
+    if mode == "steady_state" and survivor_selection == "biased":
+        raise ValueError("survivor_selection='biased' nécessite mode='generational'")
+    if adaptive_operators is not None and adaptive_operators not in AOS_METHODS:
+        raise ValueError(f"adaptive_operators inconnu: '{adaptive_operators}'. Autorisés: {', '.join(AOS_METHODS)}")
+    if adaptive_operators is not None and (population_engine == "array" or workers > 1):
+        raise ValueError("adaptive_operators: population_engine='list' et workers=1 uniquement (crédit par enfant)")
+    if mode == "steady_state" and (population_engine == "array" or workers > 1):
+        raise ValueError("mode steady_state: population_engine='list' et workers=1 uniquement (un enfant à la fois)")
+    if infeasible_search and (mode != "generational" or population_engine == "array" or workers > 1):
+        raise ValueError("infeasible_search: mode='generational', population_engine='list' et workers=1 uniquement")
+    if not 0.0 < target_feasible <= 1.0:
+        raise ValueError(f"target_feasible doit être dans ]0, 1] (reçu {target_feasible})")
+    if not 0.0 <= repair_prob <= 1.0:
+        raise ValueError(f"repair_prob doit être dans [0, 1] (reçu {repair_prob})")
     rng = random.Random(seed)
     time_violations_set: Set[int] = set()
 
+    # Options communes à toutes les évaluations (split + éducation des routes)
+    eval_kwargs: Dict[str, Any] = dict(
+        time_limit_hours=time_limit_hours,
+        avg_speed_units_per_hour=avg_speed_units_per_hour,
+        unload_time_minutes=unload_time_minutes,
+        exact_route_max=max(0, min(HELD_KARP_MAX_SIZE, int(exact_route_max))),
+        write_back=bool(lamarckian),
+    )
+    eval_cache = EvalCache(eval_cache_size) if eval_cache_size > 0 else None
+    if eval_cache is not None:
+        eval_kwargs["eval_cache"] = eval_cache
+    timers = PhaseTimers() if profile_phases else None
+    if timers is not None:
+        eval_kwargs["timers"] = timers
+    vnd_ops = parse_vnd_operators(vnd_operators)
+    vnd_stats: Dict[str, int] = {name: 0 for name in vnd_ops}
+    if vnd_ops:
+        eval_kwargs.update(
+            vnd_operators=vnd_ops,
+            vnd_max_moves=max(0, int(vnd_max_moves)),
+            vnd_time_budget_sec=max(0.0, float(vnd_time_budget_sec)),
+            vnd_stats=vnd_stats,
+        )
+
     def fmt_gap(cost: int) -> str:
         if target_optimum is None or target_optimum <= 0:
             return ""
@@ -334,39 +974,268 @@ def genetic_algorithm(
         return f" | gap={gap:.2f}% (opt={target_optimum})"
 
     start_time = time.time()
-    pop = make_initial_population(
-        inst,
-        pop_size,
-        rng,
-        use_2opt,
-        verbose=verbose,
-        init_two_opt_prob=0.5,
-        init_mode=init_mode,
-        time_limit_hours=time_limit_hours,
-        avg_speed_units_per_hour=avg_speed_units_per_hour,
-        unload_time_minutes=unload_time_minutes,
-    )
-    pop.sort(key=lambda ind: ind.cost)
-    best = pop[0]
-    last_improve_gen = 0
+    ckpt = None
+    if resume_from:
+        from checkpoint import load_checkpoint
+        ckpt = load_checkpoint(resume_from)
+        if ckpt["dimension"] != inst.dimension:
+            raise ValueError(f"Checkpoint {resume_from}: dimension {ckpt['dimension']} != instance {inst.dimension}")
+        pop = ckpt["pop"]
+        best = ckpt["best"]
+        last_improve_gen = ckpt["last_improve_gen"]
+        start_time -= ckpt["elapsed_sec"]  # la limite de temps reste globale au run
+        rng.setstate(ckpt["rng_state"])
+        time_violations_set.update(ckpt["time_violations"])
+        for name, cnt in ckpt["extra"].get("vnd_stats", {}).items():
+            vnd_stats[name] = cnt
+        if verbose:
+            print(f"[GA] Reprise depuis {resume_from}: gen={ckpt['gen']} | best={best.cost} | t+{ckpt['elapsed_sec']:.1f}s", flush=True)
+    else:
+        seed_perms = []
+        if isinstance(seed_solutions, str):
+            seed_solutions = [seed_solutions]
+        for sol in seed_solutions or ():
+            if isinstance(sol, str):
+                sol = read_simple_sol_routes(sol, inst, index_from_original_id=seed_id_map, skip_unknown=True)
+            seed_perms.append(seed_perm_from_routes(sol, inst))
+        t0 = perf_counter() if timers is not None else 0.0
+        pop = make_initial_population(
+            inst,
+            pop_size,
+            rng,
+            use_2opt,
+            verbose=verbose,
+            init_two_opt_prob=0.5,
+            init_mode=init_mode,
+            tour_ls_k=tour_ls_k,
+            seed_perms=seed_perms,
+            **eval_kwargs,
+        )
+        if timers is not None:
+            timers.add("init", t0)
+        pop.sort(key=lambda ind: ind.cost)
+        best = pop[0]
+        last_improve_gen = 0
 
-    if verbose:
+    if verbose and ckpt is None:
         bcost, avg = _stats(pop)
         time_info = ""
         if time_limit_hours > 0:
             time_info = f" | time_limit={time_limit_hours:.1f}h"
-        print(f"[GA] Départ: best={bcost:.0f} | avg={avg:.0f} | #routes_best={len(best.routes)} | init_mode={init_mode}{time_info}{fmt_gap(bcost)}", flush=True)
+        print(f"[GA] Départ: best={bcost:.0f} | avg={avg:.0f} | #routes_best={len(best.route_ends)} | init_mode={init_mode}{time_info}{fmt_gap(bcost)}", flush=True)
 
     stopped_by = None
-    gen = 0
+    start_gen = ckpt["gen"] if ckpt is not None else 0
+    gen = start_gen
+    gen_done = start_gen
 
-    route_signatures: Set[Tuple[Tuple[int, ...], ...]] = set(_route_signature(ind.routes) for ind in pop)
+    seen = GenerationalHashSet(dedupe_capacity, dedupe_max_age)
+    if ckpt is not None and ckpt["seen_state"] is not None:
+        seen.setstate(ckpt["seen_state"])
+    else:
+        for ind in pop:
+            seen.add(ind.signature())
+
+    penalties = None
+    infeasible_pop: List[Individual] = []
+    if infeasible_search:
+        penalties = PenaltyManager(inst, target_feasible, time_limit_hours, avg_speed_units_per_hour)
+        if ckpt is not None and "penalties" in ckpt["extra"]:
+            penalties.setstate(ckpt["extra"]["penalties"])
+    infeasible_size = max(1, int(infeasible_pop_size if infeasible_pop_size is not None else pop_size))
+
+    pm_eff_last = ckpt["pm_eff_last"] if ckpt is not None else None
+    two_opt_prob_eff_last = ckpt["two_opt_prob_eff_last"] if ckpt is not None else None
+
+    def admit_child(
+        new_pop: List[Individual],
+        c_perm: List[int],
+        c_routes: List[List[int]],
+        c_cost: int,
+        prob: float,
+    ) -> bool:
+        """
+        Évite les doublons (heavy mutation + réévaluation, 2 essais) puis ajoute l'enfant.
+        True si c_perm a été modifiée par une heavy mutation.
+        """
+        tries = 0
+        if duplicate_avoidance:
+            h = solution_hash(c_routes)
+            while h in seen and tries < 2:
+                heavy_mutate(c_perm, rng)
+                c_routes, c_cost = evaluate_perm(
+                    c_perm, inst, rng, use_2opt, two_opt_prob=prob,
+                    **eval_kwargs,
+                )
+                h = solution_hash(c_routes)
+                tries += 1
+        else:
+            h = solution_hash(c_routes)
+        new_pop.append(Individual(c_perm, c_routes, c_cost))
+        seen.add(h)
+        return tries > 0
+
+    def evaluate_penalized(c_perm: List[int], prob: float) -> Individual:
+        """Enfant évalué par le split pénalisé; infaisable: cost pénalisé et excess renseigné."""
+        c_routes, dist_cost, excess_load, excess_hours = evaluate_perm_penalized(
+            c_perm, inst, rng, use_2opt, prob, penalties, overload_limit, **eval_kwargs,
+        )
+        penalties.record(excess_load, excess_hours)
+        child = Individual(c_perm, c_routes, dist_cost)
+        if excess_load > 0 or excess_hours > 0.0:
+            child.excess = (dist_cost, excess_load, excess_hours)
+            child.cost = penalties.penalized_cost(dist_cost, excess_load, excess_hours)
+        return child
 
-    pm_eff_last = None
-    two_opt_prob_eff_last = None
+    def repair(child: Individual, prob: float) -> Individual:
+        """Réparation: split strict (capacité et durée) de la tournée éduquée de l'enfant infaisable."""
+        r_perm = [c for r in child.iter_routes() for c in r]
+        viols_temp: List[int] = []
+        r_routes, r_cost = evaluate_perm(
+            r_perm, inst, rng, use_2opt, two_opt_prob=prob,
+            **eval_kwargs,
+            time_violations=viols_temp,
+        )
+        time_violations_set.update(viols_temp)
+        return Individual(r_perm, r_routes, r_cost)
+
+    def keep_best(pool: List[Individual], n_keep: int) -> Tuple[List[Individual], float | None]:
+        """Sélection des survivants d'une sous-population (mu + lambda), triés par coût."""
+        if survivor_selection == "biased" and len(pool) > n_keep:
+            return select_survivors(pool, n_keep, inst, biased_n_elite, biased_n_close)
+        pool.sort(key=lambda ind: ind.cost)
+        return pool[:n_keep], None
+
+    cx_sel = mut_sel = None
+    aos_trace: List[Any] | None = None
+    if adaptive_operators is not None:
+        cx_sel = OperatorSelector(CROSSOVERS, adaptive_operators)
+        mut_sel = OperatorSelector(tuple(MUTATIONS), adaptive_operators)
+        aos_trace = []
+        if ckpt is not None and "aos" in ckpt["extra"]:
+            cx_sel.setstate(ckpt["extra"]["aos"]["crossover"])
+            mut_sel.setstate(ckpt["extra"]["aos"]["mutation"])
+
+    reported_cost = None
+
+    def report_best(g: int) -> bool:
+        """Notifie on_improve si le meilleur a progressé; True si l'appelant demande l'arrêt."""
+        nonlocal reported_cost
+        if on_improve is None or (reported_cost is not None and best.cost >= reported_cost):
+            return False
+        reported_cost = best.cost
+        snapshot = Individual(list(best.perm), [list(r) for r in best.iter_routes()], best.cost)
+        return bool(on_improve(snapshot, g, time.time() - start_time))
+
+    trace = ConvergenceTrace() if (record_trace or trace_path) else None
+    traced_cost = None
+
+    def trace_point(g: int, force: bool) -> None:
+        """Ajoute un point à la trace si le meilleur a progressé (ou si force: point de log)."""
+        nonlocal traced_cost
+        if trace is None or not (force or traced_cost is None or best.cost < traced_cost):
+            return
+        traced_cost = best.cost
+        trace.record(time.time() - start_time, g, best.cost, _stats(pop)[1], pm_eff_last, two_opt_prob_eff_last)
+
+    def write_checkpoint() -> None:
+        """Sauvegarde l'état à la fin de la génération gen_done."""
+        from checkpoint import save_checkpoint
+        extra: Dict[str, Any] = {"vnd_stats": dict(vnd_stats)}
+        if cx_sel is not None:
+            extra["aos"] = {"crossover": cx_sel.getstate(), "mutation": mut_sel.getstate()}
+        if penalties is not None:
+            extra["penalties"] = penalties.getstate()
+        save_checkpoint(checkpoint_path, {
+            "gen": gen_done,
+            "last_improve_gen": last_improve_gen,
+            "dimension": inst.dimension,
+            "pop": pop,
+            "best": best,
+            "elapsed_sec": time.time() - start_time,
+            "pm_eff_last": pm_eff_last,
+            "two_opt_prob_eff_last": two_opt_prob_eff_last,
+            "rng_state": rng.getstate(),
+            "time_violations": time_violations_set,
+            "seen_state": seen.getstate(),
+            "extra": extra,
+        })
+
+    def aos_credit(k: int, c_cost: int, cpu_sec: float) -> None:
+        """Crédite le crossover et la mutation de l'enfant k (0 ou 1) du dernier _breed_pair."""
+        gain = aos_trace[3] - c_cost
+        if aos_trace[0] is not None:
+            cx_sel.update(aos_trace[0], gain, cpu_sec)
+        if aos_trace[1 + k] is not None:
+            mut_sel.update(aos_trace[1 + k], gain, cpu_sec)
+
+    def steady_insert(child: Individual, force: bool = False) -> None:
+        """
+        Steady-state: l'enfant remplace le pire individu (ou, en mode "similar", le plus proche
+        parmi tournament_k individus tirés parmi ceux moins bons que lui), puis est inséré à sa
+        place par bisection. Rejeté s'il est déjà présent ou (sauf force) pas meilleur que le pire.
+        """
+        nonlocal best, last_improve_gen
+        h = child.signature()
+        if duplicate_avoidance and h in pop_hashes:
+            return
+        if len(pop) <= elitism:
+            return
+        if force:
+            victim = len(pop) - 1
+        else:
+            if child.cost >= pop[-1].cost:
+                return
+            victim = len(pop) - 1
+            if steady_replace == "similar":
+                lo = max(elitism, bisect.bisect_right(pop, child.cost, key=lambda ind: ind.cost))
+                cands = [rng.randrange(lo, len(pop)) for _ in range(max(1, tournament_k))]
+                succ = {a: b for a, b in zip(child.perm, child.perm[1:])}
+                victim = max(
+                    cands,
+                    key=lambda i: sum(1 for a, b in zip(pop[i].perm, pop[i].perm[1:]) if succ.get(a) == b),
+                )
+        old = pop.pop(victim)
+        oh = old.signature()
+        pop_hashes[oh] -= 1
+        if pop_hashes[oh] <= 0:
+            del pop_hashes[oh]
+        bisect.insort(pop, child, key=lambda ind: ind.cost)
+        pop_hashes[h] = pop_hashes.get(h, 0) + 1
+        seen.add(h)
+        if child.cost < best.cost:
+            best = child
+            last_improve_gen = gen
+
+    diversity_last = None
+    pop_hashes: Dict[int, int] = {}  # steady_state: empreintes de la population courante (avec multiplicité)
+
+    def index_pop_hashes() -> None:
+        """steady_state: recalcule pop_hashes (départ, puis après shake, restart et migration)."""
+        if mode != "steady_state":
+            return
+        pop_hashes.clear()
+        for ind in pop:
+            h = ind.signature()
+            pop_hashes[h] = pop_hashes.get(h, 0) + 1
+
+    index_pop_hashes()
+
+    # population_engine="array": tableaux de la population (ligne i = pop[i]); None = à reconstruire
+    arr = None
+
+    evaluator = None
+    if workers > 1:
+        from parallel import ParallelEvaluator
+        evaluator = ParallelEvaluator(inst, workers, eval_kwargs)
 
     try:
-        for gen in range(1, generations + 1):
+        trace_point(start_gen, True)
+        if report_best(start_gen):
+            stopped_by = "callback"
+        for gen in range(start_gen + 1, generations + 1):
+            if stopped_by is not None:
+                break
             if time_limit_sec and (time.time() - start_time) >= time_limit_sec:
                 stopped_by = "time"
                 if verbose:
@@ -379,6 +1248,13 @@ def genetic_algorithm(
                     print(f"[GA] Fichier sentinelle détecté ({stop_on_file}). Arrêt propre à gen {gen-1}.", flush=True)
                 break
 
+            if stop_check is not None and stop_check():
+                stopped_by = "external"
+                if verbose:
+                    print(f"[GA] Arrêt demandé de l'extérieur. Arrêt propre à gen {gen-1}.", flush=True)
+                break
+
+            seen.tick()
             stale = gen - last_improve_gen
             stale_ratio = min(1.0, stale / max(1, stagnation_restart_gens))
             pm_eff = pm * (1.0 + 0.6 * stale_ratio) if adaptive_mutation else pm
@@ -388,127 +1264,262 @@ def genetic_algorithm(
             pm_eff_last = pm_eff
             two_opt_prob_eff_last = two_opt_prob_eff
 
-            new_pop: List[Individual] = []
-
-            elites = pop[:elitism]
-            new_pop.extend(elites)
-
-            while len(new_pop) < pop_size:
-                p1 = tournament_select(pop, tournament_k, rng)
-                p2 = tournament_select(pop, tournament_k, rng)
-
-                if rng.random() < pc:
-                    c1_perm, c2_perm = order_crossover(p1.perm, p2.perm, rng)
-                else:
-                    c1_perm, c2_perm = p1.perm[:], p2.perm[:]
-
-                if rng.random() < pm_eff:
-                    if rng.random() < 0.25:
-                        mutate_insertion(c1_perm, rng)
-                    elif rng.random() < 0.5:
-                        mutate_scramble(c1_perm, rng)
-                    elif rng.random() < 0.75:
-                        mutate_swap(c1_perm, rng)
-                    else:
-                        mutate_inversion(c1_perm, rng)
-                if rng.random() < pm_eff:
-                    if rng.random() < 0.25:
-                        mutate_insertion(c2_perm, rng)
-                    elif rng.random() < 0.5:
-                        mutate_scramble(c2_perm, rng)
-                    elif rng.random() < 0.75:
-                        mutate_swap(c2_perm, rng)
-                    else:
-                        mutate_inversion(c2_perm, rng)
-
-                viols_temp: List[int] = []
-                c1_routes, c1_cost = evaluate_perm(
-                    c1_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
-                    time_limit_hours=time_limit_hours,
-                    avg_speed_units_per_hour=avg_speed_units_per_hour,
-                    unload_time_minutes=unload_time_minutes,
-                    time_violations=viols_temp,
-                )
-                c2_routes, c2_cost = evaluate_perm(
-                    c2_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
-                    time_limit_hours=time_limit_hours,
-                    avg_speed_units_per_hour=avg_speed_units_per_hour,
-                    unload_time_minutes=unload_time_minutes,
-                    time_violations=viols_temp,
-                )
-                
-                time_violations_set.update(viols_temp)
-
-                if duplicate_avoidance:
-                    tries = 0
-                    sig1 = _route_signature(c1_routes)
-                    while sig1 in route_signatures and tries < 2:
-                        heavy_mutate(c1_perm, rng)
-                        c1_routes, c1_cost = evaluate_perm(
-                            c1_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
-                            time_limit_hours=time_limit_hours,
-                            avg_speed_units_per_hour=avg_speed_units_per_hour,
-                            unload_time_minutes=unload_time_minutes,
+            if mode == "steady_state":
+                # Un enfant par itération, inséré à sa place (pop reste triée, pas de tri global;
+                # pop_hashes tenu à jour par steady_insert)
+                for _ in range(max(1, pop_size - elitism)):
+                    t_cpu = time.process_time() if aos_trace is not None else 0.0
+                    t0 = perf_counter() if timers is not None else 0.0
+                    c_perm = _breed_one(
+                        pop, tournament_k, pc, pm_eff, crossover, rng, inst, cx_sel, mut_sel, aos_trace,
+                    )
+                    if timers is not None:
+                        timers.add("breed", t0)
+                        t0 = perf_counter()
+                    viols_temp: List[int] = []
+                    c_routes, c_cost = evaluate_perm(
+                        c_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
+                        **eval_kwargs,
+                        time_violations=viols_temp,
+                    )
+                    time_violations_set.update(viols_temp)
+                    if timers is not None:
+                        timers.add("evaluate", t0)
+                    if aos_trace is not None:
+                        aos_credit(0, c_cost, time.process_time() - t_cpu)
+                    t0 = perf_counter() if timers is not None else 0.0
+                    steady_insert(Individual(c_perm, c_routes, c_cost))
+                    if timers is not None:
+                        timers.add("dedupe", t0)
+                if immigrants_frac > 0.0:
+                    m = int(pop_size * max(0.0, min(0.5, immigrants_frac)))
+                    t0 = perf_counter() if timers is not None else 0.0
+                    for _ in range(m):
+                        steady_insert(
+                            _new_random_individual(
+                                inst, rng, use_2opt, two_opt_prob_eff * 0.5,
+                                tour_ls_k=tour_ls_k,
+                                **eval_kwargs,
+                            ),
+                            force=True,
                         )
-                        sig1 = _route_signature(c1_routes)
-                        tries += 1
-
-                new_pop.append(Individual(c1_perm, c1_routes, c1_cost))
-                route_signatures.add(_route_signature(c1_routes))
-
-                if len(new_pop) < pop_size:
-                    if duplicate_avoidance:
-                        tries = 0
-                        sig2 = _route_signature(c2_routes)
-                        while sig2 in route_signatures and tries < 2:
-                            heavy_mutate(c2_perm, rng)
-                            c2_routes, c2_cost = evaluate_perm(
-                                c2_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
-                                time_limit_hours=time_limit_hours,
-                                avg_speed_units_per_hour=avg_speed_units_per_hour,
-                                unload_time_minutes=unload_time_minutes,
-                            )
-                            sig2 = _route_signature(c2_routes)
-                            tries += 1
-                    new_pop.append(Individual(c2_perm, c2_routes, c2_cost))
-                    route_signatures.add(_route_signature(c2_routes))
-
-            if immigrants_frac > 0.0:
-                m = int(pop_size * max(0.0, min(0.5, immigrants_frac)))
-                if m > 0:
-                    new_pop.sort(key=lambda ind: ind.cost)
-                    replaced = 0
+                    if timers is not None:
+                        timers.add("immigrants", t0, m)
+            elif penalties is not None:
+                # Deux sous-populations (HGS): parents tirés dans l'union, chaque enfant rejoint
+                # la sous-population de sa faisabilité; un infaisable est réparé avec la proba repair_prob
+                parents = pop + infeasible_pop
+                feas_new: List[Individual] = []
+                infeas_new: List[Individual] = []
+                made = 0
+                while made < max(1, pop_size - elitism):
+                    t_cpu = time.process_time() if aos_trace is not None else 0.0
+                    t0 = perf_counter() if timers is not None else 0.0
+                    pair = _breed_pair(
+                        parents, tournament_k, pc, pm_eff, crossover, rng, inst, cx_sel, mut_sel, aos_trace,
+                    )
+                    if timers is not None:
+                        timers.add("breed", t0)
+                    for k, c_perm in enumerate(pair):
+                        t0 = perf_counter() if timers is not None else 0.0
+                        child = evaluate_penalized(c_perm, two_opt_prob_eff)
+                        if aos_trace is not None:
+                            t_now = time.process_time()
+                            aos_credit(k, child.cost, t_now - t_cpu)
+                            t_cpu = t_now
+                        made += 1
+                        if timers is not None:
+                            timers.add("evaluate", t0)
+                            t0 = perf_counter()
+                        h = child.signature()
+                        if duplicate_avoidance and h in seen:
+                            continue
+                        seen.add(h)
+                        if child.excess is None:
+                            feas_new.append(child)
+                        else:
+                            infeas_new.append(child)
+                            if rng.random() < repair_prob:
+                                fixed = repair(child, two_opt_prob_eff)
+                                hf = fixed.signature()
+                                if not (duplicate_avoidance and hf in seen):
+                                    seen.add(hf)
+                                    feas_new.append(fixed)
+                        if timers is not None:
+                            timers.add("dedupe", t0)
+
+                if immigrants_frac > 0.0:
+                    m = int(pop_size * max(0.0, min(0.5, immigrants_frac)))
+                    t0 = perf_counter() if timers is not None else 0.0
                     for _ in range(m):
                         immigrant = _new_random_individual(
                             inst, rng, use_2opt, two_opt_prob_eff * 0.5,
-                            time_limit_hours=time_limit_hours,
-                            avg_speed_units_per_hour=avg_speed_units_per_hour,
-                            unload_time_minutes=unload_time_minutes,
+                            tour_ls_k=tour_ls_k,
+                            **eval_kwargs,
+                        )
+                        h = immigrant.signature()
+                        if not (duplicate_avoidance and h in seen):
+                            seen.add(h)
+                            feas_new.append(immigrant)
+                    if timers is not None:
+                        timers.add("immigrants", t0, m)
+
+                t0 = perf_counter() if timers is not None else 0.0
+                if penalties.adapt():
+                    for ind in infeasible_pop:
+                        ind.cost = penalties.penalized_cost(*ind.excess)
+                    for ind in infeas_new:
+                        ind.cost = penalties.penalized_cost(*ind.excess)
+                pop, diversity_last = keep_best(pop + feas_new, pop_size)
+                infeasible_pop, _unused = keep_best(infeasible_pop + infeas_new, infeasible_size)
+                if timers is not None:
+                    timers.add("survivors", t0)
+            else:
+                new_pop: List[Individual] = []
+
+                elites = pop[:elitism]
+                new_pop.extend(elites)
+
+                child_rows = None
+                if population_engine == "array" or evaluator is not None:
+                    # Enfants produits en lot puis évalués en lot (pool de processus si workers > 1)
+                    n_children = pop_size - len(new_pop)
+                    t0 = perf_counter() if timers is not None else 0.0
+                    if population_engine == "array":
+                        from population import ArrayPopulation, breed_offspring
+                        if arr is None:
+                            arr = ArrayPopulation.from_individuals(pop)
+                        child_rows = breed_offspring(
+                            arr, pop, n_children, tournament_k, pc, pm_eff, crossover, rng, inst,
                         )
-                        if duplicate_avoidance:
-                            sig = _route_signature(immigrant.routes)
-                            tries = 0
-                            while sig in route_signatures and tries < 3:
-                                immigrant = _new_random_individual(
-                                    inst, rng, use_2opt, two_opt_prob_eff * 0.5,
-                                    time_limit_hours=time_limit_hours,
-                                    avg_speed_units_per_hour=avg_speed_units_per_hour,
-                                    unload_time_minutes=unload_time_minutes,
-                                )
-                                sig = _route_signature(immigrant.routes)
-                                tries += 1
-                            route_signatures.add(sig)
-                        new_pop[-(1 + replaced)] = immigrant
-                        replaced += 1
-
-            pop = new_pop
-            pop.sort(key=lambda ind: ind.cost)
+                        # listes Python seulement pour l'évaluation (split, éducation)
+                        children = child_rows.tolist()
+                    else:
+                        children = []
+                        while len(children) < n_children:
+                            children.extend(_breed_pair(pop, tournament_k, pc, pm_eff, crossover, rng, inst))
+                        del children[n_children:]
+                    if timers is not None:
+                        timers.add("breed", t0, n_children)
+                        t0 = perf_counter()
+                    if evaluator is not None:
+                        evaluated = evaluator.evaluate(
+                            children, rng, use_2opt, two_opt_prob_eff, time_violations=time_violations_set,
+                        )
+                    else:
+                        evaluated = []
+                        for c_perm in children:
+                            viols_temp: List[int] = []
+                            c_routes, c_cost = evaluate_perm(
+                                c_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
+                                **eval_kwargs,
+                                time_violations=viols_temp,
+                            )
+                            time_violations_set.update(viols_temp)
+                            evaluated.append((c_perm, c_routes, c_cost))
+                    if timers is not None:
+                        timers.add("evaluate", t0, n_children)
+                        t0 = perf_counter()
+                    if child_rows is not None:
+                        # id(ind) -> (ind, ligne): parents dans arr.perms, puis enfants dans child_rows
+                        row_of = {id(ind): (ind, i) for i, ind in enumerate(pop)}
+                    for k, (c_perm, c_routes, c_cost) in enumerate(evaluated):
+                        modified = admit_child(new_pop, c_perm, c_routes, c_cost, two_opt_prob_eff)
+                        if child_rows is not None and not (modified or lamarckian):
+                            row_of[id(new_pop[-1])] = (new_pop[-1], len(pop) + k)
+                    if timers is not None:
+                        timers.add("dedupe", t0, n_children)
+
+                while len(new_pop) < pop_size:
+                    t_cpu = time.process_time() if aos_trace is not None else 0.0
+                    t0 = perf_counter() if timers is not None else 0.0
+                    c1_perm, c2_perm = _breed_pair(
+                        pop, tournament_k, pc, pm_eff, crossover, rng, inst, cx_sel, mut_sel, aos_trace,
+                    )
+                    t_breed = time.process_time() - t_cpu if aos_trace is not None else 0.0
+                    if timers is not None:
+                        timers.add("breed", t0)
+                        t0 = perf_counter()
+
+                    viols_temp: List[int] = []
+                    c1_routes, c1_cost = evaluate_perm(
+                        c1_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
+                        **eval_kwargs,
+                        time_violations=viols_temp,
+                    )
+                    t_c1 = time.process_time() if aos_trace is not None else 0.0
+                    c2_routes, c2_cost = evaluate_perm(
+                        c2_perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
+                        **eval_kwargs,
+                        time_violations=viols_temp,
+                    )
+                    if aos_trace is not None:
+                        # temps CPU (mesuré seulement avec adaptive_operators): moitié du breeding
+                        # + évaluation propre à chaque enfant
+                        t_c2 = time.process_time()
+                        aos_credit(0, c1_cost, 0.5 * t_breed + (t_c1 - t_cpu - t_breed))
+                        aos_credit(1, c2_cost, 0.5 * t_breed + (t_c2 - t_c1))
+                
+                    time_violations_set.update(viols_temp)
+                    if timers is not None:
+                        timers.add("evaluate", t0, 2)
+                        t0 = perf_counter()
+
+                    admit_child(new_pop, c1_perm, c1_routes, c1_cost, two_opt_prob_eff)
+                    if len(new_pop) < pop_size:
+                        admit_child(new_pop, c2_perm, c2_routes, c2_cost, two_opt_prob_eff)
+                    if timers is not None:
+                        timers.add("dedupe", t0)
+
+                if immigrants_frac > 0.0:
+                    m = int(pop_size * max(0.0, min(0.5, immigrants_frac)))
+                    if m > 0:
+                        t0 = perf_counter() if timers is not None else 0.0
+                        new_pop.sort(key=lambda ind: ind.cost)
+                        replaced = 0
+                        for _ in range(m):
+                            immigrant = _new_random_individual(
+                                inst, rng, use_2opt, two_opt_prob_eff * 0.5,
+                                tour_ls_k=tour_ls_k,
+                                **eval_kwargs,
+                            )
+                            if duplicate_avoidance:
+                                h = immigrant.signature()
+                                tries = 0
+                                while h in seen and tries < 3:
+                                    immigrant = _new_random_individual(
+                                        inst, rng, use_2opt, two_opt_prob_eff * 0.5,
+                                        tour_ls_k=tour_ls_k,
+                                        **eval_kwargs,
+                                    )
+                                    h = immigrant.signature()
+                                    tries += 1
+                                seen.add(h)
+                            new_pop[-(1 + replaced)] = immigrant
+                            replaced += 1
+                        if timers is not None:
+                            timers.add("immigrants", t0, m)
+
+                t0 = perf_counter() if timers is not None else 0.0
+                if survivor_selection == "biased":
+                    # (mu + lambda): parents + enfants, survivants selon coût + contribution à la diversité
+                    old_ids = set(id(ind) for ind in pop)
+                    pool = pop + [ind for ind in new_pop if id(ind) not in old_ids]
+                    pop, diversity_last = select_survivors(pool, pop_size, inst, biased_n_elite, biased_n_close)
+                else:
+                    pop = new_pop
+                    pop.sort(key=lambda ind: ind.cost)
+                if child_rows is not None:
+                    arr = arr.select(pop, row_of, child_rows)
+                if timers is not None:
+                    timers.add("survivors", t0)
             if pop[0].cost < best.cost:
                 best = pop[0]
                 last_improve_gen = gen
 
             stale = gen - last_improve_gen
             if stale > 0 and stale % max(1, stagnation_shake_gens) == 0 and stale < stagnation_restart_gens:
+                t0 = perf_counter() if timers is not None else 0.0
                 start = elitism
                 end = min(pop_size, elitism + max(1, pop_size // 3))
                 for idx in range(start, end):
@@ -516,62 +1527,132 @@ def genetic_algorithm(
                     heavy_mutate(ind.perm, rng)
                     ind.routes, ind.cost = evaluate_perm(
                         ind.perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff,
-                        time_limit_hours=time_limit_hours,
-                        avg_speed_units_per_hour=avg_speed_units_per_hour,
-                        unload_time_minutes=unload_time_minutes,
+                        **eval_kwargs,
                     )
                 pop.sort(key=lambda ind: ind.cost)
                 if verbose:
                     print(f"[GA] Gen {gen}: shake population (stale={stale})", flush=True)
-                route_signatures = set(_route_signature(ind.routes) for ind in pop)
+                seen.clear()
+                for ind in pop:
+                    seen.add(ind.signature())
+                index_pop_hashes()
+                arr = None
+                if timers is not None:
+                    timers.add("shake", t0)
 
             if stale >= stagnation_restart_gens:
+                t0 = perf_counter() if timers is not None else 0.0
                 keep = 1
                 survivors = pop[:keep]
                 new_pop = survivors[:]
-                route_signatures = set(_route_signature(ind.routes) for ind in survivors)
+                seen.clear()
+                for ind in survivors:
+                    seen.add(ind.signature())
                 while len(new_pop) < pop_size:
                     immigrant = _new_random_individual(
                         inst, rng, use_2opt, two_opt_prob_eff * 0.4,
-                        time_limit_hours=time_limit_hours,
-                        avg_speed_units_per_hour=avg_speed_units_per_hour,
-                        unload_time_minutes=unload_time_minutes,
+                        tour_ls_k=tour_ls_k,
+                        **eval_kwargs,
                     )
                     if duplicate_avoidance:
-                        sig = _route_signature(immigrant.routes)
+                        h = immigrant.signature()
                         tries = 0
-                        while sig in route_signatures and tries < 3:
+                        while h in seen and tries < 3:
                             heavy_mutate(immigrant.perm, rng)
                             immigrant.routes, immigrant.cost = evaluate_perm(
                                 immigrant.perm, inst, rng, use_2opt, two_opt_prob=two_opt_prob_eff * 0.4,
-                                time_limit_hours=time_limit_hours,
-                                avg_speed_units_per_hour=avg_speed_units_per_hour,
-                                unload_time_minutes=unload_time_minutes,
+                                **eval_kwargs,
                             )
-                            sig = _route_signature(immigrant.routes)
+                            h = immigrant.signature()
                             tries += 1
-                        route_signatures.add(sig)
+                        seen.add(h)
                     new_pop.append(immigrant)
                 pop = new_pop
                 pop.sort(key=lambda ind: ind.cost)
+                infeasible_pop = []
+                index_pop_hashes()
+                arr = None
                 last_improve_gen = gen
+                if timers is not None:
+                    timers.add("restart", t0)
                 if verbose:
                     print(f"[GA] Gen {gen}: RESTART partiel (stale={stale})", flush=True)
 
+            if migration_hook is not None:
+                # Les migrants remplacent les pires individus (doublons ignorés)
+                t0 = perf_counter() if timers is not None else 0.0
+                incoming = migration_hook(gen, pop)
+                if incoming:
+                    hashes = set(ind.signature() for ind in pop)
+                    slot = len(pop) - 1
+                    for mig in sorted(incoming, key=lambda ind: ind.cost):
+                        if slot < elitism or mig.cost >= pop[slot].cost:
+                            break
+                        h = mig.signature()
+                        if h in hashes:
+                            continue
+                        pop[slot] = mig
+                        hashes.add(h)
+                        seen.add(h)
+                        slot -= 1
+                    pop.sort(key=lambda ind: ind.cost)
+                    index_pop_hashes()
+                    arr = None
+                    if pop[0].cost < best.cost:
+                        best = pop[0]
+                        last_improve_gen = gen
+                if timers is not None:
+                    timers.add("migration", t0)
+
             if verbose and (gen % max(1, log_interval) == 0 or gen == 1):
                 elapsed = time.time() - start_time
                 eta = (elapsed / gen) * (generations - gen) if gen > 0 else 0.0
                 bcost, avg = _stats(pop)
                 print(
-                    f"[GA] Gen {gen}/{generations} | best={bcost:.0f} | avg={avg:.0f} | #routes_best={len(best.routes)}"
+                    f"[GA] Gen {gen}/{generations} | best={bcost:.0f} | avg={avg:.0f} | #routes_best={len(best.route_ends)}"
                     f"{fmt_gap(bcost)} | t+{elapsed:.1f}s | ETA~{eta:.1f}s | pm_eff={pm_eff:.2f} | 2opt={two_opt_prob_eff:.2f}",
                     flush=True,
                 )
+                if timers is not None:
+                    print(f"[GA]   phases: {timers.summary()}", flush=True)
+                if penalties is not None:
+                    print(
+                        f"[GA]   infaisables={len(infeasible_pop)} | faisables={penalties.feasible_ratio:.2f}"
+                        f" (cible {target_feasible:.2f}) | pénalités cap={penalties.capacity:.2f} durée={penalties.duration:.2f}",
+                        flush=True,
+                    )
+
+            gen_done = gen
+            trace_point(gen, gen % max(1, log_interval) == 0)
+            if report_best(gen):
+                stopped_by = "callback"
+                if verbose:
+                    print(f"[GA] Arrêt demandé par on_improve à gen {gen}.", flush=True)
+            if checkpoint_path and gen % max(1, checkpoint_interval) == 0:
+                t0 = perf_counter() if timers is not None else 0.0
+                write_checkpoint()
+                if timers is not None:
+                    timers.add("checkpoint", t0)
     except KeyboardInterrupt:
         stopped_by = "keyboard"
         if verbose:
             elapsed = time.time() - start_time
             print(f"[GA] Arrêt par utilisateur (Ctrl+C) après {elapsed:.1f}s à gen {gen-1}.", flush=True)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+
+    if trace is not None and gen_done > start_gen:
+        trace_point(gen_done, True)  # dernier point: la courbe couvre tout le run
+    if trace_path:
+        trace.save(trace_path)
+        if verbose:
+            print(f"[GA] Trace de convergence écrite: {trace_path} ({len(trace)} points)", flush=True)
+
+    if checkpoint_path and gen_done > start_gen:
+        write_checkpoint()
+        if verbose:
+            print(f"[GA] Checkpoint écrit: {checkpoint_path} (gen {gen_done})", flush=True)
 
     if verbose:
         total_elapsed = time.time() - start_time
@@ -598,4 +1679,24 @@ def genetic_algorithm(
         "pm_eff_last": float(pm_eff_last) if pm_eff_last is not None else None,
         "two_opt_prob_eff_last": float(two_opt_prob_eff_last) if two_opt_prob_eff_last is not None else None,
     }
+    if vnd_ops:
+        metrics["vnd_moves"] = dict(vnd_stats)
+    if cx_sel is not None:
+        metrics["aos_crossover"] = cx_sel.stats()
+        metrics["aos_mutation"] = mut_sel.stats()
+    if diversity_last is not None:
+        metrics["diversity_last"] = float(diversity_last)
+    if eval_cache is not None:
+        metrics["cache_hits"] = eval_cache.hits
+        metrics["cache_misses"] = eval_cache.misses
+        metrics["cache_hit_rate"] = eval_cache.hit_rate
+    if timers is not None:
+        metrics["phase_times"] = timers.snapshot()
+    if penalties is not None:
+        metrics["penalty_capacity"] = penalties.capacity
+        metrics["penalty_duration"] = penalties.duration
+        metrics["feasible_ratio_last"] = penalties.feasible_ratio
+        metrics["infeasible_pop_last"] = len(infeasible_pop)
+    if trace is not None:
+        metrics["convergence"] = trace
     return best, metrics
\ No newline at end of file
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+hashing.py
+Empreintes 64 bits des solutions et table bornée pour la détection de doublons du GA:
+- clé 64 bits par route (hash de CPython sur le tuple de clients: bien mélangé, calculé en C)
+- empreinte d'une solution = somme des clés de routes mod 2^64 (combinaison commutative façon Zobrist)
+  -> indépendante de l'ordre des routes, aucune structure conservée par solution
+- GenerationalHashSet: table à adressage ouvert de taille fixe (array 'Q'), chaque entrée porte sa
+  génération d'insertion; les entrées plus vieilles que max_age générations sont considérées libres
+  et sont écrasées en priorité (éviction générationnelle, mémoire constante)
+- EvalCache: cache LRU borné des évaluations (routes, coût) indexé par l'empreinte de la permutation
+"""
+
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from typing import List, Tuple
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = -(1 << 62)  # génération d'une case jamais utilisée
+
+
+def solution_hash(routes: List[List[int]]) -> int:
+    """Empreinte 64 bits d'une solution: somme mod 2^64 des clés de ses routes non vides."""
+    return sum(map(hash, map(tuple, filter(None, routes)))) & _MASK64
+
+
+def perm_hash(perm: List[int]) -> int:
+    """Empreinte 64 bits d'une permutation (giant tour)."""
+    return hash(tuple(perm)) & _MASK64
+
+
+class GenerationalHashSet:
+    """
+    Ensemble borné d'empreintes 64 bits (taille fixe, puissance de 2).
+    - tick(): passe à la génération suivante
+    - h in s / s.add(h): O(probes), sans allocation de structure
+    - une entrée vit max_age générations (rafraîchie si ré-ajoutée); si les `probes` cases sondées
+      sont toutes vivantes, la plus ancienne est écrasée
+    """
+
+    __slots__ = ("_keys", "_gens", "_mask", "_probes", "max_age", "gen")
+
+    def __init__(self, capacity: int = 1 << 16, max_age: int = 100, probes: int = 8):
+        size = 1
+        while size < max(16, int(capacity)):
+            size <<= 1
+        self._keys = array("Q", bytes(8 * size))
+        self._gens = array("q", [_EMPTY]) * size
+        self._mask = size - 1
+        self._probes = max(1, min(int(probes), size))
+        self.max_age = max(0, int(max_age))
+        self.gen = 0
+
+    def tick(self) -> None:
+        self.gen += 1
+
+    def clear(self) -> None:
+        self._gens = array("q", [_EMPTY]) * len(self._gens)
+
+    def getstate(self) -> tuple:
+        """(gen, max_age, probes, clés, générations) en octets, pour les checkpoints."""
+        return self.gen, self.max_age, self._probes, self._keys.tobytes(), self._gens.tobytes()
+
+    def setstate(self, state: tuple) -> None:
+        gen, max_age, probes, keys, gens = state
+        self._keys = array("Q")
+        self._keys.frombytes(keys)
+        self._gens = array("q")
+        self._gens.frombytes(gens)
+        self._mask = len(self._keys) - 1
+        self._probes = int(probes)
+        self.max_age = int(max_age)
+        self.gen = int(gen)
+
+    def __contains__(self, h: int) -> bool:
+        keys = self._keys
+        gens = self._gens
+        oldest_ok = self.gen - self.max_age
+        i = h & self._mask
+        for _ in range(self._probes):
+            if gens[i] >= oldest_ok and keys[i] == h:
+                return True
+            i = (i + 1) & self._mask
+        return False
+
+    def add(self, h: int) -> None:
+        keys = self._keys
+        gens = self._gens
+        oldest_ok = self.gen - self.max_age
+        i = h & self._mask
+        victim = i
+        for _ in range(self._probes):
+            g = gens[i]
+            if g >= oldest_ok and keys[i] == h:
+                gens[i] = self.gen
+                return
+            if g < gens[victim]:
+                victim = i
+            i = (i + 1) & self._mask
+        keys[victim] = h
+        gens[victim] = self.gen
+
+
+class EvalCache:
+    """
+    Cache LRU des évaluations: empreinte de perm -> (perm réécrite | None, routes, coût, éduquée).
+    - educated: True si les routes ont reçu le 2-opt/VND probabiliste; une recherche qui exige
+      l'éducation (tirage 2-opt positif) ignore une entrée non éduquée
+    - les routes sont copiées à l'entrée et à la sortie (le cache ne partage rien avec la population)
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "_data")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(
+        self, key: int, need_educated: bool = False,
+    ) -> Tuple[List[int] | None, List[List[int]], int] | None:
+        entry = self._data.get(key)
+        if entry is None or (need_educated and not entry[3]):
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        perm_out, routes, cost, _ = entry
+        return (list(perm_out) if perm_out is not None else None), [list(r) for r in routes], cost
+
+    def put(
+        self,
+        key: int,
+        perm_out: List[int] | None,
+        routes: List[List[int]],
+        cost: int,
+        educated: bool,
+    ) -> None:
+        old = self._data.get(key)
+        if old is not None and old[3] and not educated:
+            self._data.move_to_end(key)
+            return
+        self._data[key] = (
+            tuple(perm_out) if perm_out is not None else None,
+            tuple(tuple(r) for r in routes),
+            cost,
+            educated,
+        )
+        self._data.move_to_end(key)
+        if len(self._data) > self.capacity:
+            self._data.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
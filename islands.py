@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+islands.py
+Modèle en îles pour le GA: N populations genetic_algorithm indépendantes, une par processus.
+- Migration toutes les migration_interval générations: les meilleurs individus de chaque île
+  sont envoyés (file multiprocessing) vers les îles voisines selon la topologie
+  ("ring", "bidi_ring", "full" ou "random"); à la réception ils remplacent les pires individus
+- Une seule limite de temps globale (échéance commune) et un seul fichier sentinelle pour toutes les îles
+- Ctrl+C ou arrêt d'une île sur fichier sentinelle: toutes les îles s'arrêtent proprement
+
+Retourne le meilleur Individual toutes îles confondues (ou (best, metrics) si return_metrics=True).
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List
+import multiprocessing as mp
+import queue
+import random
+import time
+
+from cvrp_data import CVRPInstance
+from ga import Individual, genetic_algorithm
+
+TOPOLOGIES = ("ring", "bidi_ring", "full", "random")
+
+
+def migration_targets(topology: str, idx: int, n: int, rng: random.Random) -> List[int]:
+    """Îles destinataires des migrants de l'île idx (n îles au total)."""
+    if n <= 1:
+        return []
+    if topology == "ring":
+        return [(idx + 1) % n]
+    if topology == "bidi_ring":
+        return sorted({(idx + 1) % n, (idx - 1) % n})
+    if topology == "full":
+        return [j for j in range(n) if j != idx]
+    if topology == "random":
+        return [rng.choice([j for j in range(n) if j != idx])]
+    raise ValueError(f"Topologie inconnue: '{topology}'. Autorisées: {', '.join(TOPOLOGIES)}")
+
+
+def make_migration_hook(
+    send: Callable[[List[tuple]], None],
+    receive: Callable[[], List[tuple]],
+    migration_interval: int,
+    migrants: int,
+) -> Callable[[int, List[Individual]], List[Individual]]:
+    """
+    Construit le migration_hook passé à genetic_algorithm:
+    - toutes les migration_interval générations, send() reçoit les migrants (perm, routes, cost)
+    - à chaque génération, receive() retourne les migrants arrivés (éventuellement aucun)
+    """
+    interval = max(1, int(migration_interval))
+    k = max(1, int(migrants))
+
+    def hook(gen: int, pop: List[Individual]) -> List[Individual]:
+        if gen % interval == 0:
+            send([(ind.perm[:], [list(r) for r in ind.iter_routes()], ind.cost) for ind in pop[:k]])
+        return [Individual(list(p), [list(r) for r in routes], int(c)) for p, routes, c in receive()]
+
+    return hook
+
+
+def _island_main(
+    idx: int,
+    inst: CVRPInstance,
+    inboxes: List[Any],
+    results: Any,
+    stop_event: Any,
+    deadline: float,
+    topology: str,
+    migration_interval: int,
+    migrants: int,
+    ga_kwargs: Dict[str, Any],
+) -> None:
+    """Corps d'un processus île: GA avec migration, puis envoi du meilleur individu au parent."""
+    n = len(inboxes)
+    rng = random.Random(ga_kwargs.get("seed"))
+    for q in inboxes:
+        # Les migrants non lus à la fin ne doivent pas bloquer la sortie du processus
+        q.cancel_join_thread()
+    sent = [0]
+    received = [0]
+
+    def send(batch: List[tuple]) -> None:
+        for j in migration_targets(topology, idx, n, rng):
+            inboxes[j].put(batch)
+        sent[0] += len(batch)
+
+    def receive() -> List[tuple]:
+        out: List[tuple] = []
+        while True:
+            try:
+                out.extend(inboxes[idx].get_nowait())
+            except queue.Empty:
+                break
+        received[0] += len(out)
+        return out
+
+    kwargs = dict(ga_kwargs)
+    kwargs["time_limit_sec"] = max(0.1, deadline - time.time()) if deadline else 0.0
+    best = None
+    metrics: Dict[str, object] = {}
+    try:
+        best, metrics = genetic_algorithm(
+            inst,
+            stop_check=stop_event.is_set,
+            migration_hook=make_migration_hook(send, receive, migration_interval, migrants),
+            return_metrics=True,
+            **kwargs,
+        )
+        if metrics.get("stopped_by") in ("file", "keyboard"):
+            stop_event.set()
+    finally:
+        metrics["migrants_sent"] = sent[0]
+        metrics["migrants_received"] = received[0]
+        results.put((idx, best, metrics))
+
+
+def island_model(
+    inst: CVRPInstance,
+    islands: int = 4,
+    migration_interval: int = 50,
+    migrants: int = 2,
+    topology: str = "ring",
+    seed: int | None = 1,
+    time_limit_sec: float = 170.0,
+    stop_on_file: str | None = None,
+    verbose: bool = True,
+    return_metrics: bool = False,
+    **ga_kwargs,
+):
+    """
+    Lance `islands` GA en parallèle (un processus par île, graines seed, seed+1, ...).
+    ga_kwargs: autres paramètres de genetic_algorithm (pop_size, pm, pc, contraintes de temps, ...).
+    Seule l'île 0 est verbeuse si verbose=True.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Topologie inconnue: '{topology}'. Autorisées: {', '.join(TOPOLOGIES)}")
+    n = max(1, int(islands))
+    start_time = time.time()
+    deadline = start_time + time_limit_sec if time_limit_sec else 0.0
+
+    inboxes = [mp.Queue() for _ in range(n)]
+    results = mp.Queue()
+    stop_event = mp.Event()
+    procs = []
+    for i in range(n):
+        kw = dict(ga_kwargs)
+        kw.update(
+            seed=None if seed is None else seed + i,
+            stop_on_file=stop_on_file,
+            verbose=verbose and i == 0,
+        )
+        p = mp.Process(
+            target=_island_main,
+            args=(i, inst, inboxes, results, stop_event, deadline, topology, migration_interval, migrants, kw),
+        )
+        p.start()
+        procs.append(p)
+    if verbose:
+        print(f"[Islands] {n} îles lancées | topologie={topology} | migration toutes les {migration_interval} gen ({migrants} migrants)", flush=True)
+
+    collected: Dict[int, tuple] = {}
+    stopped_by = None
+    while len(collected) < n:
+        try:
+            idx, ind, m = results.get(timeout=0.5)
+            collected[idx] = (ind, m)
+        except queue.Empty:
+            if not any(p.is_alive() for p in procs) and results.empty():
+                break
+        except KeyboardInterrupt:
+            stopped_by = "keyboard"
+            stop_event.set()
+            if verbose:
+                print("[Islands] Ctrl+C: arrêt de toutes les îles...", flush=True)
+    for p in procs:
+        p.join()
+
+    finished = [(i, ind, m) for i, (ind, m) in sorted(collected.items()) if ind is not None]
+    if not finished:
+        raise RuntimeError("Aucune île n'a retourné de solution.")
+    best_idx, best, _ = min(finished, key=lambda t: t[1].cost)
+
+    if verbose:
+        for i, ind, m in finished:
+            print(
+                f"[Islands] Île {i}: best={ind.cost} | gen={m.get('generations_done')} | "
+                f"migrants envoyés/reçus={m.get('migrants_sent')}/{m.get('migrants_received')}",
+                flush=True,
+            )
+        print(f"[Islands] Terminé après {time.time() - start_time:.1f}s. Meilleur coût: {best.cost} (île {best_idx})", flush=True)
+
+    if not return_metrics:
+        return best
+
+    if stopped_by is None:
+        reasons = [m.get("stopped_by") for _, _, m in finished]
+        stopped_by = next((r for r in reasons if r in ("file", "keyboard")), reasons[0])
+    metrics: Dict[str, object] = {
+        "elapsed_sec": time.time() - start_time,
+        "generations_done": sum(int(m.get("generations_done") or 0) for _, _, m in finished),
+        "stopped_by": stopped_by,
+        "best_cost": best.cost,
+        "avg_cost_last": sum(float(m.get("avg_cost_last") or 0.0) for _, _, m in finished) / len(finished),
+        "routes_best": len(best.routes),
+        "pm_eff_last": None,
+        "two_opt_prob_eff_last": None,
+        "islands": n,
+        "island_best_costs": [ind.cost for _, ind, _ in finished],
+        "best_island": best_idx,
+        "migrants_sent": sum(int(m.get("migrants_sent") or 0) for _, _, m in finished),
+    }
+    return best, metrics
@@ -6,12 +6,95 @@ localsearch.py
 Optimisation:
 - Calcul de delta-coût O(1) pour chaque mouvement 2-opt
 - Application in-place des inversions, "first improvement" avec redémarrage
+
+Optimisation exacte des petites routes (Held-Karp):
+- DP sur sous-ensembles (bitmask) pour les routes courtes (<= HELD_KARP_MAX_SIZE clients)
+- JIT Numba si disponible, sinon fallback Python
+- Mémoïsation sur l'ensemble des clients: chaque ensemble distinct n'est résolu qu'une fois
+- educate_routes: éducation route par route (Held-Karp si assez courte, sinon 2-opt),
+  partagée par ga.evaluate_perm et penalties.evaluate_perm_penalized
+
+VND (Variable Neighborhood Descent) configurable:
+- Opérateurs chaînés dans l'ordre choisi: 2opt, oropt (intra-route), relocate, swap, 2optstar (inter-routes)
+- Retour au premier opérateur dès qu'un opérateur améliore
+- Budget par appel (nombre de mouvements et/ou temps), compteurs par opérateur
+
+Recherche locale sur la giant tour (avant split):
+- 2-opt et Or-opt sur la permutation vue comme un chemin TSP sans dépôt
+- Restreints aux k plus proches voisins de chaque client, JIT Numba si disponible
 """
 
 from __future__ import annotations
-from typing import List
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+import re
+import time
 from cvrp_data import CVRPInstance
 
+# Taille max acceptée par Held-Karp (mémoire O(2^m * m))
+HELD_KARP_MAX_SIZE = 16
+# Borne du cache de mémoïsation par instance (vidé s'il déborde)
+_HK_CACHE_MAX = 200_000
+
+# ======== Option accélérée via Numba (auto si dispo) ========
+_NUMBA_AVAILABLE = False
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _held_karp_numba(nodes: np.ndarray, dist: np.ndarray, depot: int) -> np.ndarray:
+        """
+        Held-Karp: dp[mask, k] = coût min dépôt -> (clients de mask) -> nodes[k].
+        Retourne l'ordre optimal des clients (indices d'instance).
+        """
+        m = nodes.shape[0]
+        full = 1 << m
+        INF = 10**15
+        dp = np.full((full, m), INF, dtype=np.int64)
+        parent = np.full((full, m), -1, dtype=np.int64)
+        for k in range(m):
+            dp[1 << k, k] = dist[depot, nodes[k]]
+
+        for mask in range(1, full):
+            for k in range(m):
+                if (mask >> k) & 1 == 0:
+                    continue
+                cur = dp[mask, k]
+                if cur >= INF:
+                    continue
+                a = nodes[k]
+                for nx in range(m):
+                    if (mask >> nx) & 1:
+                        continue
+                    nmask = mask | (1 << nx)
+                    val = cur + dist[a, nodes[nx]]
+                    if val < dp[nmask, nx]:
+                        dp[nmask, nx] = val
+                        parent[nmask, nx] = k
+
+        last_mask = full - 1
+        best = INF
+        last = 0
+        for k in range(m):
+            val = dp[last_mask, k] + dist[nodes[k], depot]
+            if val < best:
+                best = val
+                last = k
+
+        order = np.empty(m, dtype=np.int64)
+        mask = last_mask
+        k = last
+        for pos in range(m - 1, -1, -1):
+            order[pos] = nodes[k]
+            pk = parent[mask, k]
+            mask ^= 1 << k
+            k = pk
+        return order
+
+    _NUMBA_AVAILABLE = True
+except Exception:
+    _NUMBA_AVAILABLE = False
+
 
 def route_cost_with_depot(route: List[int], inst: CVRPInstance) -> int:
     """
@@ -84,4 +167,650 @@ def two_opt_route(route: List[int], inst: CVRPInstance) -> List[int]:
             if improved:
                 break
 
-    return r
\ No newline at end of file
+    return r
+
+
+def _held_karp_python(route: List[int], inst: CVRPInstance) -> List[int]:
+    """
+    Fallback pur Python du DP Held-Karp (mêmes conventions que la version Numba).
+    """
+    d = inst.dist
+    depot = inst.depot_index
+    m = len(route)
+    full = 1 << m
+    INF = 10 ** 18
+    dp = [[INF] * m for _ in range(full)]
+    parent = [[-1] * m for _ in range(full)]
+    for k in range(m):
+        dp[1 << k][k] = d[depot][route[k]]
+
+    for mask in range(1, full):
+        row = dp[mask]
+        for k in range(m):
+            cur = row[k]
+            if cur >= INF or not (mask >> k) & 1:
+                continue
+            dk = d[route[k]]
+            for nx in range(m):
+                if (mask >> nx) & 1:
+                    continue
+                nmask = mask | (1 << nx)
+                val = cur + dk[route[nx]]
+                if val < dp[nmask][nx]:
+                    dp[nmask][nx] = val
+                    parent[nmask][nx] = k
+
+    last_mask = full - 1
+    last = min(range(m), key=lambda k: dp[last_mask][k] + d[route[k]][depot])
+    order = [0] * m
+    mask = last_mask
+    k = last
+    for pos in range(m - 1, -1, -1):
+        order[pos] = route[k]
+        pk = parent[mask][k]
+        mask ^= 1 << k
+        k = pk
+    return order
+
+
+def held_karp_route(route: List[int], inst: CVRPInstance) -> List[int]:
+    """
+    Ordre optimal (TSP exact dépôt -> clients -> dépôt) d'une route courte, par DP Held-Karp.
+    - Mémoïsé sur l'ensemble des clients (frozenset): un ensemble déjà vu est servi depuis le cache.
+    - Les routes plus longues que HELD_KARP_MAX_SIZE sont renvoyées telles quelles (copie).
+    """
+    n = len(route)
+    if n < 3 or n > HELD_KARP_MAX_SIZE:
+        return route[:]  # trivial (ou trop long pour le DP)
+
+    cache: Dict[FrozenSet[int], Tuple[int, ...]] | None = getattr(inst, "_hk_cache", None)
+    if cache is None:
+        cache = {}
+        inst._hk_cache = cache  # type: ignore[attr-defined]
+    key = frozenset(route)
+    hit = cache.get(key)
+    if hit is not None:
+        return list(hit)
+
+    if _NUMBA_AVAILABLE:
+        if not hasattr(inst, "_dist_np"):
+            inst._dist_np = np.asarray(inst.dist, dtype=np.int64)  # type: ignore[attr-defined]
+        nodes = np.asarray(route, dtype=np.int64)
+        order = [int(x) for x in _held_karp_numba(nodes, inst._dist_np, int(inst.depot_index))]  # type: ignore[attr-defined]
+    else:
+        order = _held_karp_python(route, inst)
+
+    # Ne jamais dégrader: en cas d'égalité on garde l'ordre courant
+    if route_cost_with_depot(order, inst) >= route_cost_with_depot(route, inst):
+        order = route[:]
+    if len(cache) >= _HK_CACHE_MAX:
+        cache.clear()
+    cache[key] = tuple(order)
+    return order
+
+
+def educate_routes(
+    routes: List[List[int]],
+    inst: CVRPInstance,
+    do_2opt: bool,
+    exact_route_max: int = 0,
+) -> List[List[int]]:
+    """
+    Éducation intra-route: les routes de 3 à min(exact_route_max, HELD_KARP_MAX_SIZE) clients
+    prennent leur ordre exact (Held-Karp mémoïsé), les autres le 2-opt si do_2opt (>= 4 clients).
+    Retourne une nouvelle liste (routes inchangées si rien à faire).
+    """
+    hk_max = min(exact_route_max, HELD_KARP_MAX_SIZE)
+    if not do_2opt and hk_max < 3:
+        return routes
+    new_routes: List[List[int]] = []
+    for r in routes:
+        if 3 <= len(r) <= hk_max:
+            # route courte: ordre exact (cache partagé par instance)
+            new_routes.append(held_karp_route(r, inst))
+        elif do_2opt and len(r) >= 4:
+            # 2-opt intra-route seulement pour routes non triviales
+            new_routes.append(two_opt_route(r, inst))
+        else:
+            new_routes.append(r)
+    return new_routes
+
+
+
+# ===================== VND (Variable Neighborhood Descent) =====================
+
+VND_OPERATORS = ("2opt", "oropt", "relocate", "swap", "2optstar")
+DEFAULT_VND_OPERATORS = ("2opt", "oropt", "relocate", "swap")
+
+
+class _VNDContext:
+    """
+    État partagé par les opérateurs d'un appel VND:
+    charges et distances par route, contrainte de durée, budget (mouvements/temps).
+    """
+
+    def __init__(
+        self,
+        routes: List[List[int]],
+        inst: CVRPInstance,
+        max_moves: int,
+        time_budget_sec: float,
+        time_limit_hours: float,
+        avg_speed_units_per_hour: float,
+        unload_time_minutes: float,
+    ):
+        self.inst = inst
+        self.d = inst.dist
+        self.depot = inst.depot_index
+        self.dem = inst.demands
+        self.capacity = inst.capacity
+        self.routes = routes
+        self.loads = [sum(self.dem[c] for c in r) for r in routes]
+        self.lengths = [route_cost_with_depot(r, inst) for r in routes]
+        self.moves = 0
+        self.max_moves = max_moves
+        self.deadline = time.perf_counter() + time_budget_sec if time_budget_sec > 0.0 else 0.0
+        # Durée max d'une tournée: distance / vitesse + déchargements (en heures)
+        self.time_limit_hours = time_limit_hours
+        self.speed = avg_speed_units_per_hour if avg_speed_units_per_hour > 0.0 else 1.0
+        self.unload_hours = unload_time_minutes / 60.0
+
+    def exhausted(self) -> bool:
+        if self.max_moves > 0 and self.moves >= self.max_moves:
+            return True
+        return self.deadline > 0.0 and time.perf_counter() >= self.deadline
+
+    def duration_ok(self, length: int, n_clients: int) -> bool:
+        if self.time_limit_hours <= 0.0:
+            return True
+        return length / self.speed + n_clients * self.unload_hours <= self.time_limit_hours
+
+    def commit(self, a: int, b: int | None = None) -> None:
+        """Recalcule charges/longueurs des routes modifiées et compte le mouvement."""
+        for k in (a, b):
+            if k is None:
+                continue
+            r = self.routes[k]
+            self.loads[k] = sum(self.dem[c] for c in r)
+            self.lengths[k] = route_cost_with_depot(r, self.inst)
+        self.moves += 1
+
+
+def _vnd_two_opt(ctx: _VNDContext) -> int:
+    """2-opt intra-route sur chaque route (descente complète par route)."""
+    applied = 0
+    for k, r in enumerate(ctx.routes):
+        if ctx.exhausted():
+            break
+        if len(r) < 4:
+            continue
+        nr = two_opt_route(r, ctx.inst)
+        new_len = route_cost_with_depot(nr, ctx.inst)
+        if new_len < ctx.lengths[k]:
+            ctx.routes[k] = nr
+            ctx.commit(k)
+            applied += 1
+    return applied
+
+
+def _vnd_or_opt(ctx: _VNDContext) -> int:
+    """
+    Or-opt intra-route: déplace un segment de 1 à 3 clients (éventuellement inversé)
+    à une autre position de la même route. First improvement avec redémarrage.
+    """
+    d = ctx.d
+    depot = ctx.depot
+    applied = 0
+    for k in range(len(ctx.routes)):
+        improved = True
+        while improved and not ctx.exhausted():
+            improved = False
+            r = ctx.routes[k]
+            n = len(r)
+            if n < 3:
+                break
+            ext = [depot] + r + [depot]
+            for seg_len in (1, 2, 3):
+                for i in range(1, n - seg_len + 2):
+                    s0 = ext[i]
+                    sl = ext[i + seg_len - 1]
+                    prev = ext[i - 1]
+                    nxt = ext[i + seg_len]
+                    gain = d[prev][s0] + d[sl][nxt] - d[prev][nxt]
+                    for j in range(0, n + 1):
+                        # insertion entre ext[j] et ext[j+1], hors du segment
+                        if i - 1 <= j <= i + seg_len - 1:
+                            continue
+                        a = ext[j]
+                        b = ext[j + 1]
+                        add = d[a][s0] + d[sl][b] - d[a][b]
+                        add_rev = d[a][sl] + d[s0][b] - d[a][b]
+                        rev = add_rev < add
+                        if min(add, add_rev) - gain < 0:
+                            seg = r[i - 1:i - 1 + seg_len]
+                            if rev:
+                                seg.reverse()
+                            rest = r[:i - 1] + r[i - 1 + seg_len:]
+                            # position d'insertion dans 'rest' (indices de r décalés si j après le segment)
+                            pos = j if j < i - 1 else j - seg_len
+                            ctx.routes[k] = rest[:pos] + seg + rest[pos:]
+                            ctx.commit(k)
+                            applied += 1
+                            improved = True
+                            break
+                    if improved:
+                        break
+                if improved:
+                    break
+    return applied
+
+
+def _vnd_relocate(ctx: _VNDContext) -> int:
+    """
+    Relocate inter-routes: déplace un client vers la meilleure position d'une autre route
+    (capacité et durée respectées). Les routes vidées sont supprimées.
+    """
+    d = ctx.d
+    depot = ctx.depot
+    dem = ctx.dem
+    applied = 0
+    improved = True
+    while improved and not ctx.exhausted():
+        improved = False
+        routes = ctx.routes
+        for ka in range(len(routes)):
+            ra = routes[ka]
+            for i, u in enumerate(ra):
+                p = depot if i == 0 else ra[i - 1]
+                nx = depot if i == len(ra) - 1 else ra[i + 1]
+                gain = d[p][u] + d[u][nx] - d[p][nx]
+                for kb in range(len(routes)):
+                    if kb == ka or ctx.loads[kb] + dem[u] > ctx.capacity:
+                        continue
+                    rb = routes[kb]
+                    best_add = None
+                    best_j = -1
+                    for j in range(len(rb) + 1):
+                        a = depot if j == 0 else rb[j - 1]
+                        b = depot if j == len(rb) else rb[j]
+                        add = d[a][u] + d[u][b] - d[a][b]
+                        if best_add is None or add < best_add:
+                            best_add = add
+                            best_j = j
+                    if best_add is None or best_add - gain >= 0:
+                        continue
+                    if not ctx.duration_ok(ctx.lengths[kb] + best_add, len(rb) + 1):
+                        continue
+                    rb.insert(best_j, u)
+                    del ra[i]
+                    if ra:
+                        ctx.commit(ka, kb)
+                    else:
+                        ctx.commit(kb)
+                        del routes[ka], ctx.loads[ka], ctx.lengths[ka]
+                    applied += 1
+                    improved = True
+                    break
+                if improved:
+                    break
+            if improved:
+                break
+    return applied
+
+
+def _vnd_swap(ctx: _VNDContext) -> int:
+    """Swap inter-routes: échange deux clients de routes différentes (capacité et durée respectées)."""
+    d = ctx.d
+    depot = ctx.depot
+    dem = ctx.dem
+    applied = 0
+    improved = True
+    while improved and not ctx.exhausted():
+        improved = False
+        routes = ctx.routes
+        for ka in range(len(routes)):
+            ra = routes[ka]
+            for i, u in enumerate(ra):
+                pu = depot if i == 0 else ra[i - 1]
+                nu = depot if i == len(ra) - 1 else ra[i + 1]
+                for kb in range(ka + 1, len(routes)):
+                    rb = routes[kb]
+                    load_a = ctx.loads[ka] - dem[u]
+                    load_b = ctx.loads[kb] + dem[u]
+                    for j, v in enumerate(rb):
+                        if load_a + dem[v] > ctx.capacity or load_b - dem[v] > ctx.capacity:
+                            continue
+                        pv = depot if j == 0 else rb[j - 1]
+                        nv = depot if j == len(rb) - 1 else rb[j + 1]
+                        delta_a = d[pu][v] + d[v][nu] - d[pu][u] - d[u][nu]
+                        delta_b = d[pv][u] + d[u][nv] - d[pv][v] - d[v][nv]
+                        if delta_a + delta_b >= 0:
+                            continue
+                        if not (ctx.duration_ok(ctx.lengths[ka] + delta_a, len(ra))
+                                and ctx.duration_ok(ctx.lengths[kb] + delta_b, len(rb))):
+                            continue
+                        ra[i], rb[j] = v, u
+                        ctx.commit(ka, kb)
+                        applied += 1
+                        improved = True
+                        break
+                    if improved:
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return applied
+
+
+def _vnd_two_opt_star(ctx: _VNDContext) -> int:
+    """
+    2-opt* inter-routes: échange les fins de deux routes
+    A = a[:i] + b[j:], B = b[:j] + a[i:] (capacité et durée respectées).
+    """
+    d = ctx.d
+    depot = ctx.depot
+    dem = ctx.dem
+    applied = 0
+    improved = True
+    while improved and not ctx.exhausted():
+        improved = False
+        routes = ctx.routes
+        for ka in range(len(routes)):
+            ra = routes[ka]
+            pre_a = [0]
+            for c in ra:
+                pre_a.append(pre_a[-1] + dem[c])
+            for kb in range(ka + 1, len(routes)):
+                rb = routes[kb]
+                pre_b = [0]
+                for c in rb:
+                    pre_b.append(pre_b[-1] + dem[c])
+                for i in range(len(ra) + 1):
+                    a1 = depot if i == 0 else ra[i - 1]
+                    a2 = depot if i == len(ra) else ra[i]
+                    for j in range(len(rb) + 1):
+                        if (i == 0 and j == 0) or (i == len(ra) and j == len(rb)):
+                            continue  # échange complet des routes: sans effet
+                        b1 = depot if j == 0 else rb[j - 1]
+                        b2 = depot if j == len(rb) else rb[j]
+                        delta = d[a1][b2] + d[b1][a2] - d[a1][a2] - d[b1][b2]
+                        if delta >= 0:
+                            continue
+                        load_a = pre_a[i] + pre_b[-1] - pre_b[j]
+                        load_b = pre_b[j] + pre_a[-1] - pre_a[i]
+                        if load_a > ctx.capacity or load_b > ctx.capacity:
+                            continue
+                        na = ra[:i] + rb[j:]
+                        nb = rb[:j] + ra[i:]
+                        if ctx.time_limit_hours > 0.0 and not (
+                            ctx.duration_ok(route_cost_with_depot(na, ctx.inst), len(na))
+                            and ctx.duration_ok(route_cost_with_depot(nb, ctx.inst), len(nb))
+                        ):
+                            continue
+                        routes[ka], routes[kb] = na, nb
+                        ctx.commit(ka, kb)
+                        for k in sorted((ka, kb), reverse=True):
+                            if not routes[k]:
+                                del routes[k], ctx.loads[k], ctx.lengths[k]
+                        applied += 1
+                        improved = True
+                        break
+                    if improved:
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return applied
+
+
+_VND_IMPL = {
+    "2opt": _vnd_two_opt,
+    "oropt": _vnd_or_opt,
+    "relocate": _vnd_relocate,
+    "swap": _vnd_swap,
+    "2optstar": _vnd_two_opt_star,
+}
+
+
+def parse_vnd_operators(spec: str | Sequence[str] | None) -> Tuple[str, ...]:
+    """
+    Normalise une liste d'opérateurs VND ("2opt,oropt,relocate", "2opt+relocate" ou séquence).
+    Lève ValueError si un opérateur est inconnu.
+    """
+    if spec is None:
+        return ()
+    if isinstance(spec, str):
+        names = [x.strip().lower() for x in re.split(r"[,+]", spec) if x.strip()]
+    else:
+        names = [str(x).strip().lower() for x in spec]
+    for name in names:
+        if name not in _VND_IMPL:
+            raise ValueError(f"Opérateur VND inconnu: '{name}'. Autorisés: {', '.join(VND_OPERATORS)}")
+    return tuple(names)
+
+
+def vnd_routes(
+    routes: List[List[int]],
+    inst: CVRPInstance,
+    operators: Sequence[str] = DEFAULT_VND_OPERATORS,
+    max_moves: int = 0,
+    time_budget_sec: float = 0.0,
+    time_limit_hours: float = 0.0,
+    avg_speed_units_per_hour: float = 1.0,
+    unload_time_minutes: float = 0.0,
+) -> Tuple[List[List[int]], Dict[str, int]]:
+    """
+    VND: applique les opérateurs dans l'ordre donné; dès qu'un opérateur améliore,
+    on repart du premier. S'arrête à l'optimum local commun ou quand le budget est épuisé.
+    - max_moves: nombre max de mouvements améliorants par appel (0 = illimité)
+    - time_budget_sec: temps max par appel (0 = illimité)
+    - time_limit_hours/avg_speed/unload: contrainte de durée par tournée (0 = pas de limite)
+    Retourne (routes améliorées, compteurs {opérateur: mouvements appliqués}).
+    Les routes d'entrée ne sont pas modifiées.
+    """
+    ops = parse_vnd_operators(operators)
+    counters: Dict[str, int] = {name: 0 for name in ops}
+    ctx = _VNDContext(
+        [r[:] for r in routes if r], inst, max_moves, time_budget_sec,
+        time_limit_hours, avg_speed_units_per_hour, unload_time_minutes,
+    )
+    k = 0
+    while k < len(ops) and not ctx.exhausted():
+        applied = _VND_IMPL[ops[k]](ctx)
+        if applied > 0:
+            counters[ops[k]] += applied
+            k = 0
+        else:
+            k += 1
+    return ctx.routes, counters
+
+
+
+# ===================== Recherche locale sur la giant tour =====================
+
+def customer_neighbors(inst: CVRPInstance, k: int) -> List[List[int]]:
+    """
+    Pour chaque client, ses k clients les plus proches (hors dépôt), triés par distance.
+    Caché sur l'instance (recalculé si k change).
+    """
+    cached = getattr(inst, "_customer_neighbors", None)
+    if cached is not None and cached[0] == k:
+        return cached[1]
+    depot = inst.depot_index
+    d = inst.dist
+    clients = [i for i in range(inst.dimension) if i != depot]
+    neigh: List[List[int]] = [[] for _ in range(inst.dimension)]
+    for c in clients:
+        row = d[c]
+        others = sorted((j for j in clients if j != c), key=row.__getitem__)
+        neigh[c] = others[:k]
+    inst._customer_neighbors = (k, neigh)  # type: ignore[attr-defined]
+    return neigh
+
+
+def _giant_tour_ls_core(p, pos, buf, neigh, dist, max_passes):
+    """
+    2-opt + Or-opt (segments de 1 à 3) sur le chemin p (sans dépôt), in-place, first improvement.
+    Les candidats sont restreints aux voisins (listes triées par distance, coupure dès qu'aucun gain
+    n'est possible). Fonctionne sur listes Python comme sur tableaux numpy (compilé par Numba).
+    Retourne le nombre de mouvements appliqués.
+    """
+    n = len(p)
+    for i in range(n):
+        pos[p[i]] = i
+    moves = 0
+    passes = 0
+    improved = True
+    while improved and (max_passes <= 0 or passes < max_passes):
+        improved = False
+        passes += 1
+
+        # --- 2-opt: nouvelle arête (a, c) avec c voisin de a ---
+        for i in range(n - 1):
+            a = p[i]
+            b = p[i + 1]
+            dab = dist[a][b]
+            na = neigh[a]
+            for t in range(len(na)):
+                c = na[t]
+                dac = dist[a][c]
+                if dac >= dab:
+                    break
+                x = pos[c]
+                lo = -1
+                hi = -1
+                if x > i + 1:
+                    # inversion de p[i+1..x]: arêtes (a,c) et (b,e)
+                    if x + 1 < n:
+                        e = p[x + 1]
+                        delta = dac + dist[b][e] - dab - dist[c][e]
+                    else:
+                        delta = dac - dab
+                    if delta < 0:
+                        lo = i + 1
+                        hi = x
+                elif x < i:
+                    # inversion de p[x+1..i]: arêtes (c,a) et (e,b)
+                    e = p[x + 1]
+                    delta = dac + dist[e][b] - dist[c][e] - dab
+                    if delta < 0:
+                        lo = x + 1
+                        hi = i
+                if lo >= 0:
+                    while lo < hi:
+                        u = p[lo]
+                        p[lo] = p[hi]
+                        p[hi] = u
+                        pos[p[lo]] = lo
+                        pos[p[hi]] = hi
+                        lo += 1
+                        hi -= 1
+                    moves += 1
+                    improved = True
+                    break
+
+        # --- Or-opt: segment p[i..i+L-1] réinséré après un voisin c de son premier client ---
+        for seg_len in range(1, 4):
+            i = 0
+            while i + seg_len <= n:
+                s0 = p[i]
+                sl = p[i + seg_len - 1]
+                prev = p[i - 1] if i > 0 else -1
+                nxt = p[i + seg_len] if i + seg_len < n else -1
+                if prev >= 0 and nxt >= 0:
+                    gain = dist[prev][s0] + dist[sl][nxt] - dist[prev][nxt]
+                elif prev >= 0:
+                    gain = dist[prev][s0]
+                elif nxt >= 0:
+                    gain = dist[sl][nxt]
+                else:
+                    gain = 0
+                ns = neigh[s0]
+                for t in range(len(ns)):
+                    c = ns[t]
+                    if dist[c][s0] >= gain:
+                        break
+                    x = pos[c]
+                    if i - 1 <= x <= i + seg_len - 1:
+                        continue
+                    e = p[x + 1] if x + 1 < n else -1
+                    if e >= 0:
+                        add_fwd = dist[c][s0] + dist[sl][e] - dist[c][e]
+                        add_rev = dist[c][sl] + dist[s0][e] - dist[c][e]
+                    else:
+                        add_fwd = dist[c][s0]
+                        add_rev = dist[c][sl]
+                    rev = add_rev < add_fwd
+                    add = add_rev if rev else add_fwd
+                    if add - gain >= 0:
+                        continue
+                    for k in range(seg_len):
+                        buf[k] = p[i + seg_len - 1 - k] if rev else p[i + k]
+                    if x > i:
+                        # c après le segment: décalage à gauche puis insertion en fin
+                        for k in range(i + seg_len, x + 1):
+                            p[k - seg_len] = p[k]
+                        for k in range(seg_len):
+                            p[x - seg_len + 1 + k] = buf[k]
+                        lo = i
+                        hi = x
+                    else:
+                        # c avant le segment: décalage à droite puis insertion après c
+                        for k in range(i - 1, x, -1):
+                            p[k + seg_len] = p[k]
+                        for k in range(seg_len):
+                            p[x + 1 + k] = buf[k]
+                        lo = x + 1
+                        hi = i + seg_len - 1
+                    for k in range(lo, hi + 1):
+                        pos[p[k]] = k
+                    moves += 1
+                    improved = True
+                    break
+                i += 1
+    return moves
+
+
+_giant_tour_ls_jit = None
+if _NUMBA_AVAILABLE:
+    _giant_tour_ls_jit = njit(cache=True)(_giant_tour_ls_core)
+
+
+def giant_tour_local_search(
+    perm: List[int],
+    inst: CVRPInstance,
+    neighbors_k: int = 10,
+    max_passes: int = 0,
+) -> List[int]:
+    """
+    Améliore la giant tour elle-même (avant split): 2-opt + Or-opt restreints aux
+    neighbors_k plus proches voisins, sur le chemin des clients (dépôt retiré).
+    - max_passes: nombre max de passes complètes (0 = jusqu'à l'optimum local)
+    Retourne une nouvelle permutation (perm n'est pas modifiée).
+    """
+    n = len(perm)
+    if n < 4:
+        return perm[:]
+    neigh = customer_neighbors(inst, max(1, int(neighbors_k)))
+    if _giant_tour_ls_jit is not None:
+        if not hasattr(inst, "_dist_np"):
+            inst._dist_np = np.asarray(inst.dist, dtype=np.int64)  # type: ignore[attr-defined]
+        neigh_np = getattr(inst, "_customer_neighbors_np", None)
+        if neigh_np is None or neigh_np.shape[1] != len(neigh[perm[0]]):
+            width = min(len(r) for r in neigh if r)
+            neigh_np = np.zeros((inst.dimension, width), dtype=np.int64)
+            for c, r in enumerate(neigh):
+                if r:
+                    neigh_np[c, :] = r[:width]
+            inst._customer_neighbors_np = neigh_np  # type: ignore[attr-defined]
+        p = np.asarray(perm, dtype=np.int64)
+        pos = np.zeros(inst.dimension, dtype=np.int64)
+        buf = np.zeros(3, dtype=np.int64)
+        _giant_tour_ls_jit(p, pos, buf, neigh_np, inst._dist_np, int(max_passes))  # type: ignore[attr-defined]
+        return [int(x) for x in p]
+
+    p = perm[:]
+    _giant_tour_ls_core(p, [0] * inst.dimension, [0, 0, 0], neigh, inst.dist, int(max_passes))
+    return p
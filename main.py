@@ -14,6 +14,9 @@ import sys
 
 from cvrp_data import load_cvrp_instance, CVRPInstance, load_cvrp_from_vrplib
 from ga import genetic_algorithm
+from sisr import sisr_solve
+from islands import island_model
+from distributed import run_coordinator
 from solution import verify_solution, solution_total_cost, write_solution_text
 
 # Multi-dépôts
@@ -31,6 +34,8 @@ pathfile = "data3.vrp"  # fichier par défaut s'il n'y en a pas d'autre
 TARGET_OPTIMUM: int | None = 58578
 STOP_SENTINEL_FILE: str | None = None
 
+SOLVERS = ("ga", "sisr", "islands", "distributed")
+
 
 def resolve_instance_path(cli_value: str | None) -> str | None:
     """
@@ -127,6 +132,19 @@ def main(
     route_time_limit_hours: float | None = None,
     avg_speed: float = 50.0,
     unload_time_minutes: float = 5.0,
+
+    # Solveur mono-dépôt: "ga" (algorithme génétique), "sisr" (ruin & recreate), "islands" (GA en îles)
+    # ou "distributed" (îles sur plusieurs machines, voir distributed.py)
+    solver: str = "ga",
+    islands: int = 4,
+    migration_interval: int = 50,
+    island_topology: str = "ring",
+    dist_host: str = "127.0.0.1",
+    dist_port: int = 5555,
+    dist_allow_all_interfaces: bool = False,
+
+    # Démarrage à chaud (solveur "ga"): .sol d'un run précédent (IDs originaux, clients ajoutés/retirés tolérés)
+    seed_solution: str | None = None,
 ):
     """
     Lance l'algo avec des paramètres passés directement à main pour faciliter les tests rapides.
@@ -135,7 +153,16 @@ def main(
     - route_time_limit_hours: durée maximale d'une tournée en heures (None = pas de limite)
     - avg_speed: vitesse moyenne des véhicules en unités de distance par heure
     - unload_time_minutes: temps de déchargement par client en minutes
+    - solver: "ga" (défaut), "sisr" (ruin & recreate SISR, voir sisr.py) ou "islands" (voir islands.py)
+    - islands / migration_interval / island_topology: réglages du modèle en îles
+    - solver="distributed": coordinateur en écoute sur dist_host:dist_port, attend `islands` workers
+      (lancés avec: python distributed.py --host <ip> --port <port>). Par défaut en local (127.0.0.1):
+      donner l'IP de la machine pour des workers distants, "0.0.0.0" exige dist_allow_all_interfaces=True
+    - seed_solution: fichier .sol (ex: plan de la veille) injecté dans la population initiale du GA
     """
+    if solver not in SOLVERS:
+        raise ValueError(f"Solveur inconnu: '{solver}'. Autorisés: {', '.join(SOLVERS)}")
+
     parser = argparse.ArgumentParser(description="CVRP - Exécution simple de l'algorithme génétique + plot")
     parser.add_argument("--instance", type=str, default=None)
     parser.add_argument("--name", type=str, default=None)
@@ -250,21 +277,80 @@ def main(
         return
 
     # MODE MONO-DÉPÔT avec contraintes de temps
-    best = genetic_algorithm(
-        inst,
-        pop_size=ps,
-        pm=pm,
-        pc=pc,
-        two_opt_prob=two_opt_prob,
-        use_2opt=use_2opt,
-        target_optimum=TARGET_OPTIMUM,
-        stop_on_file=STOP_SENTINEL_FILE,
-        init_mode=init_mode,
-        time_limit_sec=tl,
-        time_limit_hours=rtl,
-        avg_speed_units_per_hour=speed,
-        unload_time_minutes=unload,
-    )
+    if solver == "sisr":
+        print("[Run] Solveur: SISR (ruin & recreate)")
+        best = sisr_solve(
+            inst,
+            target_optimum=TARGET_OPTIMUM,
+            stop_on_file=STOP_SENTINEL_FILE,
+            time_limit_sec=tl,
+            time_limit_hours=rtl,
+            avg_speed_units_per_hour=speed,
+            unload_time_minutes=unload,
+        )
+    elif solver == "islands":
+        print(f"[Run] Solveur: GA en îles ({islands} processus, topologie={island_topology})")
+        best = island_model(
+            inst,
+            islands=islands,
+            migration_interval=migration_interval,
+            topology=island_topology,
+            pop_size=ps,
+            pm=pm,
+            pc=pc,
+            two_opt_prob=two_opt_prob,
+            use_2opt=use_2opt,
+            target_optimum=TARGET_OPTIMUM,
+            stop_on_file=STOP_SENTINEL_FILE,
+            init_mode=init_mode,
+            time_limit_sec=tl,
+            time_limit_hours=rtl,
+            avg_speed_units_per_hour=speed,
+            unload_time_minutes=unload,
+        )
+    elif solver == "distributed":
+        print(f"[Run] Solveur: îles distribuées (coordinateur {dist_host}:{dist_port}, {islands} workers attendus)")
+        best = run_coordinator(
+            inst,
+            host=dist_host,
+            port=dist_port,
+            allow_all_interfaces=dist_allow_all_interfaces,
+            workers=islands,
+            migration_interval=migration_interval,
+            topology=island_topology,
+            pop_size=ps,
+            pm=pm,
+            pc=pc,
+            two_opt_prob=two_opt_prob,
+            use_2opt=use_2opt,
+            target_optimum=TARGET_OPTIMUM,
+            init_mode=init_mode,
+            stop_on_file=STOP_SENTINEL_FILE,
+            time_limit_sec=tl,
+            time_limit_hours=rtl,
+            avg_speed_units_per_hour=speed,
+            unload_time_minutes=unload,
+        )
+    else:
+        if seed_solution:
+            print(f"[Run] Démarrage à chaud depuis: {seed_solution}")
+        best = genetic_algorithm(
+            inst,
+            pop_size=ps,
+            pm=pm,
+            pc=pc,
+            two_opt_prob=two_opt_prob,
+            use_2opt=use_2opt,
+            target_optimum=TARGET_OPTIMUM,
+            stop_on_file=STOP_SENTINEL_FILE,
+            init_mode=init_mode,
+            time_limit_sec=tl,
+            time_limit_hours=rtl,
+            avg_speed_units_per_hour=speed,
+            unload_time_minutes=unload,
+            seed_solutions=[seed_solution] if seed_solution else None,
+            seed_id_map={oid: idx for idx, oid in enumerate(original_ids_list)},
+        )
 
     # Vérification + affichage
     is_ok, msgs = verify_solution(best.routes, inst)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+parallel.py
+Évaluation parallèle des enfants du GA (split + 2-opt/VND + coût) dans un pool de processus:
+- chaque worker reçoit l'instance et les options d'évaluation une seule fois (initializer)
+- les permutations sont envoyées par paquets (un paquet par worker et par génération)
+- chaque enfant a sa propre graine dérivée d'une graine de génération tirée dans le rng du GA:
+  résultats déterministes pour une graine donnée (et indépendants du nombre de workers)
+- le tirage 2-opt/VND de chaque enfant est fait côté parent (même graine que le worker):
+  il sert à la recherche dans le cache (need_educated), est imposé au worker et marque l'entrée
+- si le GA a un cache d'évaluations, il est consulté côté parent: seules les permutations
+  inconnues partent vers les workers (mêmes entrées que evaluate_perm, perm réécrite comprise)
+
+Utilisé par ga.genetic_algorithm(workers=N) avec N > 1.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Sequence, Set, Tuple
+import multiprocessing as mp
+import random
+import signal
+
+from cvrp_data import CVRPInstance
+from ga import evaluate_perm
+from hashing import perm_hash
+
+
+# État propre à chaque processus worker (rempli par _init_worker)
+_WORKER_INST: CVRPInstance | None = None
+_WORKER_KWARGS: Dict[str, Any] = {}
+
+
+def _init_worker(inst: CVRPInstance, eval_kwargs: Dict[str, Any]) -> None:
+    """Initializer du pool: garde l'instance et les options, ignore Ctrl+C (géré par le parent)."""
+    global _WORKER_INST, _WORKER_KWARGS
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _WORKER_INST = inst
+    _WORKER_KWARGS = dict(eval_kwargs)
+    if "vnd_operators" in _WORKER_KWARGS:
+        _WORKER_KWARGS["vnd_stats"] = {name: 0 for name in _WORKER_KWARGS["vnd_operators"]}
+
+
+def _evaluate_chunk(
+    args: Tuple[List[List[int]], List[int], List[bool], bool],
+) -> Tuple[List[Tuple[List[int], List[List[int]], int]], List[int], Dict[str, int]]:
+    """
+    Évalue un paquet de permutations (une graine et une décision 2-opt/VND par permutation).
+    Retourne (perm, routes, cost) par enfant, les clients hors limite de temps
+    et les compteurs VND du paquet.
+    """
+    perms, seeds, educate, use_2opt = args
+    kw = _WORKER_KWARGS
+    stats = kw.get("vnd_stats")
+    if stats is not None:
+        for name in stats:
+            stats[name] = 0
+    viols: List[int] = []
+    out = []
+    for perm, s, edu in zip(perms, seeds, educate):
+        # proba 1/0: le tirage d'evaluate_perm (consommé quand même) reproduit la décision du parent
+        routes, cost = evaluate_perm(
+            perm, _WORKER_INST, random.Random(s), use_2opt, two_opt_prob=1.0 if edu else 0.0,
+            **kw,
+            time_violations=viols,
+        )
+        out.append((perm, routes, cost))
+    return out, viols, dict(stats) if stats is not None else {}
+
+
+class ParallelEvaluator:
+    """
+    Pool de processus qui évalue des lots de permutations.
+    eval_kwargs: mêmes options que evaluate_perm (le dict vnd_stats du parent est mis à jour ici).
+    """
+
+    def __init__(self, inst: CVRPInstance, workers: int, eval_kwargs: Dict[str, Any]):
+        self.workers = max(1, int(workers))
+        self.vnd_stats = eval_kwargs.get("vnd_stats")
+        self.eval_cache = eval_kwargs.get("eval_cache")
+        self.write_back = bool(eval_kwargs.get("write_back"))
+        worker_kwargs = {k: v for k, v in eval_kwargs.items() if k not in ("vnd_stats", "eval_cache", "timers")}
+        self._pool = mp.Pool(self.workers, initializer=_init_worker, initargs=(inst, worker_kwargs))
+
+    def evaluate(
+        self,
+        perms: Sequence[List[int]],
+        rng: random.Random,
+        use_2opt: bool,
+        two_opt_prob: float,
+        time_violations: Set[int] | None = None,
+    ) -> List[Tuple[List[int], List[List[int]], int]]:
+        """
+        Évalue perms en parallèle et retourne [(perm, routes, cost)] dans le même ordre.
+        Consomme exactement un tirage de rng (graine de base du lot).
+        """
+        if not perms:
+            return []
+        base = rng.getrandbits(63)
+        # Décision 2-opt/VND de chaque enfant: premier tirage de son rng (graine base + i), comme dans le worker
+        p = max(0.0, min(1.0, two_opt_prob))
+        educate = [use_2opt and random.Random(base + i).random() < p for i in range(len(perms))]
+        results: List[Tuple[List[int], List[List[int]], int] | None] = [None] * len(perms)
+        todo = list(range(len(perms)))
+        keys: List[int] = []
+        cache = self.eval_cache
+        if cache is not None:
+            todo = []
+            for i, perm in enumerate(perms):
+                k = perm_hash(perm)
+                keys.append(k)
+                hit = cache.get(k, need_educated=educate[i])
+                if hit is None:
+                    todo.append(i)
+                else:
+                    perm_out, routes, cost = hit
+                    if self.write_back and perm_out is not None:
+                        perm[:] = perm_out
+                    results[i] = (perm, routes, cost)
+        if not todo:
+            return results  # type: ignore[return-value]
+        size = -(-len(todo) // self.workers)
+        chunks = [
+            (
+                [perms[i] for i in todo[a:a + size]],
+                [base + i for i in todo[a:a + size]],
+                [educate[i] for i in todo[a:a + size]],
+                use_2opt,
+            )
+            for a in range(0, len(todo), size)
+        ]
+        done = iter(todo)
+        for out, viols, stats in self._pool.map(_evaluate_chunk, chunks):
+            for res in out:
+                i = next(done)
+                results[i] = res
+                if cache is not None:
+                    perm_out = res[0] if self.write_back else None
+                    cache.put(keys[i], perm_out, res[1], res[2], educate[i])
+                    if self.write_back:
+                        cache.put(perm_hash(perm_out), perm_out, res[1], res[2], educate[i])
+            if time_violations is not None:
+                time_violations.update(viols)
+            if self.vnd_stats is not None:
+                for name, v in stats.items():
+                    self.vnd_stats[name] = self.vnd_stats.get(name, 0) + v
+        return results  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
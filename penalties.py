@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+penalties.py
+Contraintes souples pour la recherche en deux sous-populations (schéma HGS):
+- les enfants sont splittés avec capacité et durée pénalisées (split_giant_tour_penalized):
+  une tournée surchargée ou trop longue est permise, son excès est facturé au coût
+- route_excess: surcharge totale (unités de demande) et dépassement de durée total (heures)
+- evaluate_perm_penalized: split pénalisé + éducation intra-route (2-opt / Held-Karp)
+- PenaltyManager: pénalités adaptées par fenêtres d'enfants pour viser une part cible
+  d'enfants faisables (x1.2 si trop peu, x0.85 si trop), séparément pour capacité et durée
+
+Utilisé par ga.genetic_algorithm(infeasible_search=True).
+"""
+
+from __future__ import annotations
+from time import perf_counter
+from typing import Any, Dict, List, Sequence, Tuple
+import random
+
+from cvrp_data import CVRPInstance
+from split import split_giant_tour_penalized
+from localsearch import educate_routes
+from solution import solution_total_cost, calculate_route_duration
+
+
+def route_excess(
+    routes: Sequence[Sequence[int]],
+    inst: CVRPInstance,
+    time_limit_hours: float = 0.0,
+    avg_speed_units_per_hour: float = 1.0,
+    unload_time_minutes: float = 0.0,
+) -> Tuple[int, float]:
+    """
+    (surcharge totale, dépassement de durée total en heures) des routes.
+    Une route d'un seul client n'est jamais en dépassement de durée (tolérée par le split).
+    """
+    C = inst.capacity
+    dem = inst.demands
+    excess_load = 0
+    excess_hours = 0.0
+    for r in routes:
+        load = sum(dem[c] for c in r)
+        if load > C:
+            excess_load += load - C
+        if time_limit_hours > 0.0 and len(r) > 1:
+            dur = calculate_route_duration(r, inst, avg_speed_units_per_hour, unload_time_minutes)
+            if dur > time_limit_hours:
+                excess_hours += dur - time_limit_hours
+    return excess_load, excess_hours
+
+
+class PenaltyManager:
+    """
+    Pénalités capacité (par unité de surcharge) et durée (par heure de dépassement), en unités de distance.
+    - record(excess_load, excess_hours) pour chaque enfant évalué
+    - adapt() en fin de génération: toutes les window évaluations, chaque pénalité est ajustée
+      selon la part d'enfants faisables pour sa contrainte; True si les coûts pénalisés ont changé
+    """
+
+    def __init__(
+        self,
+        inst: CVRPInstance,
+        target_feasible: float = 0.2,
+        time_limit_hours: float = 0.0,
+        avg_speed_units_per_hour: float = 1.0,
+        window: int = 100,
+    ):
+        depot = inst.depot_index
+        max_dist = 2 * max(inst.dist[depot])  # majorant du diamètre (inégalité triangulaire)
+        max_demand = max(1, max(inst.demands))
+        # Initialisation HGS: une unité de surcharge vaut à peu près un détour maximal par unité de demande
+        self.capacity = max(0.1, min(1000.0, max_dist / max_demand))
+        # Une heure de dépassement vaut la distance parcourue en une heure
+        self.duration = max(0.1, float(avg_speed_units_per_hour)) if time_limit_hours > 0.0 else 0.0
+        self.target = target_feasible
+        self.window = max(1, int(window))
+        self.feasible_ratio = 1.0
+        self._n = 0
+        self._load_ok = 0
+        self._time_ok = 0
+        self._ok = 0
+
+    def record(self, excess_load: int, excess_hours: float) -> None:
+        self._n += 1
+        self._load_ok += excess_load <= 0
+        self._time_ok += excess_hours <= 0.0
+        self._ok += excess_load <= 0 and excess_hours <= 0.0
+
+    def _adjust(self, pen: float, ok: int) -> float:
+        frac = ok / self._n
+        if frac < self.target - 0.05:
+            return min(100000.0, pen * 1.2)
+        if frac > self.target + 0.05:
+            return max(0.1, pen * 0.85)
+        return pen
+
+    def adapt(self) -> bool:
+        if self._n < self.window:
+            return False
+        old = (self.capacity, self.duration)
+        self.capacity = self._adjust(self.capacity, self._load_ok)
+        if self.duration > 0.0:
+            self.duration = self._adjust(self.duration, self._time_ok)
+        self.feasible_ratio = self._ok / self._n
+        self._n = self._load_ok = self._time_ok = self._ok = 0
+        return (self.capacity, self.duration) != old
+
+    def penalized_cost(self, dist_cost: int, excess_load: int, excess_hours: float) -> int:
+        return dist_cost + int(round(self.capacity * excess_load + self.duration * excess_hours))
+
+    def getstate(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "duration": self.duration,
+            "feasible_ratio": self.feasible_ratio,
+            "window": [self._n, self._load_ok, self._time_ok, self._ok],
+        }
+
+    def setstate(self, state: Dict[str, Any]) -> None:
+        self.capacity = float(state["capacity"])
+        self.duration = float(state["duration"])
+        self.feasible_ratio = float(state["feasible_ratio"])
+        self._n, self._load_ok, self._time_ok, self._ok = (int(v) for v in state["window"])
+
+
+def evaluate_perm_penalized(
+    perm: List[int],
+    inst: CVRPInstance,
+    rng: random.Random,
+    use_2opt: bool,
+    two_opt_prob: float,
+    penalties: PenaltyManager,
+    overload_limit: float = 1.5,
+    time_limit_hours: float = 0.0,
+    avg_speed_units_per_hour: float = 1.0,
+    unload_time_minutes: float = 0.0,
+    exact_route_max: int = 0,
+    write_back: bool = False,
+    timers: Any = None,
+    **_ignored: Any,
+) -> Tuple[List[List[int]], int, int, float]:
+    """
+    Comme ga.evaluate_perm (même tirage rng pour le 2-opt), avec le split pénalisé.
+    Retourne (routes, distance, surcharge, dépassement en heures).
+    L'éducation est intra-route seulement: les opérateurs VND inter-routes supposent des routes
+    faisables, et le cache d'évaluation dépend des pénalités courantes; les deux sont ignorés ici.
+    """
+    do_2opt = use_2opt and rng.random() < max(0.0, min(1.0, two_opt_prob))
+    t0 = perf_counter() if timers is not None else 0.0
+    routes = split_giant_tour_penalized(
+        perm, inst, penalties.capacity, penalties.duration,
+        overload_limit=overload_limit,
+        time_limit_hours=time_limit_hours,
+        avg_speed_units_per_hour=avg_speed_units_per_hour,
+        unload_time_minutes=unload_time_minutes,
+    )
+    if timers is not None:
+        timers.add("split", t0)
+        t0 = perf_counter()
+    if do_2opt or exact_route_max > 0:
+        routes = educate_routes(routes, inst, do_2opt, exact_route_max)
+        if timers is not None:
+            timers.add("2opt", t0)
+    if write_back:
+        perm[:] = [c for r in routes for c in r]
+    excess_load, excess_hours = route_excess(
+        routes, inst, time_limit_hours, avg_speed_units_per_hour, unload_time_minutes,
+    )
+    return routes, solution_total_cost(routes, inst), excess_load, excess_hours
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+population.py
+Reproduction par lots pour le GA (optionnel, nécessite numpy):
+- ArrayPopulation: permutations (matrice int32 P x n) + coûts, conservées d'une génération à l'autre
+  et alignées ligne à ligne sur la liste d'Individual (routes, rapport, checkpoints)
+- les enfants naissent en lignes de matrice; seule leur évaluation (split, éducation) passe par
+  des listes Python
+- remplacement des survivants sur les tableaux: les lignes retenues sont recopiées de matrice à
+  matrice; seuls les individus sans ligne (immigrants, enfants modifiés après le lot) sont reconvertis
+- sélection par tournoi vectorisée (indexation avancée numpy)
+- crossovers OX/PMX et mutations swap/inversion/insertion/scramble appliqués par lots
+  (noyaux compilés par Numba si disponible, sinon boucle Python sur les lignes)
+
+Utilisé par ga.genetic_algorithm(population_engine="array").
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import random
+
+from cvrp_data import CVRPInstance
+from ga import (
+    Individual,
+    route_based_crossover,
+    _ox_fill,
+    _pmx_fill,
+)
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except Exception:
+    _NUMPY_AVAILABLE = False
+
+# Codes de mutation (par ligne)
+MUT_NONE = 0
+MUT_INSERTION = 1
+MUT_SCRAMBLE = 2
+MUT_SWAP = 3
+MUT_INVERSION = 4
+
+# Même répartition que la cascade de seuils du GA "liste":
+# insertion 0.25, scramble 0.75*0.5, swap 0.375*0.75, inversion le reste
+_MUT_PROBS = (0.25, 0.375, 0.28125, 0.09375)
+
+
+# ======== Option accélérée via Numba (auto si dispo) ========
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+
+    _ox_fill_nb = njit(cache=True)(_ox_fill)
+    _pmx_fill_nb = njit(cache=True)(_pmx_fill)
+
+    @njit(cache=True)
+    def _batch_crossover_numba(perms, idx1, idx2, do_cx, cut_i, cut_j, use_pmx, out, buf):
+        """
+        Pour chaque paire t: enfants out[2t], out[2t+1] issus de perms[idx1[t]], perms[idx2[t]]
+        (OX/PMX si do_cx[t], sinon copies). buf: masque (OX) ou positions (PMX), taille N.
+        """
+        for t in range(idx1.shape[0]):
+            a = perms[idx1[t]]
+            b = perms[idx2[t]]
+            if do_cx[t]:
+                if use_pmx:
+                    _pmx_fill_nb(a, b, cut_i[t], cut_j[t], out[2 * t], buf)
+                    _pmx_fill_nb(b, a, cut_i[t], cut_j[t], out[2 * t + 1], buf)
+                else:
+                    _ox_fill_nb(a, b, cut_i[t], cut_j[t], out[2 * t], buf)
+                    _ox_fill_nb(b, a, cut_i[t], cut_j[t], out[2 * t + 1], buf)
+            else:
+                out[2 * t, :] = a
+                out[2 * t + 1, :] = b
+
+    @njit(cache=True)
+    def _batch_mutate_numba(rows, ops, pa, pb, seed):
+        """Applique in-place la mutation ops[r] aux lignes de rows (positions pa[r] != pb[r])."""
+        np.random.seed(seed)
+        n = rows.shape[1]
+        for r in range(rows.shape[0]):
+            op = ops[r]
+            if op == 0:
+                continue
+            a = pa[r]
+            b = pb[r]
+            row = rows[r]
+            if op == 1:
+                if n < 2:
+                    continue
+                tmp = row[a]
+                if a < b:
+                    for k in range(a, b):
+                        row[k] = row[k + 1]
+                else:
+                    for k in range(a, b, -1):
+                        row[k] = row[k - 1]
+                row[b] = tmp
+                continue
+            i = min(a, b)
+            j = max(a, b)
+            if op == 2:
+                if n < 4 or j - i <= 1:
+                    continue
+                for k in range(j - 1, i, -1):
+                    s = i + np.random.randint(0, k - i + 1)
+                    tmp = row[k]
+                    row[k] = row[s]
+                    row[s] = tmp
+            elif op == 3:
+                tmp = row[a]
+                row[a] = row[b]
+                row[b] = tmp
+            else:
+                if n < 3:
+                    continue
+                j -= 1
+                while i < j:
+                    tmp = row[i]
+                    row[i] = row[j]
+                    row[j] = tmp
+                    i += 1
+                    j -= 1
+
+    _NUMBA_AVAILABLE = True
+except Exception:
+    _NUMBA_AVAILABLE = False
+
+
+def _batch_crossover_python(perms, idx1, idx2, do_cx, cut_i, cut_j, use_pmx, out, buf) -> None:
+    """Fallback: même contrat que _batch_crossover_numba, boucle Python sur les paires."""
+    fill = _pmx_fill if use_pmx else _ox_fill
+    for t in range(len(idx1)):
+        a = perms[idx1[t]]
+        b = perms[idx2[t]]
+        if do_cx[t]:
+            fill(a, b, int(cut_i[t]), int(cut_j[t]), out[2 * t], buf)
+            fill(b, a, int(cut_i[t]), int(cut_j[t]), out[2 * t + 1], buf)
+        else:
+            out[2 * t, :] = a
+            out[2 * t + 1, :] = b
+
+
+def _batch_mutate_python(rows, ops, pa, pb, seed: int) -> None:
+    """Fallback: même contrat que _batch_mutate_numba, avec des tranches numpy par ligne."""
+    gen = np.random.default_rng(seed)
+    n = rows.shape[1]
+    for r in np.nonzero(ops)[0]:
+        op = ops[r]
+        a = int(pa[r])
+        b = int(pb[r])
+        row = rows[r]
+        i, j = min(a, b), max(a, b)
+        if op == MUT_INSERTION:
+            if n >= 2:
+                row[:] = np.insert(np.delete(row, a), b, row[a])
+        elif op == MUT_SCRAMBLE:
+            if n >= 4 and j - i > 1:
+                row[i:j] = gen.permutation(row[i:j])
+        elif op == MUT_SWAP:
+            row[a], row[b] = row[b], row[a]
+        elif n >= 3:
+            row[i:j] = row[i:j][::-1].copy()
+
+
+class ArrayPopulation:
+    """
+    Population sous forme de tableaux: perms (P x n, int32) et costs (P, int64), ligne i = pop[i].
+    Construite une fois par from_individuals (départ, ou après shake / restart / migration qui
+    modifient la liste), puis renouvelée à chaque génération par select.
+    """
+
+    def __init__(self, perms, costs):
+        self.perms = perms
+        self.costs = costs
+
+    @classmethod
+    def from_individuals(cls, pop: List[Individual]) -> "ArrayPopulation":
+        perms = np.array([ind.perm for ind in pop], dtype=np.int32)
+        costs = np.array([ind.cost for ind in pop], dtype=np.int64)
+        return cls(perms, costs)
+
+    def select(self, pop: List[Individual], rows: Dict[int, Tuple[Individual, int]], children) -> "ArrayPopulation":
+        """
+        Population suivante, alignée sur pop (survivants triés). rows: id(ind) -> (ind, ligne), ligne < P
+        dans self.perms, sinon dans children (ligne - P). Les individus absents de rows repartent de ind.perm.
+        """
+        P = self.perms.shape[0]
+        perms = np.empty((len(pop), self.perms.shape[1]), dtype=np.int32)
+        for i, ind in enumerate(pop):
+            entry = rows.get(id(ind))
+            if entry is None or entry[0] is not ind:
+                perms[i] = ind.perm
+            elif entry[1] < P:
+                perms[i] = self.perms[entry[1]]
+            else:
+                perms[i] = children[entry[1] - P]
+        costs = np.array([ind.cost for ind in pop], dtype=np.int64)
+        return ArrayPopulation(perms, costs)
+
+    def tournament(self, n_select: int, k: int, gen) -> "np.ndarray":
+        """
+        n_select tournois de taille k en une fois: matrice de candidats tirés au hasard
+        (avec remise), gagnant = argmin des coûts par ligne.
+        """
+        size = self.costs.shape[0]
+        cand = gen.integers(0, size, size=(n_select, max(1, k)))
+        best = np.argmin(self.costs[cand], axis=1)
+        return cand[np.arange(n_select), best]
+
+
+def breed_offspring(
+    arr: ArrayPopulation,
+    pop: List[Individual],
+    n_children: int,
+    tournament_k: int,
+    pc: float,
+    pm: float,
+    crossover: str,
+    rng: random.Random,
+    inst: CVRPInstance,
+) -> "np.ndarray":
+    """
+    Produit n_children permutations enfants en lot (matrice n_children x n, int32) depuis arr:
+    tournoi vectorisé, crossover par paires (OX/PMX compilés; RBX par paire côté Python, sur les
+    routes de pop alignée sur arr), puis mutations par lot.
+    Le générateur numpy est dérivé de rng: résultat déterministe pour une graine donnée.
+    """
+    if not _NUMPY_AVAILABLE:
+        raise ImportError(
+            "Le moteur de population 'array' nécessite numpy. Installe-le avec: pip install numpy"
+        )
+    if n_children <= 0:
+        return np.empty((0, arr.perms.shape[1]), dtype=np.int32)
+    gen = np.random.default_rng(rng.getrandbits(64))
+    n_pairs = (n_children + 1) // 2
+    n = arr.perms.shape[1]
+
+    parents = arr.tournament(2 * n_pairs, tournament_k, gen)
+    idx1 = parents[:n_pairs]
+    idx2 = parents[n_pairs:]
+    do_cx = gen.random(n_pairs) < pc
+    out = np.empty((2 * n_pairs, n), dtype=np.int32)
+
+    if crossover == "rbx":
+        for t in range(n_pairs):
+            if do_cx[t]:
+                c1, c2 = route_based_crossover(pop[idx1[t]], pop[idx2[t]], rng, inst)
+                out[2 * t, :] = c1
+                out[2 * t + 1, :] = c2
+            else:
+                out[2 * t, :] = arr.perms[idx1[t]]
+                out[2 * t + 1, :] = arr.perms[idx2[t]]
+    elif n >= 2:
+        ca = gen.integers(0, n, n_pairs)
+        cb = gen.integers(0, n - 1, n_pairs)
+        cb = cb + (cb >= ca)  # deux points distincts, comme rng.sample(range(n), 2)
+        cut_i = np.minimum(ca, cb)
+        cut_j = np.maximum(ca, cb)
+        use_pmx = crossover == "pmx"
+        size = int(arr.perms.max()) + 1
+        buf = np.full(size, -1, dtype=np.int32) if use_pmx else np.zeros(size, dtype=np.int32)
+        kernel = _batch_crossover_numba if _NUMBA_AVAILABLE else _batch_crossover_python
+        kernel(arr.perms, idx1, idx2, do_cx, cut_i, cut_j, use_pmx, out, buf)
+    else:
+        out[0::2] = arr.perms[idx1]
+        out[1::2] = arr.perms[idx2]
+
+    rows = out[:n_children]
+    if n >= 2:
+        ops = np.where(
+            gen.random(n_children) < pm,
+            gen.choice(np.array([MUT_INSERTION, MUT_SCRAMBLE, MUT_SWAP, MUT_INVERSION]), size=n_children, p=_MUT_PROBS),
+            MUT_NONE,
+        ).astype(np.int64)
+        pa = gen.integers(0, n, n_children)
+        pb = gen.integers(0, n - 1, n_children)
+        pb = pb + (pb >= pa)  # pb != pa
+        seed = int(gen.integers(0, 2**31 - 1))
+        if _NUMBA_AVAILABLE:
+            _batch_mutate_numba(rows, ops, pa, pb, seed)
+        else:
+            _batch_mutate_python(rows, ops, pa, pb, seed)
+    return rows
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+profiling.py
+Chronométrage par phase du GA (genetic_algorithm(profile_phases=True)):
+- PhaseTimers cumule secondes (perf_counter) et nombre d'appels par nom de phase
+- désactivé, le GA ne crée pas d'objet: chaque point de mesure se réduit à un test `is not None`
+- les phases d'evaluate_perm (split, 2opt, vnd, cache) sont imbriquées dans celles du GA
+  (init, evaluate, dedupe, immigrants, ...): leurs temps ne s'additionnent pas
+"""
+
+from __future__ import annotations
+from time import perf_counter
+from typing import Dict
+
+
+class PhaseTimers:
+    """Secondes et appels cumulés par phase. Usage: t0 = perf_counter(); ...; timers.add("split", t0)."""
+
+    __slots__ = ("sec", "calls")
+
+    def __init__(self):
+        self.sec: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def add(self, name: str, t0: float, calls: int = 1) -> None:
+        """Ajoute perf_counter() - t0 à la phase name."""
+        self.sec[name] = self.sec.get(name, 0.0) + (perf_counter() - t0)
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """{phase: {sec, calls, avg_ms}}, phases triées par temps décroissant."""
+        out: Dict[str, Dict[str, float]] = {}
+        for name in sorted(self.sec, key=self.sec.get, reverse=True):
+            n = self.calls.get(name, 0)
+            out[name] = {
+                "sec": self.sec[name],
+                "calls": n,
+                "avg_ms": 1000.0 * self.sec[name] / n if n else 0.0,
+            }
+        return out
+
+    def summary(self, top: int = 8) -> str:
+        """Ligne compacte 'phase=1.23s/456' des top phases les plus coûteuses."""
+        items = sorted(self.sec.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        return " | ".join(f"{name}={sec:.2f}s/{self.calls.get(name, 0)}" for name, sec in items)
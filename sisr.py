@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+sisr.py
+Recherche à grand voisinage "ruin & recreate" SISR (Slack Induction by String Removals,
+Christiaens & Vanden Berghe) pour le CVRP avec contraintes de temps:
+- Ruin: retrait de chaînes (strings) de clients adjacents dans plusieurs routes voisines
+  (autour d'un client graine), en mode string ou split-string
+- Recreate: réinsertion gloutonne au meilleur endroit avec "blinks" (positions sautées au hasard)
+- Acceptation par recuit simulé (température décroissante avec le temps écoulé)
+
+Même interface de résultat que ga.genetic_algorithm:
+- retourne le meilleur Individual (perm = concaténation des routes)
+- (best, metrics) si return_metrics=True
+"""
+
+from __future__ import annotations
+from typing import Dict, List
+import math
+import os
+import random
+import time
+
+from cvrp_data import CVRPInstance
+from ga import Individual, nearest_neighbor_perm
+from split import split_giant_tour
+from localsearch import two_opt_route, route_cost_with_depot, customer_neighbors
+from solution import solution_total_cost
+
+
+class _Solution:
+    """Routes avec charges, longueurs et coût total (mis à jour incrémentalement)."""
+
+    def __init__(self, routes: List[List[int]], inst: CVRPInstance):
+        self.inst = inst
+        self.routes = [r[:] for r in routes if r]
+        self.loads = [sum(inst.demands[c] for c in r) for r in self.routes]
+        self.lengths = [route_cost_with_depot(r, inst) for r in self.routes]
+        self.cost = sum(self.lengths)
+
+    def copy(self) -> "_Solution":
+        other = _Solution.__new__(_Solution)
+        other.inst = self.inst
+        other.routes = [r[:] for r in self.routes]
+        other.loads = self.loads[:]
+        other.lengths = self.lengths[:]
+        other.cost = self.cost
+        return other
+
+    def route_of(self) -> Dict[int, int]:
+        return {c: k for k, r in enumerate(self.routes) for c in r}
+
+    def refresh(self, k: int) -> None:
+        r = self.routes[k]
+        old = self.lengths[k]
+        self.loads[k] = sum(self.inst.demands[c] for c in r)
+        self.lengths[k] = route_cost_with_depot(r, self.inst)
+        self.cost += self.lengths[k] - old
+
+    def drop_empty(self) -> None:
+        keep = [k for k, r in enumerate(self.routes) if r]
+        if len(keep) != len(self.routes):
+            self.routes = [self.routes[k] for k in keep]
+            self.loads = [self.loads[k] for k in keep]
+            self.lengths = [self.lengths[k] for k in keep]
+
+
+def _ruin(
+    sol: _Solution,
+    neighbors: List[List[int]],
+    rng: random.Random,
+    avg_removed: float,
+    max_string_len: int,
+    split_rate: float,
+    split_depth: float,
+) -> List[int]:
+    """
+    Retire des chaînes de clients adjacents dans des routes proches d'un client graine.
+    Retourne la liste des clients retirés (les routes vidées sont supprimées).
+    """
+    routes = sol.routes
+    n_clients = sum(len(r) for r in routes)
+    if n_clients == 0:
+        return []
+    avg_card = n_clients / max(1, len(routes))
+    ls_max = min(float(max_string_len), avg_card)
+    ks_max = 4.0 * avg_removed / (1.0 + ls_max) - 1.0
+    k_s = int(rng.uniform(1.0, ks_max + 1.0))
+
+    route_of = sol.route_of()
+    seed = rng.choice([c for r in routes for c in r])
+    removed: List[int] = []
+    ruined: set = set()
+
+    for c in [seed] + neighbors[seed]:
+        if len(ruined) >= k_s:
+            break
+        k = route_of.get(c)
+        if k is None or k in ruined:
+            continue
+        r = routes[k]
+        l_max = min(len(r), ls_max)
+        l = int(rng.uniform(1.0, l_max + 1.0))
+        pos = r.index(c)
+        if l < len(r) and rng.random() < split_rate:
+            # split-string: chaîne de l+m clients dont m consécutifs sont conservés
+            m_max = len(r) - l
+            m = 1
+            while m < m_max and rng.random() > split_depth:
+                m += 1
+            span = l + m
+            start = rng.randint(max(0, pos - span + 1), min(pos, len(r) - span))
+            keep_start = start + rng.randint(0, l)
+            window = range(start, start + span)
+            idx_out = [i for i in window if not (keep_start <= i < keep_start + m)]
+        else:
+            start = rng.randint(max(0, pos - l + 1), min(pos, len(r) - l))
+            idx_out = list(range(start, start + l))
+        out = set(idx_out)
+        removed.extend(r[i] for i in idx_out)
+        routes[k] = [x for i, x in enumerate(r) if i not in out]
+        for x in removed[-len(idx_out):]:
+            route_of.pop(x, None)
+        sol.refresh(k)
+        ruined.add(k)
+
+    sol.drop_empty()
+    return removed
+
+
+def _recreate(
+    sol: _Solution,
+    removed: List[int],
+    rng: random.Random,
+    blink_rate: float,
+    time_limit_hours: float,
+    avg_speed_units_per_hour: float,
+    unload_time_minutes: float,
+) -> None:
+    """
+    Réinsère les clients retirés (ordre: aléatoire / demande décroissante / loin du dépôt / proche),
+    chacun à sa meilleure position faisable, en sautant chaque position avec probabilité blink_rate.
+    """
+    inst = sol.inst
+    d = inst.dist
+    dem = inst.demands
+    depot = inst.depot_index
+    cap = inst.capacity
+    speed = avg_speed_units_per_hour if avg_speed_units_per_hour > 0.0 else 1.0
+    unload_h = unload_time_minutes / 60.0
+
+    mode = rng.choices(("random", "demand", "far", "close"), weights=(4, 4, 2, 1))[0]
+    if mode == "random":
+        rng.shuffle(removed)
+    elif mode == "demand":
+        removed.sort(key=lambda c: -dem[c])
+    elif mode == "far":
+        removed.sort(key=lambda c: -d[depot][c])
+    else:
+        removed.sort(key=lambda c: d[depot][c])
+
+    for c in removed:
+        best_add = None
+        best_k = -1
+        best_j = 0
+        for k, r in enumerate(sol.routes):
+            if sol.loads[k] + dem[c] > cap:
+                continue
+            prev = depot
+            for j in range(len(r) + 1):
+                nxt = depot if j == len(r) else r[j]
+                if rng.random() >= blink_rate:
+                    add = d[prev][c] + d[c][nxt] - d[prev][nxt]
+                    if best_add is None or add < best_add:
+                        if time_limit_hours <= 0.0 or (
+                            (sol.lengths[k] + add) / speed + (len(r) + 1) * unload_h <= time_limit_hours
+                        ):
+                            best_add = add
+                            best_k = k
+                            best_j = j
+                prev = nxt
+        if best_add is None:
+            # aucune route compatible: nouvelle route dédiée
+            sol.routes.append([c])
+            sol.loads.append(dem[c])
+            sol.lengths.append(d[depot][c] + d[c][depot])
+            sol.cost += sol.lengths[-1]
+        else:
+            sol.routes[best_k].insert(best_j, c)
+            sol.loads[best_k] += dem[c]
+            sol.lengths[best_k] += best_add
+            sol.cost += best_add
+
+
+def sisr_solve(
+    inst: CVRPInstance,
+    seed: int | None = 1,
+    iterations: int = 10**9,
+    time_limit_sec: float = 60.0,
+    verbose: bool = True,
+    log_interval: int = 10000,
+    target_optimum: int | None = None,
+    stop_on_file: str | None = None,
+    return_metrics: bool = False,
+    avg_removed: float = 10.0,
+    max_string_len: int = 10,
+    split_rate: float = 0.5,
+    split_depth: float = 0.01,
+    blink_rate: float = 0.01,
+    t_start: float = 100.0,
+    t_end: float = 1.0,
+    neighbor_k: int = 100,
+    # Contraintes de temps (mêmes conventions que le GA)
+    time_limit_hours: float = 0.0,
+    avg_speed_units_per_hour: float = 1.0,
+    unload_time_minutes: float = 0.0,
+):
+    """
+    SISR: ruin & recreate + recuit simulé.
+    - Solution initiale: nearest-neighbor + split + 2-opt
+    - Température: t_start -> t_end (géométrique sur time_limit_sec, ou sur iterations sans limite de temps)
+    Retourne le meilleur Individual, ou (best, metrics) si return_metrics=True.
+    """
+    rng = random.Random(seed)
+
+    def fmt_gap(cost: int) -> str:
+        if target_optimum is None or target_optimum <= 0:
+            return ""
+        gap = 100.0 * (cost - target_optimum) / target_optimum
+        return f" | gap={gap:.2f}% (opt={target_optimum})"
+
+    start_time = time.time()
+    neighbors = customer_neighbors(inst, max(1, int(neighbor_k)))
+
+    perm = nearest_neighbor_perm(inst, rng)
+    routes, _ = split_giant_tour(
+        perm, inst,
+        time_limit_hours=time_limit_hours,
+        avg_speed_units_per_hour=avg_speed_units_per_hour,
+        unload_time_minutes=unload_time_minutes,
+    )
+    routes = [two_opt_route(r, inst) if len(r) >= 4 else r for r in routes]
+    current = _Solution(routes, inst)
+    best = current.copy()
+
+    if verbose:
+        print(f"[SISR] Départ: cost={current.cost} | #routes={len(current.routes)}{fmt_gap(current.cost)}", flush=True)
+
+    stopped_by = None
+    it = 0
+    accepted = 0
+    temp = t_start
+    try:
+        for it in range(1, iterations + 1):
+            elapsed = time.time() - start_time
+            if time_limit_sec and elapsed >= time_limit_sec:
+                stopped_by = "time"
+                if verbose:
+                    print(f"[SISR] Time limit atteinte ({time_limit_sec:.1f}s). Arrêt à l'itération {it-1}.", flush=True)
+                break
+            if stop_on_file and it % 100 == 0 and os.path.exists(stop_on_file):
+                stopped_by = "file"
+                if verbose:
+                    print(f"[SISR] Fichier sentinelle détecté ({stop_on_file}). Arrêt propre à l'itération {it-1}.", flush=True)
+                break
+
+            progress = elapsed / time_limit_sec if time_limit_sec else it / max(1, iterations)
+            temp = t_start * (t_end / t_start) ** min(1.0, progress)
+
+            cand = current.copy()
+            removed = _ruin(cand, neighbors, rng, avg_removed, max_string_len, split_rate, split_depth)
+            _recreate(
+                cand, removed, rng, blink_rate,
+                time_limit_hours, avg_speed_units_per_hour, unload_time_minutes,
+            )
+
+            if cand.cost < current.cost - temp * math.log(1.0 - rng.random()):
+                current = cand
+                accepted += 1
+                if current.cost < best.cost:
+                    best = current.copy()
+
+            if verbose and it % max(1, log_interval) == 0:
+                print(
+                    f"[SISR] It {it} | best={best.cost} | current={current.cost} | #routes_best={len(best.routes)}"
+                    f"{fmt_gap(best.cost)} | T={temp:.2f} | t+{time.time() - start_time:.1f}s",
+                    flush=True,
+                )
+    except KeyboardInterrupt:
+        stopped_by = "keyboard"
+        if verbose:
+            print(f"[SISR] Arrêt par utilisateur (Ctrl+C) après {time.time() - start_time:.1f}s à l'itération {it-1}.", flush=True)
+
+    best_routes = [r[:] for r in best.routes]
+    best_cost = solution_total_cost(best_routes, inst)
+    result = Individual(perm=[c for r in best_routes for c in r], routes=best_routes, cost=best_cost)
+
+    if verbose:
+        total_elapsed = time.time() - start_time
+        print(f"[SISR] Terminé après {total_elapsed:.1f}s. Meilleur coût trouvé: {best_cost} | #routes={len(best_routes)}", flush=True)
+
+    if not return_metrics:
+        return result
+
+    metrics: Dict[str, object] = {
+        "elapsed_sec": time.time() - start_time,
+        "generations_done": it,
+        "stopped_by": stopped_by,
+        "best_cost": best_cost,
+        "avg_cost_last": float(current.cost),
+        "routes_best": len(best_routes),
+        "pm_eff_last": None,
+        "two_opt_prob_eff_last": None,
+        "accepted": accepted,
+        "temperature_last": float(temp),
+    }
+    return result, metrics
@@ -6,7 +6,7 @@ Outils autour des solutions VRP:
 - calcul de la durée d'une tournée (avec vitesse et temps de déchargement)
 - vérification des contraintes
 - texte lisible (proche CVRPLIB)
-- lecture d'un .sol texte et calcul du coût
+- lecture d'un .sol texte (routes et coût)
 """
 
 from __future__ import annotations
@@ -154,18 +154,18 @@ def write_solution_text(
         f.write("\n".join(lines))
 
 
-def read_simple_sol_and_cost(
+def read_simple_sol_routes(
     sol_path: str,
     inst: CVRPInstance,
     assume_includes_depot: bool = False,
     index_from_original_id: Optional[dict] = None,
-) -> int:
+    skip_unknown: bool = False,
+) -> List[List[int]]:
     """
-    Lit un fichier .sol texte simple contenant des lignes "Route #i: <ids>" et une ligne "Cost <val>" optionnelle.
-    Calcule le coût avec la métrique de l'instance 'inst'.
-    - if index_from_original_id est fourni, on mappe les IDs du .sol vers les indices internes.
+    Lit les lignes "Route #i: <ids>" d'un fichier .sol texte et retourne les routes en indices internes.
+    - index_from_original_id: si fourni, on mappe les IDs du .sol vers les indices internes.
     - assume_includes_depot: si True, les numéros incluent le dépôt au début/fin de chaque route.
-    Retourne le coût total selon la matrice de distance de l'instance.
+    - skip_unknown: ignore les IDs absents du mapping (clients retirés depuis) au lieu de lever ValueError.
     """
     routes: List[List[int]] = []
     with open(sol_path, "r", encoding="utf-8", errors="ignore") as f:
@@ -189,6 +189,8 @@ def read_simple_sol_and_cost(
                         continue
                     if index_from_original_id:
                         if nid not in index_from_original_id:
+                            if skip_unknown:
+                                continue
                             raise ValueError(f"ID {nid} absent du mapping original -> index interne")
                         idx = index_from_original_id[nid]
                     else:
@@ -202,5 +204,21 @@ def read_simple_sol_and_cost(
                     if seq and seq[-1] == dep:
                         seq = seq[:-1]
                 routes.append(seq)
+    return routes
+
 
+def read_simple_sol_and_cost(
+    sol_path: str,
+    inst: CVRPInstance,
+    assume_includes_depot: bool = False,
+    index_from_original_id: Optional[dict] = None,
+) -> int:
+    """
+    Lit un fichier .sol texte simple contenant des lignes "Route #i: <ids>" et une ligne "Cost <val>" optionnelle.
+    Calcule le coût avec la métrique de l'instance 'inst'.
+    - if index_from_original_id est fourni, on mappe les IDs du .sol vers les indices internes.
+    - assume_includes_depot: si True, les numéros incluent le dépôt au début/fin de chaque route.
+    Retourne le coût total selon la matrice de distance de l'instance.
+    """
+    routes = read_simple_sol_routes(sol_path, inst, assume_includes_depot, index_from_original_id)
     return solution_total_cost(routes, inst)
\ No newline at end of file
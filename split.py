@@ -12,6 +12,10 @@ Nouvelles fonctionnalités:
 - Calcul du temps de trajet (distance / vitesse) + temps de déchargement par client
 - Notification si un client seul dépasse la limite de temps
 
+Split pénalisé (split_giant_tour_penalized, sous-population infaisable du GA):
+- tournées autorisées au-delà de la capacité (jusqu'à overload_limit x capacité) et de la durée
+- coût d'une tournée = distance + pénalité capacité x surcharge + pénalité durée x dépassement (heures)
+
 Accélération:
 - Si Numba est disponible, on JIT-compile le coeur DP pour accélérer fortement le split.
 - Sinon, on utilise le fallback Python inchangé.
@@ -111,6 +115,60 @@ try:
 
         return pred, cost[n], violations
 
+    @njit(cache=True)
+    def _split_dp_numba_penalized(
+        perm: np.ndarray,           # int64 [n]
+        dist: np.ndarray,           # int64 [N, N]
+        demands: np.ndarray,        # int64 [N]
+        depot: int,
+        capacity: int,
+        max_load: float,            # charge max d'une tournée (overload_limit x capacité)
+        penalty_capacity: float,    # coût par unité de surcharge
+        time_limit_sec: float,      # 0 = pas de limite
+        max_time_sec: float,        # durée max d'une tournée (overload_limit x limite)
+        penalty_duration_sec: float,  # coût par seconde de dépassement
+        avg_speed: float,           # unités de distance par seconde
+        unload_time_sec: float,
+    ):
+        """DP du split pénalisé; retourne pred (reconstruction côté Python) et le coût final."""
+        n = perm.shape[0]
+        INF = 1e300
+        cost = np.empty(n + 1, dtype=np.float64)
+        pred = np.empty(n + 1, dtype=np.int64)
+        for i in range(n + 1):
+            cost[i] = INF
+            pred[i] = -1
+        cost[0] = 0.0
+        use_time_limit = time_limit_sec > 0.0
+
+        for i in range(n):
+            load = 0
+            seg_dist = 0
+            last = depot
+            for j in range(i, n):
+                node = perm[j]
+                load += demands[node]
+                if j > i and load > max_load:
+                    break
+                seg_dist += dist[last, node]
+                last = node
+                route_dist = seg_dist + dist[node, depot]
+                total = cost[i] + route_dist
+                if load > capacity:
+                    total += penalty_capacity * (load - capacity)
+                if use_time_limit and j > i:
+                    # un client seul trop loin reste toléré (comme dans le split faisable)
+                    t = route_dist / avg_speed + unload_time_sec * (j - i + 1)
+                    if t > max_time_sec:
+                        break
+                    if t > time_limit_sec:
+                        total += penalty_duration_sec * (t - time_limit_sec)
+                if total < cost[j + 1]:
+                    cost[j + 1] = total
+                    pred[j + 1] = i
+
+        return pred, cost[n]
+
     _NUMBA_AVAILABLE = True
 except Exception:
     _NUMBA_AVAILABLE = False
@@ -268,4 +326,96 @@ def split_giant_tour(
         routes.append(route)
         t = i
     routes.reverse()
-    return routes, violations_list
\ No newline at end of file
+    return routes, violations_list
+
+
+def split_giant_tour_penalized(
+    perm: List[int],
+    inst: CVRPInstance,
+    penalty_capacity: float,
+    penalty_duration: float = 0.0,      # coût par heure de dépassement de time_limit_hours
+    overload_limit: float = 1.5,        # charge/durée max d'une tournée en multiple de la limite
+    time_limit_hours: float = 0.0,
+    avg_speed_units_per_hour: float = 1.0,
+    unload_time_minutes: float = 0.0,
+) -> List[List[int]]:
+    """
+    Split DP où capacité et durée sont des contraintes souples:
+    - une tournée peut porter jusqu'à overload_limit x capacité et durer jusqu'à
+      overload_limit x time_limit_hours
+    - son coût est distance + penalty_capacity x surcharge + penalty_duration x dépassement (h)
+    - un client seul hors limite de temps n'est pas pénalisé (toléré comme dans split_giant_tour)
+    Toujours réalisable (chaque client peut former sa propre tournée). Retourne les routes.
+    """
+    time_limit_sec = time_limit_hours * 3600.0 if time_limit_hours > 0.0 else 0.0
+    avg_speed = avg_speed_units_per_hour / 3600.0 if avg_speed_units_per_hour > 0.0 else 1.0
+    unload_time_sec = unload_time_minutes * 60.0
+    limit = max(1.0, float(overload_limit))
+    max_load = limit * inst.capacity
+    max_time_sec = limit * time_limit_sec
+    penalty_duration_sec = penalty_duration / 3600.0
+    n = len(perm)
+
+    if _NUMBA_AVAILABLE:
+        _ensure_np_arrays(inst)
+        import numpy as _np
+        pred, _last = _split_dp_numba_penalized(
+            _np.asarray(perm, dtype=_np.int64),
+            inst._dist_np,     # type: ignore[attr-defined]
+            inst._demands_np,  # type: ignore[attr-defined]
+            int(inst.depot_index),
+            int(inst.capacity),
+            float(max_load),
+            float(penalty_capacity),
+            float(time_limit_sec),
+            float(max_time_sec),
+            float(penalty_duration_sec),
+            float(avg_speed),
+            float(unload_time_sec),
+        )
+    else:
+        INF = float("inf")
+        cost = [INF] * (n + 1)
+        pred = [-1] * (n + 1)
+        cost[0] = 0.0
+        C = inst.capacity
+        depot = inst.depot_index
+        d = inst.dist
+        dem = inst.demands
+        use_time_limit = time_limit_sec > 0.0
+        for i in range(n):
+            load = 0
+            seg_dist = 0
+            last = depot
+            base = cost[i]
+            for j in range(i, n):
+                node = perm[j]
+                load += dem[node]
+                if j > i and load > max_load:
+                    break
+                seg_dist += d[last][node]
+                last = node
+                route_dist = seg_dist + d[node][depot]
+                total = base + route_dist
+                if load > C:
+                    total += penalty_capacity * (load - C)
+                if use_time_limit and j > i:
+                    t = route_dist / avg_speed + unload_time_sec * (j - i + 1)
+                    if t > max_time_sec:
+                        break
+                    if t > time_limit_sec:
+                        total += penalty_duration_sec * (t - time_limit_sec)
+                if total < cost[j + 1]:
+                    cost[j + 1] = total
+                    pred[j + 1] = i
+
+    routes: List[List[int]] = []
+    t = n
+    while t > 0:
+        i = int(pred[t])
+        if i == -1:
+            raise RuntimeError("Échec reconstruction split pénalisé (pred manquant)")
+        routes.append(perm[i:t])
+        t = i
+    routes.reverse()
+    return routes
@@ -6,6 +6,8 @@ Banc d'essai pour fine-tuner l'algo génétique CVRP.
 - On fixe l'instance + la valeur optimale (cible) pour calculer un gap.
 - On lance des essais limités en temps (par défaut 60s) pour chaque valeur.
 - On sélectionne la valeur qui donne le meilleur gap moyen (ou meilleur gap).
+- Chaque essai enregistre sa trace de convergence: on rapporte aussi l'aire sous la courbe
+  (gap moyen au cours du temps, ou coût moyen sans cible) et le temps pour atteindre cible + ttt-gap %.
 
 Exemples:
   - Instance locale:
@@ -18,6 +20,9 @@ Exemples:
 Options utiles:
   --fixed "pc=0.6,tournament_k=3,init_mode=nn_plus_random"
   --save-csv results.csv
+  --ttt-gap 2.0            (time-to-target: temps pour atteindre un gap <= 2%)
+  --save-traces traces/    (une trace JSONL par essai)
+  --check-cache            (vérifie d'abord la cohérence du cache d'évaluation, puis lance les essais)
 """
 
 from __future__ import annotations
@@ -25,11 +30,14 @@ import argparse
 import csv
 import inspect
 import math
+import os
+import random
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from cvrp_data import load_cvrp_instance, load_cvrp_from_vrplib, CVRPInstance
-from ga import genetic_algorithm
+from ga import genetic_algorithm, evaluate_perm
+from hashing import EvalCache
 from solution import verify_solution, solution_total_cost
 
 
@@ -56,6 +64,36 @@ _PARAM_TYPES: Dict[str, Type] = {
     "stagnation_restart_gens": int,
     "adaptive_mutation": bool,
     "return_metrics": bool,
+    "exact_route_max": int,
+    "vnd_operators": str,
+    "vnd_max_moves": int,
+    "vnd_time_budget_sec": float,
+    "lamarckian": bool,
+    "tour_ls_k": int,
+    "crossover": str,
+    "population_engine": str,
+    "workers": int,
+    "dedupe_capacity": int,
+    "dedupe_max_age": int,
+    "eval_cache_size": int,
+    "mode": str,
+    "steady_replace": str,
+    "survivor_selection": str,
+    "biased_n_elite": int,
+    "biased_n_close": int,
+    "adaptive_operators": str,
+    "checkpoint_path": str,
+    "checkpoint_interval": int,
+    "resume_from": str,
+    "seed_solutions": str,
+    "profile_phases": bool,
+    "record_trace": bool,
+    "trace_path": str,
+    "infeasible_search": bool,
+    "target_feasible": float,
+    "repair_prob": float,
+    "infeasible_pop_size": int,
+    "overload_limit": float,
 }
 
 
@@ -153,6 +191,31 @@ def _ensure_param_supported(param: str) -> None:
         raise ValueError(f"Paramètre '{param}' inconnu. Autorisés: {', '.join(allowed)}")
 
 
+def check_eval_cache(inst: CVRPInstance, samples: int = 5, seed: int = 1) -> None:
+    """
+    Vérification préalable du cache d'évaluation: une entrée non éduquée ne doit pas servir une
+    demande avec 2-opt, et un succès avec need_educated doit rendre le coût d'une évaluation 2-opt
+    directe (avec et sans Held-Karp). RuntimeError sinon.
+    """
+    rng = random.Random(seed)
+    base = [i for i in range(inst.dimension) if i != inst.depot_index]
+    for exact in (0, 3):
+        cache = EvalCache(4 * samples)
+        for _ in range(samples):
+            perm = base[:]
+            rng.shuffle(perm)
+            evaluate_perm(perm, inst, random.Random(0), True, 0.0, exact_route_max=exact, eval_cache=cache)
+            _, fresh = evaluate_perm(perm, inst, random.Random(0), True, 1.0, exact_route_max=exact)
+            for _attempt in ("miss", "hit"):
+                _, cached = evaluate_perm(perm, inst, random.Random(0), True, 1.0, exact_route_max=exact, eval_cache=cache)
+                if cached != fresh:
+                    raise RuntimeError(
+                        f"Cache d'évaluation incohérent (exact_route_max={exact}, {_attempt}): {cached} != {fresh} (2-opt direct)"
+                    )
+        if cache.hits != samples:
+            raise RuntimeError(f"Cache d'évaluation: {cache.hits} succès au lieu de {samples}")
+
+
 def run_trial(
     inst: CVRPInstance,
     param_name: str,
@@ -161,10 +224,13 @@ def run_trial(
     time_sec: float,
     seed: int,
     target: Optional[int],
+    ttt_gap: float = 1.0,
+    trace_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Lance un essai du GA avec une contrainte de temps.
-    Retourne dict avec: cost, gap, elapsed_sec, generations_done, routes, value
+    Retourne dict avec: cost, gap, elapsed_sec, generations_done, routes, value,
+    auc (gap moyen au cours du temps, ou coût moyen sans cible), ttt (secondes jusqu'à gap <= ttt_gap, ou None)
     """
     kwargs = dict(base_kwargs)
     kwargs[param_name] = param_value
@@ -179,6 +245,8 @@ def run_trial(
         verbose=False,
         log_interval=9999999,  # pas de logs
         return_metrics=True,   # nécessite la petite modif dans ga.py
+        record_trace=True,
+        trace_path=trace_path,
         **kwargs,
     )
     # genetic_algorithm retourne (best, metrics) si return_metrics=True
@@ -188,6 +256,14 @@ def run_trial(
     if target is not None and target > 0:
         gap = 100.0 * (total - target) / target
 
+    # Courbe anytime: moyenne sur [premier point, fin du budget] et time-to-target
+    trace = metrics["convergence"]
+    t0 = trace.column("elapsed_sec")[0] if len(trace) else 0.0
+    t_end = max(float(time_sec), metrics.get("elapsed_sec") or 0.0)
+    ref = target if target is not None and target > 0 else None
+    auc = trace.auc(t_end=t_end, target=ref) / max(1e-9, t_end - t0)
+    ttt = trace.time_to_target(target * (1.0 + ttt_gap / 100.0)) if ref else None
+
     return {
         "value": param_value,
         "cost": total,
@@ -196,6 +272,8 @@ def run_trial(
         "generations_done": metrics.get("generations_done"),
         "routes": len(best.routes),
         "stopped_by": metrics.get("stopped_by"),
+        "auc": auc,
+        "ttt": ttt,
     }
 
 
@@ -213,7 +291,10 @@ def main():
     parser.add_argument("--seed", type=int, default=1, help="Seed de base; chaque répétition utilise seed+rep")
     parser.add_argument("--fixed", type=str, default=None, help="Autres paramètres fixes 'k=v,k2=v2' (ex: 'pc=0.6,tournament_k=3')")
     parser.add_argument("--save-csv", type=str, default=None, help="Chemin CSV pour sauvegarder les résultats")
+    parser.add_argument("--ttt-gap", type=float, default=1.0, help="Time-to-target: gap (%%) à atteindre au-dessus de la cible (défaut: 1.0)")
+    parser.add_argument("--save-traces", type=str, default=None, help="Dossier où écrire la trace de convergence (JSONL) de chaque essai")
     parser.add_argument("--warmup-sec", type=float, default=0.0, help="Warmup en secondes (pour compiler Numba si dispo). 0 pour désactiver.")
+    parser.add_argument("--check-cache", action="store_true", help="Vérification préalable du cache d'évaluation (quelques évaluations, arrêt si incohérent)")
 
     args = parser.parse_args()
 
@@ -245,6 +326,10 @@ def main():
     if target is None or target <= 0:
         print("[Warn] Pas de cible optimale fournie. Le 'gap' ne sera pas calculé.")
 
+    if args.check_cache:
+        check_eval_cache(inst)
+        print("[Check] Cache d'évaluation cohérent.")
+
     # Warmup (utile si split numba doit compiler)
     if args.warmup_sec and args.warmup_sec > 0:
         try:
@@ -282,6 +367,9 @@ def main():
     if target:
         print(f"[Tuning] Cible (optimal): {target}")
 
+    if args.save_traces:
+        os.makedirs(args.save_traces, exist_ok=True)
+
     results: List[Dict[str, Any]] = []
     for v in values:
         costs: List[int] = []
@@ -289,9 +377,14 @@ def main():
         times: List[float] = []
         gens: List[int] = []
         routes_counts: List[int] = []
+        aucs: List[float] = []
+        ttts: List[float] = []
 
         for rep in range(args.repeats):
             seed = args.seed + rep
+            trace_path = None
+            if args.save_traces:
+                trace_path = os.path.join(args.save_traces, f"{args.param}={v}_rep{rep + 1}.jsonl")
             res = run_trial(
                 inst=inst,
                 param_name=args.param,
@@ -300,6 +393,8 @@ def main():
                 time_sec=args.time_sec,
                 seed=seed,
                 target=target,
+                ttt_gap=args.ttt_gap,
+                trace_path=trace_path,
             )
             costs.append(res["cost"])
             if res["gap"] is not None:
@@ -307,8 +402,12 @@ def main():
             times.append(res["elapsed_sec"] or float("nan"))
             gens.append(res["generations_done"] or 0)
             routes_counts.append(res["routes"])
+            aucs.append(res["auc"])
+            if res["ttt"] is not None:
+                ttts.append(res["ttt"])
 
-            print(f"  - {args.param}={v} | rep {rep+1}/{args.repeats} | cost={res['cost']} | gap={res['gap'] if res['gap'] is not None else 'n/a'} | t={res['elapsed_sec']:.1f}s | gens={res['generations_done']}")
+            ttt_txt = f"{res['ttt']:.1f}s" if res["ttt"] is not None else "n/a"
+            print(f"  - {args.param}={v} | rep {rep+1}/{args.repeats} | cost={res['cost']} | gap={res['gap'] if res['gap'] is not None else 'n/a'} | t={res['elapsed_sec']:.1f}s | gens={res['generations_done']} | auc={res['auc']:.2f} | ttt={ttt_txt}")
 
         # Agrégation
         best_cost = min(costs)
@@ -318,6 +417,8 @@ def main():
         avg_time = sum(t for t in times if not math.isnan(t)) / max(1, sum(0 if math.isnan(t) else 1 for t in times))
         avg_gens = sum(gens) / len(gens)
         avg_routes = sum(routes_counts) / len(routes_counts)
+        avg_auc = sum(aucs) / len(aucs)
+        avg_ttt = (sum(ttts) / len(ttts) if ttts else None)
 
         results.append({
             "value": v,
@@ -328,6 +429,9 @@ def main():
             "avg_time_sec": avg_time,
             "avg_generations": avg_gens,
             "avg_routes": avg_routes,
+            "avg_auc": avg_auc,
+            "avg_ttt": avg_ttt,
+            "ttt_hits": len(ttts),
         })
 
     # Choix du gagnant
@@ -341,7 +445,8 @@ def main():
     best = results[0]
     print("\n=== Résumé ===")
     for r in results:
-        print(f"{args.param}={r['value']} | avg_cost={r['avg_cost']:.1f} | best_cost={r['best_cost']} | avg_gap={r['avg_gap'] if r['avg_gap'] is not None else 'n/a'} | best_gap={r['best_gap'] if r['best_gap'] is not None else 'n/a'} | avg_time={r['avg_time_sec']:.1f}s | avg_gens={r['avg_generations']:.0f}")
+        ttt_txt = f"{r['avg_ttt']:.1f}s ({r['ttt_hits']}/{args.repeats})" if r["avg_ttt"] is not None else "n/a"
+        print(f"{args.param}={r['value']} | avg_cost={r['avg_cost']:.1f} | best_cost={r['best_cost']} | avg_gap={r['avg_gap'] if r['avg_gap'] is not None else 'n/a'} | best_gap={r['best_gap'] if r['best_gap'] is not None else 'n/a'} | avg_time={r['avg_time_sec']:.1f}s | avg_gens={r['avg_generations']:.0f} | auc={r['avg_auc']:.2f} | ttt={ttt_txt}")
 
     print("\n=== Meilleure valeur ===")
     print(f"{args.param}={best['value']} | avg_cost={best['avg_cost']:.1f} | avg_gap={best['avg_gap'] if best['avg_gap'] is not None else 'n/a'}")
@@ -350,9 +455,9 @@ def main():
     if args.save_csv:
         with open(args.save_csv, "w", newline="", encoding="utf-8") as f:
             w = csv.writer(f)
-            w.writerow(["param", "value", "avg_cost", "best_cost", "avg_gap", "best_gap", "avg_time_sec", "avg_generations", "avg_routes"])
+            w.writerow(["param", "value", "avg_cost", "best_cost", "avg_gap", "best_gap", "avg_time_sec", "avg_generations", "avg_routes", "avg_auc", "avg_ttt", "ttt_hits"])
             for r in results:
-                w.writerow([args.param, r["value"], r["avg_cost"], r["best_cost"], r["avg_gap"], r["best_gap"], r["avg_time_sec"], r["avg_generations"], r["avg_routes"]])
+                w.writerow([args.param, r["value"], r["avg_cost"], r["best_cost"], r["avg_gap"], r["best_gap"], r["avg_time_sec"], r["avg_generations"], r["avg_routes"], r["avg_auc"], r["avg_ttt"], r["ttt_hits"]])
         print(f"[Save] Résultats écrits: {args.save_csv}")
 
 